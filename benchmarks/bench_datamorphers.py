@@ -0,0 +1,208 @@
+"""
+Benchmarks every built-in DataMorpher, and the README `pipeline_food`
+end-to-end, on synthetic data across backends and data sizes.
+
+Each benchmark is timed over several repetitions on a fresh copy of the
+input, and its peak memory is traced with `tracemalloc` (Python and NumPy
+allocations). Results are written to a JSON file, to be compared across
+versions of the package.
+
+Usage:
+    python benchmarks/bench_datamorphers.py
+    python benchmarks/bench_datamorphers.py --sizes 1000 100000 \\
+        --backends pandas polars --output bench_results.json
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from datamorphers.pipeline_loader import compile_pipeline, get_pipeline_config
+from datamorphers.storage import dms
+
+YAML_PATH = os.path.join(os.path.dirname(__file__), "benchmarks.yaml")
+
+BACKENDS = ["pandas", "polars", "pyarrow"]
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+ITEMS = ["Apple", "TV", "banana", "PASTA", "Cake", "laptop", "Bread", "phone"]
+ITEM_TYPES = ["food", "electronics", "clothing", "toys"]
+
+# DataMorphers that only accept pandas DataFrames
+PANDAS_ONLY = {"FlatMultiIndex"}
+
+
+def generate_data(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generates a synthetic DataFrame with the columns of `pipeline_food`."""
+    rng = np.random.default_rng(seed)
+    discount_pct = rng.uniform(0, 0.5, n_rows)
+    discount_pct[rng.random(n_rows) < 0.2] = np.nan
+    return pd.DataFrame(
+        {
+            "item": rng.choice(ITEMS, n_rows),
+            "item_type": rng.choice(ITEM_TYPES, n_rows),
+            "price": rng.uniform(1, 1000, n_rows).round(2),
+            "discount_pct": discount_pct,
+            "quantity": rng.integers(1, 100, n_rows),
+        }
+    )
+
+
+def to_backend(df: pd.DataFrame, backend: str):
+    """Converts a pandas DataFrame to the given backend."""
+    if backend == "pandas":
+        return df.copy()
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_pandas(df)
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def available_backends(backends: list[str]) -> list[str]:
+    """Returns the backends that are installed."""
+    available = []
+    for backend in backends:
+        try:
+            importlib.import_module(backend)
+        except ImportError:
+            print(f"Skipping backend '{backend}': not installed.", file=sys.stderr)
+            continue
+        available.append(backend)
+    return available
+
+
+def run_benchmark(pipeline, make_input, n_rows: int, repeat: int) -> dict:
+    """Times the pipeline and traces its peak memory."""
+    timings = []
+    for _ in range(repeat):
+        df = make_input()
+        start = time.perf_counter()
+        pipeline(df)
+        timings.append(time.perf_counter() - start)
+
+    df = make_input()
+    tracemalloc.start()
+    pipeline(df)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "seconds_min": best,
+        "seconds_median": statistics.median(timings),
+        "rows_per_second": n_rows / best if best > 0 else None,
+        "peak_bytes": peak,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", nargs="+", default=BACKENDS)
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        default=None,
+        help="Names of the pipelines in benchmarks.yaml (default: all).",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    # Only report errors, as the benchmarks run many short pipelines
+    logging.getLogger("datamorphers").setLevel(logging.ERROR)
+
+    with open(YAML_PATH) as f:
+        names = args.benchmarks or list(yaml.safe_load(f))
+
+    results = []
+    for n_rows in args.sizes:
+        data = generate_data(n_rows)
+        for backend in available_backends(args.backends):
+            # Lookup table joined by MergeDataFrames
+            dms.set(
+                "item_types",
+                to_backend(
+                    pd.DataFrame(
+                        {
+                            "item_type": ITEM_TYPES,
+                            "vat_pct": [0.04, 0.22, 0.22, 0.1],
+                        }
+                    ),
+                    backend,
+                ),
+            )
+            for name in names:
+                if name in PANDAS_ONLY and backend != "pandas":
+                    continue
+                result = {"benchmark": name, "backend": backend, "rows": n_rows}
+
+                def make_input():
+                    df = to_backend(data, backend)
+                    if name == "FlatMultiIndex":
+                        df.columns = pd.MultiIndex.from_tuples(
+                            [(c, "value") for c in df.columns]
+                        )
+                    return df
+
+                try:
+                    pipeline = compile_pipeline(
+                        get_pipeline_config(YAML_PATH, pipeline_name=name)
+                    )
+                    result.update(
+                        run_benchmark(pipeline, make_input, n_rows, args.repeat)
+                    )
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"
+                results.append(result)
+                print(
+                    f"{name:>16} {backend:>8} {n_rows:>10} rows: "
+                    + (
+                        f"{result['seconds_min']:.4f}s, "
+                        f"{result['peak_bytes'] / 2**20:.1f} MiB peak"
+                        if "error" not in result
+                        else result["error"]
+                    )
+                )
+
+    versions = {}
+    for package in ["datamorphers", "narwhals", "pandas", "polars", "pyarrow"]:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "versions": versions,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Results written to {args.output}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
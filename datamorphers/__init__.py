@@ -39,8 +39,17 @@ def load_custom_datamorphers():
     return custom_datamorphers
 
 
+def __getattr__(name: str):
+    """
+    Loads the custom DataMorphers on first access, so that importing the
+    package does not import them, nor their dependencies.
+    """
+    if name == "custom_datamorphers":
+        global custom_datamorphers
+        custom_datamorphers = load_custom_datamorphers()
+        return custom_datamorphers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Initialize logger
 logger = initialize_logger()
-
-# Load custom DataMorphers if available
-custom_datamorphers = load_custom_datamorphers()
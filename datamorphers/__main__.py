@@ -0,0 +1,3 @@
+from datamorphers.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterable, Iterable
+
+from narwhals.typing import IntoFrame
+
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import run_pipeline
+
+__all__ = ["arun_pipeline", "arun_pipelines"]
+
+Job = tuple[IntoFrame, dict | Pipeline]
+
+
+async def arun_pipeline(
+    df: IntoFrame,
+    config: dict | Pipeline,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> IntoFrame:
+    """
+    Runs the pipeline on the DataFrame without blocking the event loop.
+
+    The pipeline runs in `executor`, or in the default executor of the event
+    loop (a thread pool). In a thread pool, the run sees the `dms.scope`
+    opened by the calling task. In a process pool, the DataFrame and the
+    pipeline are pickled, and the run only sees the storage of the worker.
+
+    Args:
+        df (nw.IntoFrame): The input DataFrame to be transformed.
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        executor (Executor, optional): The thread or process pool running the
+            pipeline.
+        kwargs: Additional arguments of `run_pipeline`, e.g. `lazy=True`.
+            With a compiled Pipeline, only `lazy` and `cache` are supported.
+
+    Returns:
+        nw.IntoFrame: The transformed DataFrame.
+
+    Example Usage:
+        >>> df = await arun_pipeline(df, config)
+    """
+    loop = asyncio.get_running_loop()
+    func = functools.partial(_run, df, config, **kwargs)
+    if not isinstance(executor, ProcessPoolExecutor):
+        # Threads run in a copy of the context of the calling task
+        func = functools.partial(contextvars.copy_context().run, func)
+    return await loop.run_in_executor(executor, func)
+
+
+async def arun_pipelines(
+    jobs: Iterable[Job] | AsyncIterable[Job],
+    executor: Executor | None = None,
+    max_concurrency: int | None = None,
+    **kwargs: Any,
+) -> list[IntoFrame]:
+    """
+    Runs many pipelines concurrently, with at most `max_concurrency` runs in
+    flight.
+
+    Jobs are pulled from `jobs` only when a run slot is free, so an async
+    source (e.g. frames received over the network) is not consumed faster
+    than the pipelines can process it. If a run fails, the runs in flight
+    are cancelled and the exception is raised.
+
+    Args:
+        jobs (Iterable | AsyncIterable): The (DataFrame, config) pairs to run.
+            The config may be a compiled Pipeline, shared by many jobs.
+        executor (Executor, optional): The thread or process pool running the
+            pipelines. Defaults to the default executor of the event loop.
+        max_concurrency (int, optional): The maximum number of runs in flight.
+            Defaults to the number of CPUs.
+        kwargs: Additional arguments of `run_pipeline`.
+
+    Returns:
+        list[nw.IntoFrame]: The transformed DataFrames, in the order of `jobs`.
+
+    Example Usage:
+        >>> pipeline = compile_pipeline(config)
+        >>> with ThreadPoolExecutor(max_workers=8) as executor:
+        ...     results = await arun_pipelines(
+        ...         ((df, pipeline) for df in frames), executor=executor
+        ...     )
+    """
+    max_concurrency = max_concurrency or os.cpu_count() or 1
+    results: dict[int, IntoFrame] = {}
+    pending: dict[asyncio.Future, int] = {}
+
+    async def _wait(return_when: str) -> None:
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for future in done:
+            results[pending.pop(future)] = future.result()
+
+    try:
+        i = 0
+        async for df, config in _aiter(jobs):
+            if len(pending) >= max_concurrency:
+                await _wait(asyncio.FIRST_COMPLETED)
+            future = asyncio.ensure_future(
+                arun_pipeline(df, config, executor=executor, **kwargs)
+            )
+            pending[future] = i
+            i += 1
+
+        while pending:
+            await _wait(asyncio.FIRST_EXCEPTION)
+    finally:
+        for future in pending:
+            future.cancel()
+
+    return [results[i] for i in range(len(results))]
+
+
+def _run(df: IntoFrame, config: dict | Pipeline, **kwargs: Any) -> IntoFrame:
+    """Runs a pipeline, compiled or not."""
+    if isinstance(config, Pipeline):
+        return config(df, **kwargs)
+    return run_pipeline(df, config, **kwargs)
+
+
+async def _aiter(jobs: Iterable[Job] | AsyncIterable[Job]) -> AsyncIterable[Job]:
+    """Iterates over a sync or async iterable."""
+    if isinstance(jobs, AsyncIterable):
+        async for job in jobs:
+            yield job
+    else:
+        for job in jobs:
+            yield job
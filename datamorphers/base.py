@@ -1,14 +1,30 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
 
+import narwhals as nw
 from narwhals.typing import FrameT
 
 from pydantic import BaseModel
 
+# Whether the DataMorphers being built come from a configuration frozen by
+# `freeze_pipeline_config`, so that their configuration is not validated again
+_trusted: ContextVar[bool] = ContextVar("datamorphers_trusted", default=False)
+
 
 class DataMorpher(ABC):
     class PyDanticValidator(BaseModel):
         """Pydantic validator for DataMorpher classes."""
 
+    # Whether `_datamorph` can be applied to a LazyFrame without collecting it.
+    # Custom DataMorphers are assumed to need an eager DataFrame.
+    lazy_compatible: bool = False
+
+    # Whether each output row only depends on the corresponding input row, so
+    # that the DataFrame can be split into chunks transformed independently.
+    row_local: bool = False
+
     def __init__(self):
         pass
 
@@ -20,11 +36,114 @@ class DataMorpher(ABC):
                 f"{cls.__name__} must define its own `PyDanticValidator` class."
             )
 
+    def _validate_config(self, **values: Any) -> BaseModel:
+        """
+        Returns the configuration of the DataMorpher, validated by its
+        PyDanticValidator. When building a trusted pipeline, the values were
+        validated beforehand and are used as they are.
+        """
+        if _trusted.get():
+            return self.PyDanticValidator.model_construct(**values)
+        return self.PyDanticValidator(**values)
+
     @abstractmethod
     def _datamorph(self, df: FrameT) -> FrameT:
         """Applies a transformation on the DataFrame."""
         pass
 
+    def _column_exprs(self) -> dict[str, nw.Expr] | None:
+        """
+        Returns the expressions of a transformation that only adds or replaces
+        columns through `with_columns`, keyed by output column name.
+        Returns None if the transformation cannot be expressed this way.
+        """
+        return None
+
+    def _columns_read(self) -> set[str] | None:
+        """Returns the columns read by the transformation, or None if unknown."""
+        return None
+
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        """
+        Given the columns needed after the transformation, returns the columns
+        needed before it. None stands for all the columns.
+        """
+        exprs, read = self._column_exprs(), self._columns_read()
+        if needed is None or exprs is None or read is None:
+            return None
+        return (needed - exprs.keys()) | read
+
+    def _partitioned(self, by: str) -> "DataMorpher | None":
+        """
+        Returns a DataMorpher transforming each partition of rows sharing the
+        same value of column `by` as if it was a separate DataFrame, and
+        keeping column `by`. Returns None if the transformation cannot be
+        applied this way.
+        """
+        return self if self.row_local else None
+
+    def _cache_token(self) -> str | None:
+        """
+        Returns a string identifying the transformation, used to key its
+        output in a StepCache. Returns None if its output cannot be cached.
+        """
+        config = getattr(self, "config", None)
+        if not isinstance(config, BaseModel):
+            return None
+        cls = type(self)
+        try:
+            return f"{cls.__module__}.{cls.__qualname__}:{config.model_dump_json()}"
+        except ValueError:
+            # The configuration holds values that cannot be serialized
+            return None
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema | None:
+        """
+        Given the schema of the DataFrame before the transformation, returns
+        the schema after it, without touching any data.
+        Raises a DataMorpherError if the transformation cannot be applied to
+        a DataFrame with this schema. Returns None if the schema is unknown.
+        """
+        return None
+
+    def _check_columns(self, schema: nw.Schema, columns: list[str]) -> None:
+        """Raises a DataMorpherError if any of the columns is not in the schema."""
+        missing = [col for col in columns if col not in schema]
+        if missing:
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Column(s) {missing} not found. "
+                f"Available columns are: {list(schema)}"
+            )
+
+    def _check_dtype(
+        self,
+        schema: nw.Schema,
+        column: str,
+        is_valid: Callable[[nw.dtypes.DType], bool],
+        expected: str,
+    ) -> None:
+        """
+        Raises a DataMorpherError if the column is missing, or if its type is
+        known and `is_valid` returns False for it.
+        """
+        self._check_columns(schema, [column])
+        dtype = schema[column]
+        if dtype != nw.Unknown and not is_valid(dtype):
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Column '{column}' has type {dtype}, "
+                f"expected {expected}."
+            )
+
+
+@contextmanager
+def _trusted_construction() -> Iterator[None]:
+    """Skips the validation of the DataMorphers built in this context."""
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
 
 class DataMorpherError(Exception):
     """Base class for all DataMorpher errors."""
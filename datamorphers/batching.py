@@ -0,0 +1,139 @@
+from typing import Iterable
+
+import narwhals as nw
+from narwhals.dependencies import get_pandas, is_pandas_dataframe
+from narwhals.typing import IntoFrame
+
+from datamorphers import logger
+from datamorphers.pipeline import Pipeline
+
+__all__ = ["run_pipeline_batched"]
+
+# The column holding the position of the DataFrame each row comes from
+BATCH_COLUMN = "__datamorphers_batch"
+
+
+def run_pipeline_batched(
+    frames: Iterable[IntoFrame], pipeline: Pipeline
+) -> list[IntoFrame]:
+    """
+    Runs the pipeline once over many DataFrames, instead of once per
+    DataFrame.
+
+    The DataFrames are tagged with their position in a batch column,
+    concatenated, transformed at once, and the result is split back along
+    the batch column. Steps that need the whole dataset (e.g. NormalizeColumn,
+    Rolling, DropDuplicates) are applied to each partition of rows sharing
+    the same batch id, so that every DataFrame is transformed as if it was
+    run on its own. This amortizes the fixed cost of each step over all the
+    DataFrames, which dominates for small DataFrames.
+
+    The DataFrames are run one by one instead if they do not share the same
+    backend and schema, or if a step cannot be applied per partition
+    (e.g. outer joins, or custom DataMorphers that are not row-local).
+
+    On pandas, types depending on the values of the DataFrame (e.g. integer
+    columns upcast to float when they contain nulls) follow the values of
+    all the DataFrames together.
+
+    Args:
+        frames (Iterable[nw.IntoFrame]): The input DataFrames.
+        pipeline (Pipeline): The compiled pipeline.
+
+    Returns:
+        list[nw.IntoFrame]: The transformed DataFrames, in the input order.
+    """
+    frames = list(frames)
+    if len(frames) <= 1:
+        return [pipeline(df) for df in frames]
+
+    batched = _partitioned_pipeline(pipeline)
+    inputs = [nw.from_native(df, eager_only=True) for df in frames]
+    if batched is None or not _can_concat(inputs):
+        return [pipeline(df) for df in frames]
+
+    # NumPy is imported when first needed, as it is slow to import
+    import numpy as np
+
+    # Tag the rows once the DataFrames are concatenated, rather than each one
+    lengths = [len(frame) for frame in inputs]
+    batch_ids = np.repeat(np.arange(len(inputs)), lengths)
+    concatenated = nw.concat(inputs).with_columns(
+        nw.new_series(
+            BATCH_COLUMN,
+            batch_ids,
+            nw.Int64,
+            backend=nw.get_native_namespace(inputs[0]),
+        )
+    )
+    logger.debug(
+        f"Running pipeline '{pipeline.name}' once on {len(inputs)} DataFrames "
+        f"of {len(concatenated)} rows in total."
+    )
+
+    result = nw.from_native(batched(nw.to_native(concatenated)), eager_only=True)
+    if BATCH_COLUMN not in result.columns:
+        logger.warning(
+            f"Pipeline '{pipeline.name}' dropped the batch column. "
+            "Running it on each DataFrame instead."
+        )
+        return [pipeline(df) for df in frames]
+
+    return _split(result, len(inputs))
+
+
+def _partitioned_pipeline(pipeline: Pipeline) -> Pipeline | None:
+    """
+    Returns a copy of the pipeline applying each step per partition of the
+    batch column, or None if a step cannot be applied this way.
+    """
+    steps = []
+    for cls, datamorpher in pipeline.steps:
+        partitioned = datamorpher._partitioned(BATCH_COLUMN)
+        if partitioned is None:
+            logger.debug(
+                f"Step {cls} of pipeline '{pipeline.name}' cannot be applied "
+                "per partition. Running the pipeline on each DataFrame."
+            )
+            return None
+        steps.append((cls, partitioned))
+    return Pipeline(name=pipeline.name, steps=steps, fuse=pipeline.fuse)
+
+
+def _can_concat(frames: list[nw.DataFrame]) -> bool:
+    """Whether the DataFrames share the same backend and schema."""
+    first = frames[0]
+    if BATCH_COLUMN in first.columns:
+        return False
+    backend, schema = nw.get_native_namespace(first), first.schema
+    return all(
+        nw.get_native_namespace(frame) is backend and frame.schema == schema
+        for frame in frames[1:]
+    )
+
+
+def _split(result: nw.DataFrame, n_frames: int) -> list[IntoFrame]:
+    """Splits the result along the batch column into `n_frames` DataFrames."""
+    import numpy as np
+
+    batch_ids = result[BATCH_COLUMN].to_numpy()
+    result = result.drop(BATCH_COLUMN)
+    if np.any(batch_ids[1:] < batch_ids[:-1]):
+        # Steps keep the rows of each DataFrame in order, but not necessarily
+        # the DataFrames themselves.
+        order = np.argsort(batch_ids, kind="stable")
+        result, batch_ids = result[order], batch_ids[order]
+
+    bounds = np.searchsorted(batch_ids, np.arange(n_frames + 1))
+    frames = [
+        result[start:stop].to_native() for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+    # A range index means that a step reset the index, which it would also
+    # have done on each DataFrame. Pandas is already imported, as it produced
+    # the DataFrames.
+    if is_pandas_dataframe(frames[0]) and isinstance(
+        result.to_native().index, get_pandas().RangeIndex
+    ):
+        frames = [frame.reset_index(drop=True) for frame in frames]
+    return frames
@@ -0,0 +1,201 @@
+import glob
+import hashlib
+import os
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+from narwhals.dependencies import get_pandas, get_pyarrow, is_pandas_dataframe
+from narwhals.typing import IntoFrame
+
+from datamorphers import logger
+
+# PyArrow is imported when first needed, as it is slow to import
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+__all__ = ["StepCache", "fingerprint"]
+
+
+class StepCache:
+    """
+    A content-addressed, size-bounded cache of step outputs, stored on the
+    local disk as Arrow IPC files.
+
+    Each entry is keyed by a hash of the input DataFrame fingerprint and of
+    the class and validated configuration of every step applied so far.
+    When a pipeline runs with a cache, the longest prefix of steps whose
+    output is cached is skipped, and only the remaining steps are computed.
+    Once the cache exceeds `max_bytes`, the least recently used entries are
+    removed.
+
+    Since keys depend on the configuration of the DataMorphers and not on
+    their code, clear the cache after changing the implementation of a
+    custom DataMorpher.
+
+    Attributes:
+        directory (str): The directory where the entries are stored.
+        max_bytes (int): The maximum total size of the entries.
+        hits (int): The number of entries read from the cache.
+        misses (int): The number of entries looked up but not found.
+
+    Example Usage:
+        >>> cache = StepCache(".datamorphers_cache", max_bytes=10 * 2**30)
+        >>> df = run_pipeline(df, config, cache=cache)
+        >>> # Only the steps after the first edited one are computed again
+        >>> df = run_pipeline(df, edited_config, cache=cache)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2**30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def get(self, key: str) -> "pa.Table | None":
+        """Returns the table stored under `key`, or None if there is none."""
+        path = self._path(key)
+        try:
+            table = _read_ipc(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        # Mark the entry as recently used
+        os.utime(path)
+        self.hits += 1
+        return table
+
+    def put(self, key: str, table: "pa.Table") -> None:
+        """Stores the table under `key`, evicting the least recently used entries."""
+        _write_ipc(table, self._path(key))
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        for path in self._entries():
+            os.remove(path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def _entries(self) -> list[str]:
+        return glob.glob(os.path.join(self.directory, "*.arrow"))
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the size limit is met."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.debug(f"Evicted {path} from the step cache.")
+
+
+def fingerprint(df: IntoFrame) -> str:
+    """
+    Returns a hash of the schema and content of a DataFrame.
+
+    The DataFrame is converted to a PyArrow Table, and its buffers are hashed
+    in place. PyArrow Tables and Polars DataFrames are usually converted
+    without copying their data, whereas pandas DataFrames are converted, and
+    thus copied, column by column.
+    """
+    table = _to_table(df)
+    digest = hashlib.sha256(table.schema.serialize())
+    for column in table.columns:
+        for chunk in column.chunks:
+            # Sliced arrays share the buffers of the original array
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+            for buffer in chunk.buffers():
+                size = -1 if buffer is None else buffer.size
+                digest.update(size.to_bytes(8, "little", signed=True))
+                if buffer is not None:
+                    digest.update(buffer)
+    return digest.hexdigest()
+
+
+def _chain_key(previous_key: str, tokens: list[str]) -> str:
+    """Returns the key of a step output, given the key of its input."""
+    digest = hashlib.sha256(previous_key.encode())
+    for token in tokens:
+        digest.update(b"\0" + token.encode())
+    return digest.hexdigest()
+
+
+def _write_ipc(table: "pa.Table", path: str) -> None:
+    """Writes the table to an Arrow IPC file, atomically."""
+    import pyarrow as pa
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    # Readers never see a partially written file
+    os.replace(tmp_path, path)
+
+
+def _read_ipc(path: str) -> "pa.Table":
+    """Reads an Arrow IPC file, memory-mapped so that no data is copied."""
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _to_table(df: IntoFrame) -> "pa.Table":
+    """Converts a native DataFrame to a PyArrow Table."""
+    import pyarrow as pa
+
+    if isinstance(df, pa.Table):
+        return df
+    if is_pandas_dataframe(df):
+        # The index is stored too, so that it is restored when reading back
+        return pa.Table.from_pandas(df)
+    return nw.from_native(df, eager_only=True).to_arrow()
+
+
+def _from_table(
+    table: "pa.Table", backend: ModuleType, zero_copy: bool = False
+) -> IntoFrame:
+    """
+    Converts a PyArrow Table to a native DataFrame of the given backend.
+
+    With `zero_copy`, each column of a pandas DataFrame is kept in its own
+    block, so that numeric columns without nulls are read-only views of the
+    Arrow buffers instead of being consolidated into new arrays.
+    """
+    # The backend module is already imported, as it produced the DataFrame
+    if backend is get_pyarrow():
+        return table
+    if backend is get_pandas():
+        return table.to_pandas(split_blocks=zero_copy)
+    return nw.from_arrow(table, backend=backend).to_native()
+
+
+def _native_namespace(df: IntoFrame) -> ModuleType:
+    """Returns the module of the backend of a native DataFrame, e.g. pandas."""
+    return nw.get_native_namespace(nw.from_native(df, eager_only=True))
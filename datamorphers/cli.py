@@ -0,0 +1,246 @@
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from datamorphers import logger
+from datamorphers.base import DataMorpherError
+from datamorphers.pipeline_loader import get_pipeline_config
+
+if TYPE_CHECKING:
+    from datamorphers.dataset import FileReport
+    from datamorphers.pipeline import Pipeline
+
+__all__ = ["main"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the `datamorphers` command line.
+
+    Example Usage:
+        $ datamorphers run config.yaml --pipeline pipeline_food \\
+            --input in.parquet --output out.parquet --param threshold=10
+
+    Returns:
+        int: The exit status: 0 on success, 1 if the pipeline failed.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    logging.getLogger("datamorphers").setLevel(
+        logging.DEBUG if args.debug else logging.INFO
+    )
+    try:
+        return args.command(args)
+    except (DataMorpherError, OSError, ValueError) as e:
+        print(f"datamorphers: error: {e}", file=sys.stderr)
+        return 1
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="datamorphers",
+        description="Run DataMorphers pipelines defined in YAML files.",
+    )
+    subparsers = parser.add_subparsers(required=True, metavar="command")
+
+    run = subparsers.add_parser(
+        "run",
+        help="Run a pipeline on a file or a dataset of files.",
+        description=(
+            "Read, transform and write a Parquet, CSV or Arrow IPC file, or "
+            "every such file of a directory or glob pattern. Only the columns "
+            "needed by the pipeline are read, and the rows discarded by its "
+            "leading FilterRows steps are skipped while reading."
+        ),
+    )
+    run.add_argument("config", help="The YAML file defining the pipeline.")
+    run.add_argument(
+        "--pipeline", required=True, help="The name of the pipeline to run."
+    )
+    run.add_argument(
+        "--input",
+        required=True,
+        help="The input file, or a directory or glob pattern of input files.",
+    )
+    run.add_argument(
+        "--output",
+        required=True,
+        help=(
+            "The output file, or the output directory if the input is a "
+            "dataset. The extension of a file sets its format."
+        ),
+    )
+    run.add_argument(
+        "--backend",
+        default="pandas",
+        help="The backend transforming the data, e.g. pandas, polars or pyarrow.",
+    )
+    run.add_argument(
+        "--workers",
+        type=_positive_int,
+        help=(
+            "The number of worker processes. A dataset is processed one file "
+            "per worker. A single file is split into row partitions if the "
+            "pipeline only has row-local steps, unless it is streamed with "
+            "--chunk-size, which runs in a single process."
+        ),
+    )
+    run.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        metavar="ROWS",
+        help=(
+            "Stream a single file in chunks of at most ROWS rows, if the "
+            "pipeline can be run chunk by chunk."
+        ),
+    )
+    run.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        type=_parse_param,
+        metavar="KEY=VALUE",
+        help="Replace ${KEY} with VALUE in the YAML file. Can be repeated.",
+    )
+    run.add_argument(
+        "--debug", action="store_true", help="Log additional debugging messages."
+    )
+    run.set_defaults(command=_run)
+
+    return parser
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def _parse_param(value: str) -> tuple[str, str]:
+    key, sep, param = value.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got '{value}'")
+    return key, param
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Runs the `run` command."""
+    # The pipeline modules import pandas and pyarrow: only import them once
+    # the arguments are parsed.
+    from datamorphers.dataset import run_pipeline_dataset
+    from datamorphers.pipeline_loader import compile_pipeline, log_pipeline_config
+
+    config = get_pipeline_config(args.config, args.pipeline, **dict(args.param))
+    if args.pipeline not in config:
+        raise ValueError(f"Pipeline '{args.pipeline}' not found in {args.config}.")
+
+    start = time.perf_counter()
+    if os.path.isdir(args.input) or glob.has_magic(args.input):
+        if args.chunk_size is not None:
+            logger.warning("--chunk-size is ignored when the input is a dataset.")
+        reports = run_pipeline_dataset(
+            args.input,
+            args.output,
+            config,
+            backend=args.backend,
+            workers=args.workers,
+            pushdown=True,
+        )
+    else:
+        log_pipeline_config(config)
+        reports = [_run_single_file(compile_pipeline(config), args)]
+
+    _print_summary(reports, time.perf_counter() - start)
+    return 0
+
+
+def _run_single_file(pipeline: "Pipeline", args: argparse.Namespace) -> "FileReport":
+    """Runs the pipeline on a single file, streaming it if requested and possible."""
+    from datamorphers.dataset import run_pipeline_file
+    from datamorphers.streaming import global_steps
+
+    if args.chunk_size is not None:
+        steps = global_steps(pipeline)
+        if not steps:
+            if args.workers is not None:
+                logger.warning("--workers is ignored when streaming a file.")
+            return _stream_single_file(pipeline, args)
+        logger.warning(
+            f"Pipeline '{pipeline.name}' cannot be run chunk by chunk, as the "
+            f"following steps need the whole dataset: {steps}. Reading the "
+            "whole file instead of streaming it."
+        )
+
+    workers = args.workers
+    if workers is not None and not all(dm.row_local for _, dm in pipeline.steps):
+        logger.warning(
+            f"Pipeline '{pipeline.name}' has steps that need the whole dataset. "
+            "Running it in a single process."
+        )
+        workers = None
+    return run_pipeline_file(
+        args.input,
+        args.output,
+        pipeline,
+        backend=args.backend,
+        workers=workers,
+        pushdown=True,
+    )
+
+
+def _stream_single_file(pipeline: "Pipeline", args: argparse.Namespace) -> "FileReport":
+    """Streams a single file through the pipeline, chunk by chunk."""
+    from datamorphers.dataset import FileReport
+    from datamorphers.io import FrameWriter, iter_frames, read_schema
+    from datamorphers.pushdown import filter_expression, required_columns
+    from datamorphers.streaming import run_pipeline_stream
+
+    start = time.perf_counter()
+    columns = required_columns(pipeline)
+    filters = filter_expression(pipeline, read_schema(args.input))
+    rows_in = 0
+
+    def _chunks():
+        # Steps computing statistics read the file once more: count the rows
+        # of the last pass only.
+        nonlocal rows_in
+        rows_in = 0
+        for chunk in iter_frames(
+            args.input, args.chunk_size, args.backend, columns, filters
+        ):
+            rows_in += len(chunk)
+            yield chunk
+
+    with FrameWriter(args.output) as writer:
+        for chunk in run_pipeline_stream(_chunks, pipeline):
+            writer.write(chunk)
+
+    return FileReport(
+        input_path=args.input,
+        output_path=args.output,
+        rows_in=rows_in,
+        rows_out=writer.rows,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _print_summary(reports: list["FileReport"], seconds: float) -> None:
+    """Prints the rows and wall time of each file, and the totals."""
+    for report in reports:
+        print(
+            f"{report.input_path} -> {report.output_path}: "
+            f"{report.rows_in:,} rows in, {report.rows_out:,} rows out, "
+            f"{report.seconds:.3f}s ({report.rows_per_second:,.0f} rows/s)"
+        )
+    rows_in = sum(report.rows_in for report in reports)
+    rows_out = sum(report.rows_out for report in reports)
+    rate = rows_in / seconds if seconds > 0 else float("inf")
+    print(
+        f"Total: {len(reports)} file(s), {rows_in:,} rows in, {rows_out:,} rows "
+        f"out, {seconds:.3f}s ({rate:,.0f} rows/s)"
+    )
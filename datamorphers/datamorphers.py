@@ -1,19 +1,59 @@
+import copy
 import json
 import operator
-from typing import Any, Literal, Dict, Union, List, Optional
+import os
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Dict, Union, List, Optional
 from pydantic import BaseModel, Field, ValidationError, model_validator, field_validator
 
 import narwhals as nw
-import pandas as pd
+from narwhals.dependencies import is_pandas_dataframe
 from narwhals.typing import IntoFrame
 
 from datamorphers.base import DataMorpher, DataMorpherError
+from datamorphers.cache import fingerprint
 from datamorphers.storage import dms
 
 from datamorphers.constants.constants import SUPPORTED_TYPE_MAPPING
+from datamorphers.stats import RunningMoments
+
+# Pandas is only imported by the steps handling pandas DataFrames, which have
+# already imported it, and PyArrow by the steps reading and writing files.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    from datamorphers.io import FrameWriter
+
+
+def _is_numeric(dtype: nw.dtypes.DType) -> bool:
+    return dtype.is_numeric()
+
+
+def _is_string(dtype: nw.dtypes.DType) -> bool:
+    # Pandas columns of Python objects are usually strings
+    return dtype == nw.String or dtype == nw.Object
+
+
+def _literal_dtype(value: Any) -> nw.dtypes.DType:
+    """Returns the type of a column filled with a Python literal."""
+    if isinstance(value, bool):
+        return nw.Boolean()
+    if isinstance(value, int):
+        return nw.Int64()
+    if isinstance(value, float):
+        return nw.Float64()
+    if isinstance(value, str):
+        return nw.String()
+    return nw.Unknown()
 
 
 class CreateColumn(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         column_name: str = Field(
             ..., min_length=1, description="Name of the new column"
@@ -30,7 +70,7 @@ class CreateColumn(DataMorpher):
     def __init__(self, *, column_name: str, value: Any):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(column_name=column_name, value=value)
+            self.config = self._validate_config(column_name=column_name, value=value)
             self.column_name = self.config.column_name
             self.value = self.config.value
         except ValidationError as e:
@@ -38,14 +78,26 @@ class CreateColumn(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        return {self.column_name: nw.lit(self.value).alias(self.column_name)}
+
+    def _columns_read(self) -> set[str]:
+        return set()
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        return nw.Schema({**schema, self.column_name: _literal_dtype(self.value)})
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Adds a new column with a constant value to the dataframe."""
-        df = df.with_columns(nw.lit(self.value).alias(self.column_name))
+        df = df.with_columns(list(self._column_exprs().values()))
         return df
 
 
 class CastColumnTypes(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         cast_dict: Dict[str, str]
 
@@ -61,25 +113,51 @@ class CastColumnTypes(DataMorpher):
     def __init__(self, *, cast_dict: dict):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(cast_dict=cast_dict)
+            self.config = self._validate_config(cast_dict=cast_dict)
             self.cast_dict = self.config.cast_dict
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        return {
+            i: nw.col(i).cast(SUPPORTED_TYPE_MAPPING[c])
+            for i, c in self.cast_dict.items()
+        }
+
+    def _columns_read(self) -> set[str]:
+        return set(self.cast_dict)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, list(self.cast_dict))
+        schema = nw.Schema(schema)
+        for col, type_name in self.cast_dict.items():
+            source, target = schema[col], SUPPORTED_TYPE_MAPPING[type_name]()
+            # Backends disagree on the meaning of these casts, if they allow them
+            if (source.is_temporal() and target.is_numeric()) or (
+                (source.is_numeric() or source == nw.Boolean) and target.is_temporal()
+            ):
+                raise DataMorpherError(
+                    f"[{self.__class__.__name__}] Cannot cast column '{col}' "
+                    f"from {source} to {target}."
+                )
+            schema[col] = target
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Casts columns in the DataFrame to specific column types."""
-        expr = [
-            nw.col(i).cast(SUPPORTED_TYPE_MAPPING[c]) for i, c in self.cast_dict.items()
-        ]
+        expr = list(self._column_exprs().values())
         df = df.with_columns(expr)
 
         return df
 
 
 class ColumnsOperator(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         first_column: str = Field(
             ..., min_length=1, description="First column to operate on"
@@ -109,7 +187,7 @@ class ColumnsOperator(DataMorpher):
     ):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(
+            self.config = self._validate_config(
                 first_column=first_column,
                 second_column=second_column,
                 logic=logic,
@@ -124,6 +202,35 @@ class ColumnsOperator(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        operation = getattr(operator, self.logic)
+        expr: nw.Expr = operation(
+            nw.col(self.first_column), (nw.col(self.second_column))
+        )
+        return {self.output_column: expr.alias(self.output_column)}
+
+    def _columns_read(self) -> set[str]:
+        return {self.first_column, self.second_column}
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, [self.first_column, self.second_column])
+        first, second = schema[self.first_column], schema[self.second_column]
+        if self.logic == "add" and _is_string(first) and _is_string(second):
+            # Strings are concatenated
+            return nw.Schema({**schema, self.output_column: nw.String()})
+
+        for col in (self.first_column, self.second_column):
+            self._check_dtype(schema, col, _is_numeric, "a numeric type")
+        if self.logic == "truediv":
+            dtype = nw.Float64()
+        elif first == second:
+            dtype = first
+        elif first.is_float() or second.is_float():
+            dtype = nw.Float64()
+        else:
+            dtype = nw.Int64()
+        return nw.Schema({**schema, self.output_column: dtype})
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """
@@ -131,11 +238,7 @@ class ColumnsOperator(DataMorpher):
         the values in another column.
         Renames the resulting column as 'output_column'.
         """
-        operation = getattr(operator, self.logic)
-        expr: nw.Expr = operation(
-            nw.col(self.first_column), (nw.col(self.second_column))
-        )
-        df = df.with_columns(expr.alias(self.output_column))
+        df = df.with_columns(list(self._column_exprs().values()))
         return df
 
 
@@ -169,19 +272,48 @@ class DropDuplicates(DataMorpher):
     def __init__(self, *, subset: Union[List[str], str] = None, keep: str = "any"):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(subset=subset, keep=keep)
+            self.config = self._validate_config(subset=subset, keep=keep)
             # Assign validated values
             self.subset = self.config.subset
             self.keep = self.config.keep
+            self.partition_by = None
+            # LazyFrame.unique does not support keeping the first or last row.
+            self.lazy_compatible = self.keep == "any"
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _partitioned(self, by: str) -> "DropDuplicates":
+        partitioned = copy.copy(self)
+        partitioned.partition_by = by
+        return partitioned
+
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        if needed is None or not self.subset:
+            return None
+        subset = [self.subset] if isinstance(self.subset, str) else self.subset
+        return needed | set(subset)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        if self.subset:
+            subset = [self.subset] if isinstance(self.subset, str) else self.subset
+            self._check_columns(schema, subset)
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Drops duplicated rows."""
-        if self.subset:
+        if self.partition_by is not None:
+            # Rows of different partitions are never duplicates. The order is
+            # kept, so that the rows of each partition stay contiguous.
+            subset = [self.subset] if isinstance(self.subset, str) else self.subset
+            df = df.unique(
+                subset=[*subset, self.partition_by] if subset else None,
+                keep=self.keep,
+                maintain_order=True,
+            )
+        elif self.subset:
             # Drop duplicates only on a subset of columns
             df = df.unique(subset=self.subset, keep=self.keep)
         else:
@@ -191,6 +323,9 @@ class DropDuplicates(DataMorpher):
 
 
 class DropNA(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         column_name: str = Field(
             ..., min_length=1, description="Name of the column to check for NaN values."
@@ -199,13 +334,20 @@ class DropNA(DataMorpher):
     def __init__(self, *, column_name: str):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(column_name=column_name)
+            self.config = self._validate_config(column_name=column_name)
             self.column_name = self.config.column_name
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        return None if needed is None else needed | {self.column_name}
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, [self.column_name])
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Drops rows with any NaN values."""
@@ -214,6 +356,9 @@ class DropNA(DataMorpher):
 
 
 class FillNA(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         column_name: str = Field(
             ..., description="Name of the column to fill NaN values."
@@ -232,7 +377,7 @@ class FillNA(DataMorpher):
     def __init__(self, *, column_name: str, value: Any):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(column_name=column_name, value=value)
+            self.config = self._validate_config(column_name=column_name, value=value)
             self.column_name = self.config.column_name
             self.value = self.config.value
         except ValidationError as e:
@@ -240,15 +385,26 @@ class FillNA(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
-    @nw.narwhalify
-    def _datamorph(self, df: IntoFrame) -> IntoFrame:
-        """Fills NaN values in the specified column with the provided value."""
-        df = df.with_columns(
-            nw.when(nw.col(self.column_name).is_nan())
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        return {
+            self.column_name: nw.when(nw.col(self.column_name).is_nan())
             .then(self.value)
             .otherwise(nw.col(self.column_name))
             .alias(self.column_name)
-        )
+        }
+
+    def _columns_read(self) -> set[str]:
+        return {self.column_name}
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        # Only floating point columns can contain NaN values
+        self._check_dtype(schema, self.column_name, _is_numeric, "a numeric type")
+        return schema
+
+    @nw.narwhalify
+    def _datamorph(self, df: IntoFrame) -> IntoFrame:
+        """Fills NaN values in the specified column with the provided value."""
+        df = df.with_columns(list(self._column_exprs().values()))
         return df
 
 
@@ -264,6 +420,9 @@ class FilterRows(DataMorpher):
         logic (str): Python operator (e.g., 'eq', 'lt', etc.).
     """
 
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         first_column: str = Field(
             ..., description="Name of the first column to compare."
@@ -293,7 +452,7 @@ class FilterRows(DataMorpher):
     ):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(
+            self.config = self._validate_config(
                 first_column=first_column, second_column=second_column, logic=logic
             )
             self.first_column = self.config.first_column
@@ -304,11 +463,45 @@ class FilterRows(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        """
+        Adds the compared columns to the columns needed after the filter. As
+        the schema of the source is not known here, a string `second_column`
+        is always reported as a possible column, even if it is a literal
+        value: readers ignore the names that are not columns of the file.
+        """
+        if needed is None:
+            return None
+        if isinstance(self.second_column, str):
+            return needed | {self.first_column, self.second_column}
+        return needed | {self.first_column}
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, [self.first_column])
+        if self.second_column in schema:
+            other = schema[self.second_column]
+        else:
+            other = _literal_dtype(self.second_column)
+        dtype = schema[self.first_column]
+        # Strings can only be ordered against strings
+        if (
+            self.logic != "eq"
+            and dtype != nw.Unknown
+            and other != nw.Unknown
+            and _is_string(dtype) != _is_string(other)
+        ):
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Cannot compare column "
+                f"'{self.first_column}' of type {dtype} with {other} values "
+                f"using '{self.logic}'."
+            )
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Filters rows based on a condition."""
         operation = getattr(operator, self.logic)
-        if self.second_column not in df.columns:
+        if self.second_column not in df.collect_schema().names():
             col_to_compare = nw.lit(self.second_column)
         else:
             col_to_compare = nw.col(self.second_column)
@@ -331,14 +524,24 @@ class FlatMultiIndex(DataMorpher):
             Index(['A_B', 'C_D', 'E']
     """
 
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         pass
 
     def __init__(self):
         super().__init__()
+        self.config = self._validate_config()
+
+    def _partitioned(self, by: str) -> None:
+        # The partition column would be flattened along with the others
+        return None
 
-    def _datamorph(self, df: pd.DataFrame) -> pd.DataFrame:
-        if not isinstance(df, pd.DataFrame):
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        return nw.Schema({"_".join(col): dtype for col, dtype in schema.items()})
+
+    def _datamorph(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        if not is_pandas_dataframe(df):
             raise ValueError("Input must be a Pandas DataFrame.")
 
         df.columns = df.columns.to_flat_index()
@@ -348,15 +551,24 @@ class FlatMultiIndex(DataMorpher):
 
 class MergeDataFrames(DataMorpher):
     """
-    Pandas only.
+    Merges two DataFrames based on specified columns and join type, through
+    Narwhals for every backend, with the semantics of `pd.merge`: overlapping
+    columns get the suffixes, and outer joins coalesce and sort the join keys.
 
-    Merges two DataFrames based on specified columns and join type.
+    The DataFrame to join (the build side) is prepared once per instance. On
+    pandas, left and inner joins against unique keys look the keys up in a
+    hash index built once. With `cache_build_side`, the prepared build side is
+    also stored in the DataMorphersStorage, so that later runs joining the
+    same DataFrame, e.g. one per micro-batch, reuse it instead of building it
+    again.
 
     Attributes:
-        df_to_join (pd.DataFrame): The DataFrame to join with, fetched from the DataMorphersStorage.
+        df_to_join (nw.IntoFrame): The DataFrame to join with, fetched from the DataMorphersStorage.
         join_cols (List[str]): Columns to join on.
         how (str): Type of join - must be one of "left", "right", "inner", or "outer".
         suffixes (Tuple[str, str]): Suffixes to use for overlapping column names.
+        cache_build_side (bool): Whether to cache the prepared DataFrame to join
+            in the DataMorphersStorage.
 
     Example yaml config:
         ```yaml
@@ -366,6 +578,7 @@ class MergeDataFrames(DataMorpher):
                 join_cols: [A, B]
                 how: inner
                 suffixes: ["_1", "_2"]
+                cache_build_side: true
         ```
 
     Example usage:
@@ -388,11 +601,14 @@ class MergeDataFrames(DataMorpher):
         join_cols: List[str]
         how: str = Field(..., pattern=r"^(left|right|inner|outer)$")
         suffixes: tuple[str, str]
+        cache_build_side: bool = False
 
         @model_validator(mode="before")
         def check_value_type(cls, values: dict):
             df_to_join = dms.get(values.get("df_to_join"))
-            if not isinstance(df_to_join, pd.DataFrame):
+            try:
+                nw.from_native(df_to_join, eager_only=True)
+            except TypeError:
                 raise ValueError(
                     "Parameter 'df_to_join' must be a DataFrame."
                     f"Found type: {type(df_to_join)}."
@@ -406,34 +622,238 @@ class MergeDataFrames(DataMorpher):
         join_cols: list,
         how: str,
         suffixes: tuple[str, str],
+        cache_build_side: bool = False,
     ):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(
-                df_to_join=df_to_join, join_cols=join_cols, how=how, suffixes=suffixes
+            self.config = self._validate_config(
+                df_to_join=df_to_join,
+                join_cols=join_cols,
+                how=how,
+                suffixes=suffixes,
+                cache_build_side=cache_build_side,
             )
             self.df_to_join = dms.get(df_to_join)
             self.join_cols = self.config.join_cols
             self.how = self.config.how
             self.suffixes = self.config.suffixes
+            self.cache_build_side = self.config.cache_build_side
+            self._build_side = None
+            # Left and inner joins against a lookup table can be applied per chunk.
+            self.row_local = self.how in ("left", "inner")
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        if needed is None:
+            return None
+        right_columns = set(nw.from_native(self.df_to_join, eager_only=True).columns)
+        left_suffix = self.suffixes[0]
+        # Keep the left columns overlapping with the right ones, as they
+        # determine which output columns get a suffix. Without a left suffix,
+        # they keep their name and are among the right columns.
+        suffixed = {
+            col[: -len(left_suffix)]
+            for col in needed
+            if left_suffix and col.endswith(left_suffix)
+        }
+        return (
+            {col for col in needed if col not in right_columns}
+            | suffixed
+            | right_columns
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Processes inheriting the shared directory read the DataFrame from it
+        if dms.is_shared(self.config.df_to_join):
+            state["df_to_join"] = None
+        # The build side is prepared again by each process
+        state["_build_side"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        if self.df_to_join is None:
+            self.df_to_join = dms.get(self.config.df_to_join)
+
+    def _cache_token(self) -> str | None:
+        token = super()._cache_token()
+        # The configuration only holds the storage key of the DataFrame to join
+        return None if token is None else f"{token}:{fingerprint(self.df_to_join)}"
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        right = nw.from_native(self.df_to_join, eager_only=True).collect_schema()
+        self._check_columns(schema, self.join_cols)
+        missing = [col for col in self.join_cols if col not in right]
+        if missing:
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Column(s) {missing} not found in "
+                f"the DataFrame to join. Available columns are: {list(right)}"
+            )
+        # Overlapping columns, other than the join columns, get a suffix
+        overlap = (set(schema) & set(right)) - set(self.join_cols)
+        left_suffix, right_suffix = self.suffixes
+        return nw.Schema(
+            {
+                **{
+                    col + left_suffix if col in overlap else col: dtype
+                    for col, dtype in schema.items()
+                },
+                **{
+                    col + right_suffix if col in overlap else col: dtype
+                    for col, dtype in right.items()
+                    if col not in self.join_cols
+                },
+            }
+        )
+
+    def _get_build_side(self) -> "_BuildSide":
+        """Returns the prepared DataFrame to join, preparing it if needed."""
+        if self._build_side is not None and self._build_side.source is self.df_to_join:
+            return self._build_side
+
+        storage_key = f"{self.config.df_to_join}.build_side[{','.join(self.join_cols)}]"
+        if self.cache_build_side and dms.isin(storage_key):
+            build_side = dms.get(storage_key)
+            if build_side.source is self.df_to_join:
+                self._build_side = build_side
+                return build_side
+
+        self._build_side = _BuildSide.prepare(self.df_to_join, self.join_cols)
+        if self.cache_build_side:
+            dms.set(storage_key, self._build_side)
+        return self._build_side
+
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Merges two DataFrames."""
-        merged_df = pd.merge(
-            left=df,
-            right=self.df_to_join,
-            on=self.join_cols,
-            how=self.how,
-            suffixes=self.suffixes,
+        build_side = self._get_build_side()
+        if (
+            build_side.index is not None
+            and self.how in ("left", "inner")
+            and is_pandas_dataframe(df)
+        ):
+            return self._lookup_join(df, build_side)
+
+        left = nw.from_native(df, eager_only=True)
+        right = nw.from_native(self.df_to_join, eager_only=True)
+        left_backend = nw.get_native_namespace(left)
+        right_backend = nw.get_native_namespace(right)
+        if left_backend is not right_backend:
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Cannot join a {left_backend.__name__} "
+                f"DataFrame with '{self.config.df_to_join}', a "
+                f"{right_backend.__name__} DataFrame."
+            )
+
+        # Narwhals only suffixes the right columns: suffix both sides first
+        overlap = (set(left.columns) & set(right.columns)) - set(self.join_cols)
+        left_suffix, right_suffix = self.suffixes
+        left = left.rename({col: col + left_suffix for col in overlap})
+        right = right.rename({col: col + right_suffix for col in overlap})
+
+        if self.how == "right":
+            merged = right.join(left, on=self.join_cols, how="left").select(
+                *left.columns,
+                *(col for col in right.columns if col not in self.join_cols),
+            )
+        elif self.how == "outer":
+            key_suffix = "__datamorphers_right"
+            merged = left.join(right, on=self.join_cols, how="full", suffix=key_suffix)
+            merged = (
+                merged.with_columns(
+                    nw.when(nw.col(col).is_null())
+                    .then(nw.col(col + key_suffix))
+                    .otherwise(nw.col(col))
+                    .cast(left.schema[col])
+                    .alias(col)
+                    for col in self.join_cols
+                )
+                .drop(col + key_suffix for col in self.join_cols)
+                .sort(self.join_cols)
+            )
+        else:
+            merged = left.join(right, on=self.join_cols, how=self.how)
+
+        return merged.to_native()
+
+    def _lookup_join(
+        self, df: "pd.DataFrame", build_side: "_BuildSide"
+    ) -> "pd.DataFrame":
+        """Joins a pandas DataFrame, looking its keys up in the build side index."""
+        import pandas as pd
+
+        if len(self.join_cols) == 1:
+            keys = df[self.join_cols[0]]
+        else:
+            keys = pd.MultiIndex.from_frame(df[self.join_cols])
+        indexer = build_side.index.get_indexer(keys)
+        if self.how == "inner":
+            found = indexer != -1
+            df, indexer = df[found], indexer[found]
+
+        values = build_side.values
+        overlap = (set(df.columns) & set(values.columns)) - set(self.join_cols)
+        left_suffix, right_suffix = self.suffixes
+        left = df.rename(columns={col: col + left_suffix for col in overlap})
+        # Missing keys (-1) are not in the index, and get null values
+        right = values.reindex(indexer).rename(
+            columns={col: col + right_suffix for col in overlap}
+        )
+        return pd.concat(
+            [left.reset_index(drop=True), right.reset_index(drop=True)], axis=1
         )
-        return merged_df
+
+
+class _BuildSide:
+    """
+    The DataFrame to join in MergeDataFrames, prepared once for many joins.
+
+    Attributes:
+        source (nw.IntoFrame): The DataFrame it was prepared from.
+        index (pd.Index | None): For pandas DataFrames with unique join keys,
+            the index of the keys, whose hash table is built once.
+        values (pd.DataFrame | None): The other columns, aligned with `index`.
+    """
+
+    def __init__(self, source: IntoFrame, index=None, values=None):
+        self.source = source
+        self.index = index
+        self.values = values
+
+    @classmethod
+    def prepare(cls, source: IntoFrame, join_cols: list[str]) -> "_BuildSide":
+        if not is_pandas_dataframe(source):
+            return cls(source)
+        import pandas as pd
+
+        if len(join_cols) == 1:
+            index = pd.Index(source[join_cols[0]])
+        else:
+            index = pd.MultiIndex.from_frame(source[join_cols])
+        # Checking uniqueness builds the hash table of the index
+        if not index.is_unique:
+            return cls(source)
+        values = source.drop(columns=join_cols).reset_index(drop=True)
+        return cls(source, index, values)
 
 
 class NormalizeColumn(DataMorpher):
+    """
+    Normalizes a numerical column using Z-score normalization.
+
+    By default, the mean and standard deviation are computed on the DataFrame
+    being transformed. When the data is processed in chunks, they are first
+    accumulated over all chunks with `_partial_fit`, and `_fitted` returns a
+    row-local copy that applies the resulting statistics to each chunk. When
+    many DataFrames are transformed at once, `_partitioned` returns a copy
+    computing them over each partition.
+    """
+
+    lazy_compatible = True
+
     class PyDanticValidator(BaseModel):
         column_name: str = Field(
             ..., min_length=1, description="The name of the column to normalize"
@@ -447,31 +867,421 @@ class NormalizeColumn(DataMorpher):
     def __init__(self, *, column_name: str, output_column: str):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(
+            self.config = self._validate_config(
                 column_name=column_name, output_column=output_column
             )
             self.column_name = self.config.column_name
             self.output_column = self.config.output_column
+            self.moments: RunningMoments | None = None
+            self.partition_by = None
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _partial_fit(self, df: IntoFrame, moments: RunningMoments) -> None:
+        """Accumulates the statistics of the column of a chunk into `moments`."""
+        moments.update(nw.from_native(df, eager_only=True)[self.column_name])
+
+    def _fitted(self, moments: RunningMoments) -> "NormalizeColumn":
+        """Returns a copy normalizing the column with precomputed statistics."""
+        fitted = copy.copy(self)
+        fitted.moments = moments
+        fitted.row_local = True
+        return fitted
+
+    def _partitioned(self, by: str) -> "NormalizeColumn":
+        if self.moments is not None:
+            # The statistics are the same for every partition
+            return self
+        partitioned = copy.copy(self)
+        partitioned.partition_by = by
+        return partitioned
+
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        if self.moments is not None:
+            mean, std = nw.lit(self.moments.mean), nw.lit(self.moments.std())
+        else:
+            mean, std = nw.col(self.column_name).mean(), nw.col(self.column_name).std()
+            if self.partition_by is not None:
+                mean, std = mean.over(self.partition_by), std.over(self.partition_by)
+        return {
+            self.output_column: ((nw.col(self.column_name) - mean) / std).alias(
+                self.output_column
+            )
+        }
+
+    def _columns_read(self) -> set[str]:
+        if self.partition_by is not None:
+            return {self.column_name, self.partition_by}
+        return {self.column_name}
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_dtype(schema, self.column_name, _is_numeric, "a numeric type")
+        return nw.Schema({**schema, self.output_column: nw.Float64()})
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Normalize a numerical column in the dataframe using Z-score normalization."""
+        df = df.with_columns(list(self._column_exprs().values()))
+        return df
+
+
+class _FileReader(DataMorpher):
+    """
+    Base class of the DataMorphers reading a file, which replace the input
+    DataFrame with the content of the file.
+
+    When a reader starts the pipeline, only the columns needed by the next
+    steps are read, and the rows discarded by the FilterRows steps following
+    it are skipped while reading (see `datamorphers.pushdown`). With
+    `run_pipeline_stream(None, config)`, the file is read in chunks of
+    `batch_size` rows instead of at once.
+
+    Attributes:
+        path (str): The path of the file.
+        columns (List[str], optional): The columns to read, in this order.
+            Defaults to all the columns.
+        filters (List, optional): Conditions on the rows to read, in the
+            PyArrow format: a list of (column, operator, value) tuples, all
+            of which must hold, or a list of such lists, any of which must
+            hold. The operators are "=", "==", "!=", "<", ">", "<=", ">=",
+            "in" and "not in".
+        backend (str, optional): The backend of the DataFrame read, e.g.
+            "pandas", "polars" or "pyarrow". Defaults to the backend of the
+            input DataFrame, or to pandas without input DataFrame.
+        batch_size (int, optional): The maximum number of rows of each chunk,
+            when the pipeline is streamed.
+    """
+
+    class PyDanticValidator(BaseModel):
+        path: str = Field(..., min_length=1, description="Path of the file to read.")
+        columns: Optional[List[str]] = Field(None, description="Columns to read.")
+        filters: Optional[
+            List[Union[tuple[str, str, Any], List[tuple[str, str, Any]]]]
+        ] = Field(None, description="Conditions on the rows to read.")
+        backend: Optional[str] = Field(None, min_length=1)
+        batch_size: Optional[int] = Field(None, gt=0)
+
+        @field_validator("filters")
+        def validate_filters(cls, v):
+            valid_operators = ["=", "==", "!=", "<", ">", "<=", ">=", "in", "not in"]
+            conditions = [
+                condition
+                for group in v or []
+                for condition in (group if isinstance(group, list) else [group])
+            ]
+            for _, op, _ in conditions:
+                if op not in valid_operators:
+                    raise ValueError(
+                        f"Invalid filter operator '{op}'. Valid operators are "
+                        f"{valid_operators}"
+                    )
+            return v
+
+    def __init__(self, **values: Any):
+        super().__init__()
+        try:
+            self.config = self._validate_config(**values)
+            self.path = self.config.path
+            self.columns = self.config.columns
+            self.filters = self.config.filters
+            self.backend = self.config.backend
+            self.batch_size = self.config.batch_size
+        except ValidationError as e:
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Invalid config: {e}"
+            ) from e
+        # The steps following the reader, set when it starts a pipeline
+        self._next_steps: list[tuple[str, DataMorpher]] = []
+        self._next_columns: list[str] | None = None
+
+    @abstractmethod
+    def _dataset(self) -> "ds.Dataset":
+        """Returns the PyArrow dataset of the file."""
+
+    def _read_table(
+        self,
+        dataset: "ds.Dataset",
+        columns: list[str] | None,
+        filters: "pc.Expression | None",
+    ) -> "pa.Table":
+        """Reads the columns and rows of the file at once."""
+        return dataset.to_table(columns=columns, filter=filters)
+
+    def _pushdown(self, steps: list[tuple[str, DataMorpher]]) -> "_FileReader":
+        """Returns a copy of the reader skipping what the next steps do not need."""
+        from datamorphers.pushdown import _required_columns
+
+        pushed = copy.copy(self)
+        pushed._next_steps = steps
+        pushed._next_columns = _required_columns(steps)
+        return pushed
+
+    def _scan_options(
+        self, schema: "pa.Schema"
+    ) -> tuple[list[str] | None, "pc.Expression | None"]:
+        """Returns the columns to read, and the filter applied while reading."""
+        import pyarrow.parquet as pq
+
+        from datamorphers.pushdown import _filter_expression
+
+        next_columns = self._next_columns
+        if self.columns is not None:
+            self._check_columns(schema.names, self.columns)
+            columns = [
+                col
+                for col in self.columns
+                if next_columns is None or col in set(next_columns)
+            ]
+        elif next_columns is not None:
+            columns = [col for col in schema.names if col in set(next_columns)]
+        else:
+            columns = None
+
+        filters = None if not self.filters else pq.filters_to_expression(self.filters)
+        pushed = _filter_expression(self._next_steps, schema)
+        if pushed is not None:
+            filters = pushed if filters is None else filters & pushed
+        return columns, filters
+
+    def _backend(self, df: IntoFrame | None) -> "str | nw.Implementation":
+        if self.backend is not None:
+            return self.backend
+        if df is None:
+            return "pandas"
+        return nw.from_native(df).implementation
+
+    def _iter_frames(self) -> Iterator[IntoFrame]:
+        """Reads the file in chunks of `batch_size` rows."""
+        from datamorphers.io import _scan
+
+        dataset = self._dataset()
+        columns, filters = self._scan_options(dataset.schema)
+        return _scan(dataset, self.batch_size, self._backend(None), columns, filters)
+
+    def _required_columns(self, needed: set[str] | None) -> set[str]:
+        return set()
+
+    def _cache_token(self) -> None:
+        # The file may change from one run to the next
+        return None
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        import pyarrow as pa
+
+        file_schema = self._dataset().schema
+        columns, _ = self._scan_options(file_schema)
+        if columns is not None:
+            file_schema = pa.schema([file_schema.field(col) for col in columns])
+        return nw.from_arrow(file_schema.empty_table(), backend="pyarrow").schema
+
+    def _datamorph(self, df: IntoFrame | None) -> IntoFrame:
+        """Reads the file, ignoring the input DataFrame."""
+        from datamorphers.io import _from_arrow
+
+        dataset = self._dataset()
+        columns, filters = self._scan_options(dataset.schema)
+        table = self._read_table(dataset, columns, filters)
+        return _from_arrow(table, self._backend(df))
+
+
+class ReadCSV(_FileReader):
+    """
+    Reads a CSV file, parsing it with several threads.
+
+    Attributes:
+        path, columns, filters, backend, batch_size: See `_FileReader`.
+        delimiter (str): The character delimiting the fields of a row.
+        use_threads (bool): Whether to parse blocks of the file in parallel.
 
-        df = df.with_columns(
-            (
-                (nw.col(self.column_name) - nw.col(self.column_name).mean())
-                / nw.col(self.column_name).std()
-            ).alias(self.output_column)
+    Example yaml config:
+        ```yaml
+        pipeline_ReadCSV:
+            - ReadCSV:
+                path: data/sales.csv
+                columns: [item, price]
+                filters: [[price, ">", 10]]
+        ```
+    """
+
+    class PyDanticValidator(_FileReader.PyDanticValidator):
+        delimiter: str = Field(",", min_length=1, max_length=1)
+        use_threads: bool = True
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        backend: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        delimiter: str = ",",
+        use_threads: bool = True,
+    ):
+        super().__init__(
+            path=path,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+            batch_size=batch_size,
+            delimiter=delimiter,
+            use_threads=use_threads,
         )
+        self.delimiter = self.config.delimiter
+        self.use_threads = self.config.use_threads
 
-        return df
+    def _dataset(self) -> "ds.Dataset":
+        import pyarrow.csv as pacsv
+        import pyarrow.dataset as ds
+
+        parse_options = pacsv.ParseOptions(delimiter=self.delimiter)
+        return ds.dataset(self.path, format=ds.CsvFileFormat(parse_options))
+
+    def _read_table(
+        self,
+        dataset: "ds.Dataset",
+        columns: list[str] | None,
+        filters: "pc.Expression | None",
+    ) -> "pa.Table":
+        import pyarrow.csv as pacsv
+
+        # The columns the filters refer to are read too, and dropped once the
+        # rows are filtered
+        include_columns = columns
+        if columns is not None and filters is not None:
+            include_columns = columns + [
+                col
+                for col in self._filter_columns(dataset.schema)
+                if col not in columns
+            ]
+
+        # The CSV reader parses blocks of a single file in parallel
+        table = pacsv.read_csv(
+            self.path,
+            read_options=pacsv.ReadOptions(use_threads=self.use_threads),
+            parse_options=pacsv.ParseOptions(delimiter=self.delimiter),
+            convert_options=pacsv.ConvertOptions(include_columns=include_columns),
+        )
+        if filters is not None:
+            table = table.filter(filters)
+        return table if include_columns == columns else table.select(columns)
+
+    def _filter_columns(self, schema: "pa.Schema") -> list[str]:
+        """Returns the columns of the file the filters read while reading refer to."""
+        names = {
+            condition[0]
+            for group in self.filters or []
+            for condition in (group if isinstance(group, list) else [group])
+        }
+        # The leading FilterRows steps are pushed down as well
+        for _, datamorpher in self._next_steps:
+            if not isinstance(datamorpher, FilterRows):
+                break
+            names.add(datamorpher.first_column)
+        return [col for col in schema.names if col in names]
+
+
+class ReadIPC(_FileReader):
+    """
+    Reads an Arrow IPC (Feather v2) file. With memory mapping, the columns
+    are not copied into memory, but read from the file when accessed.
+
+    Attributes:
+        path, columns, filters, backend, batch_size: See `_FileReader`.
+        memory_map (bool): Whether to memory-map the file.
+
+    Example yaml config:
+        ```yaml
+        pipeline_ReadIPC:
+            - ReadIPC:
+                path: data/sales.arrow
+                backend: polars
+        ```
+    """
+
+    class PyDanticValidator(_FileReader.PyDanticValidator):
+        memory_map: bool = True
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        backend: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        memory_map: bool = True,
+    ):
+        super().__init__(
+            path=path,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+            batch_size=batch_size,
+            memory_map=memory_map,
+        )
+        self.memory_map = self.config.memory_map
+
+    def _dataset(self) -> "ds.Dataset":
+        import pyarrow.dataset as ds
+        import pyarrow.fs as pafs
+
+        filesystem = pafs.LocalFileSystem(use_mmap=self.memory_map)
+        return ds.dataset(
+            os.path.abspath(self.path), format="ipc", filesystem=filesystem
+        )
+
+
+class ReadParquet(_FileReader):
+    """
+    Reads a Parquet file. Row groups whose statistics do not match the
+    filters are skipped without being decoded.
+
+    Attributes:
+        path, columns, filters, backend, batch_size: See `_FileReader`.
+
+    Example yaml config:
+        ```yaml
+        pipeline_ReadParquet:
+            - ReadParquet:
+                path: data/sales.parquet
+                filters: [[item_type, "==", food]]
+                batch_size: 100000
+        ```
+    """
+
+    class PyDanticValidator(_FileReader.PyDanticValidator):
+        pass
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        backend: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        super().__init__(
+            path=path,
+            columns=columns,
+            filters=filters,
+            backend=backend,
+            batch_size=batch_size,
+        )
+
+    def _dataset(self) -> "ds.Dataset":
+        import pyarrow.dataset as ds
+
+        return ds.dataset(self.path, format="parquet")
 
 
 class RemoveColumns(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         columns_name: Union[str, List[str]] = Field(
             ..., description="List or a single column name to remove"
@@ -494,13 +1304,27 @@ class RemoveColumns(DataMorpher):
     def __init__(self, *, columns_name: Union[str, List[str]]):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(columns_name=columns_name)
+            self.config = self._validate_config(columns_name=columns_name)
             self.columns_name = self.config.columns_name
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        # The removed columns must exist in the DataFrame
+        return None if needed is None else needed | set(self.columns_name)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, self.columns_name)
+        return nw.Schema(
+            {
+                col: dtype
+                for col, dtype in schema.items()
+                if col not in self.columns_name
+            }
+        )
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Removes a specified column from the DataFrame."""
@@ -509,6 +1333,9 @@ class RemoveColumns(DataMorpher):
 
 
 class RenameColumns(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         rename_map: Dict[str, str] = Field(
             ..., description="Mapping of old column names to new column names"
@@ -525,13 +1352,26 @@ class RenameColumns(DataMorpher):
     def __init__(self, *, rename_map: Dict[str, str]):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(rename_map=rename_map)
+            self.config = self._validate_config(rename_map=rename_map)
             self.rename_map = self.config.rename_map
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        if needed is None:
+            return None
+        # The renamed columns must exist in the DataFrame
+        old_names = {new: old for old, new in self.rename_map.items()}
+        return {old_names.get(col, col) for col in needed} | set(self.rename_map)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, list(self.rename_map))
+        return nw.Schema(
+            {self.rename_map.get(col, col): dtype for col, dtype in schema.items()}
+        )
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Renames columns in the dataframe."""
@@ -540,6 +1380,17 @@ class RenameColumns(DataMorpher):
 
 
 class Rolling(DataMorpher):
+    """
+    Computes a rolling operation on a column.
+
+    When the data is processed in chunks, `_stateful` returns a copy that
+    carries the trailing `window_size - 1` values of each chunk over to the
+    next one, so that the first rows of a chunk get the same values as if
+    the whole column was processed at once. Conversely, `_partitioned`
+    returns a copy nulling the first `window_size - 1` rows of each
+    partition, as if each partition was processed on its own.
+    """
+
     class PyDanticValidator(BaseModel):
         column_name: str = Field(
             ..., description="Name of the column to apply the rolling operation on"
@@ -564,7 +1415,7 @@ class Rolling(DataMorpher):
     ):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(
+            self.config = self._validate_config(
                 column_name=column_name,
                 how=how,
                 window_size=window_size,
@@ -574,15 +1425,45 @@ class Rolling(DataMorpher):
             self.how = self.config.how
             self.window_size = self.config.window_size
             self.output_column = self.config.output_column
+            self.carry_over = False
+            self._tail = None
+            self.partition_by = None
         except ValidationError as e:
             raise DataMorpherError(
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _stateful(self) -> "Rolling":
+        """Returns a copy carrying the trailing window from one chunk to the next."""
+        stateful = copy.copy(self)
+        stateful.carry_over = True
+        stateful._tail = None
+        return stateful
+
+    def _partitioned(self, by: str) -> "Rolling":
+        partitioned = copy.copy(self)
+        partitioned.partition_by = by
+        return partitioned
+
+    def _required_columns(self, needed: set[str] | None) -> set[str] | None:
+        if needed is None:
+            return None
+        required = (needed - {self.output_column}) | {self.column_name}
+        if self.partition_by is not None:
+            required.add(self.partition_by)
+        return required
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_dtype(schema, self.column_name, _is_numeric, "a numeric type")
+        return nw.Schema({**schema, self.output_column: nw.Float64()})
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame):
         """Computes rolling operation on a column."""
-        col = df.get_column(self.column_name)
+        window = df.select(self.column_name)
+        if self._tail is not None:
+            window = nw.concat([self._tail, window])
+        col = window.get_column(self.column_name)
         if self.how == "mean":
             rolling_col = col.rolling_mean(self.window_size)
         elif self.how == "std":
@@ -591,11 +1472,29 @@ class Rolling(DataMorpher):
             rolling_col = col.rolling_sum(self.window_size)
         elif self.how == "var":
             rolling_col = col.rolling_var(self.window_size)
+        if self.carry_over:
+            # Drop the values of the previous chunk, and keep them for the next one
+            rolling_col = rolling_col[len(window) - len(df) :]
+            self._tail = window.tail(self.window_size - 1)
         df = df.with_columns(rolling_col.alias(self.output_column))
+        if self.partition_by is not None and self.window_size > 1:
+            # The rows of each partition are contiguous: null the windows
+            # overlapping the start of a partition.
+            by = nw.col(self.partition_by)
+            starts = (by != by.shift(1)).fill_null(True).cast(nw.Int64)
+            in_partition = starts.rolling_sum(self.window_size - 1, min_samples=1) == 0
+            df = df.with_columns(
+                nw.when(in_partition)
+                .then(nw.col(self.output_column))
+                .alias(self.output_column)
+            )
         return df
 
 
 class SelectColumns(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         columns_name: Union[str, List[str]] = Field(
             ..., description="Column(s) to select"
@@ -606,7 +1505,7 @@ class SelectColumns(DataMorpher):
 
         # Validate with Pydantic
         try:
-            self.config = self.PyDanticValidator(columns_name=columns_name)
+            self.config = self._validate_config(columns_name=columns_name)
             if isinstance(self.config.columns_name, str):
                 self.columns_name = [self.config.columns_name]
             else:
@@ -616,6 +1515,18 @@ class SelectColumns(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _partitioned(self, by: str) -> "SelectColumns":
+        partitioned = copy.copy(self)
+        partitioned.columns_name = [*self.columns_name, by]
+        return partitioned
+
+    def _required_columns(self, needed: set[str] | None) -> set[str]:
+        return set(self.columns_name)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        self._check_columns(schema, self.columns_name)
+        return nw.Schema({col: schema[col] for col in self.columns_name})
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
         """Selects columns from the DataFrame."""
@@ -624,6 +1535,9 @@ class SelectColumns(DataMorpher):
 
 
 class ToLower(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         columns_name: Union[str, List[str]] = Field(
             ..., description="Column(s) to convert to lowercase"
@@ -632,7 +1546,7 @@ class ToLower(DataMorpher):
     def __init__(self, *, columns_name: Union[str, List[str]]):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(columns_name=columns_name)
+            self.config = self._validate_config(columns_name=columns_name)
             if isinstance(self.config.columns_name, str):
                 self.columns_name = [self.config.columns_name]
             else:
@@ -642,13 +1556,27 @@ class ToLower(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        return {col: nw.col(col).str.to_lowercase() for col in self.columns_name}
+
+    def _columns_read(self) -> set[str]:
+        return set(self.columns_name)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        for col in self.columns_name:
+            self._check_dtype(schema, col, _is_string, "a string type")
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
-        df = df.with_columns(nw.col(self.columns_name).str.to_lowercase())
+        df = df.with_columns(list(self._column_exprs().values()))
         return df
 
 
 class ToUpper(DataMorpher):
+    lazy_compatible = True
+    row_local = True
+
     class PyDanticValidator(BaseModel):
         columns_name: Union[str, List[str]] = Field(
             ..., description="Column(s) to convert to uppercase"
@@ -657,7 +1585,7 @@ class ToUpper(DataMorpher):
     def __init__(self, *, columns_name: Union[str, List[str]]):
         super().__init__()
         try:
-            self.config = self.PyDanticValidator(columns_name=columns_name)
+            self.config = self._validate_config(columns_name=columns_name)
             if isinstance(self.config.columns_name, str):
                 self.columns_name = [self.config.columns_name]  # Convert string to list
             else:
@@ -669,11 +1597,161 @@ class ToUpper(DataMorpher):
                 f"[{self.__class__.__name__}] Invalid config: {e}"
             ) from e
 
+    def _column_exprs(self) -> dict[str, nw.Expr]:
+        return {col: nw.col(col).str.to_uppercase() for col in self.columns_name}
+
+    def _columns_read(self) -> set[str]:
+        return set(self.columns_name)
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        for col in self.columns_name:
+            self._check_dtype(schema, col, _is_string, "a string type")
+        return schema
+
     @nw.narwhalify
     def _datamorph(self, df: IntoFrame) -> IntoFrame:
-        for col in self.columns_name:
-            df = df.with_columns(
-                nw.col(col).str.to_uppercase()
-            )  # Note the correction here (using `col` instead of `self.columns_name`)
+        df = df.with_columns(list(self._column_exprs().values()))
+        return df
+
+
+class _FileWriter(DataMorpher):
+    """
+    Base class of the DataMorphers writing the DataFrame to a file, which
+    return the DataFrame unchanged.
+
+    The file is written under a temporary name and moved to its path once
+    complete. With `run_pipeline_stream`, a writer ending the pipeline
+    appends each chunk to the file as soon as it is transformed, instead of
+    holding the whole result in memory.
+
+    Attributes:
+        path (str): The path of the file.
+    """
+
+    # The format of the files written
+    file_format: str
+
+    class PyDanticValidator(BaseModel):
+        path: str = Field(..., min_length=1, description="Path of the file to write.")
+
+    def __init__(self, **values: Any):
+        super().__init__()
+        try:
+            self.config = self._validate_config(**values)
+            self.path = self.config.path
+        except ValidationError as e:
+            raise DataMorpherError(
+                f"[{self.__class__.__name__}] Invalid config: {e}"
+            ) from e
+
+    def _writer_options(self) -> dict:
+        """Returns the keyword arguments of the PyArrow writer."""
+        return {}
+
+    def _open(self) -> "FrameWriter":
+        from datamorphers.io import FrameWriter
+
+        return FrameWriter(self.path, self.file_format, **self._writer_options())
+
+    def _write_stream(self, chunks: Iterator[IntoFrame]) -> Iterator[IntoFrame]:
+        """Appends each chunk to the file, and yields it once written."""
+        with self._open() as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+                yield chunk
+
+    def _cache_token(self) -> None:
+        # Skipping the step would skip writing the file
+        return None
+
+    def _transform_schema(self, schema: nw.Schema) -> nw.Schema:
+        return schema
 
+    def _datamorph(self, df: IntoFrame) -> IntoFrame:
+        """Writes the DataFrame to the file, and returns it unchanged."""
+        with self._open() as writer:
+            writer.write(df)
         return df
+
+
+class WriteIPC(_FileWriter):
+    """
+    Writes the DataFrame to an Arrow IPC (Feather v2) file.
+
+    Attributes:
+        path (str): The path of the file.
+        compression (str, optional): The compression of the buffers, "lz4"
+            or "zstd". Defaults to no compression, which lets readers
+            memory-map the file.
+
+    Example yaml config:
+        ```yaml
+        pipeline_WriteIPC:
+            - WriteIPC:
+                path: data/sales_clean.arrow
+                compression: zstd
+        ```
+    """
+
+    file_format = "ipc"
+
+    class PyDanticValidator(_FileWriter.PyDanticValidator):
+        compression: Optional[Literal["lz4", "zstd"]] = None
+
+    def __init__(self, *, path: str, compression: Optional[str] = None):
+        super().__init__(path=path, compression=compression)
+        self.compression = self.config.compression
+
+    def _writer_options(self) -> dict:
+        import pyarrow as pa
+
+        return {"options": pa.ipc.IpcWriteOptions(compression=self.compression)}
+
+
+class WriteParquet(_FileWriter):
+    """
+    Writes the DataFrame to a Parquet file.
+
+    Attributes:
+        path (str): The path of the file.
+        compression (str): The compression codec, one of "none", "snappy",
+            "gzip", "brotli", "lz4" and "zstd".
+        compression_level (int, optional): The compression level, for the
+            codecs supporting it. Defaults to the level of the codec.
+
+    Example yaml config:
+        ```yaml
+        pipeline_WriteParquet:
+            - WriteParquet:
+                path: data/sales_clean.parquet
+                compression: zstd
+                compression_level: 3
+        ```
+    """
+
+    file_format = "parquet"
+
+    class PyDanticValidator(_FileWriter.PyDanticValidator):
+        compression: Literal[
+            "none", "snappy", "gzip", "brotli", "lz4", "zstd"
+        ] = "snappy"
+        compression_level: Optional[int] = None
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        compression: str = "snappy",
+        compression_level: Optional[int] = None,
+    ):
+        super().__init__(
+            path=path, compression=compression, compression_level=compression_level
+        )
+        self.compression = self.config.compression
+        self.compression_level = self.config.compression_level
+
+    def _writer_options(self) -> dict:
+        return {
+            "compression": self.compression,
+            "compression_level": self.compression_level,
+        }
@@ -0,0 +1,278 @@
+import glob
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+
+import narwhals as nw
+
+from datamorphers import logger, parallel
+from datamorphers.io import SUPPORTED_FORMATS, read_frame, read_schema, write_frame
+from datamorphers.parallel import run_pipeline_parallel
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import compile_pipeline, log_pipeline_config
+from datamorphers.pushdown import filter_expression, required_columns
+
+__all__ = ["FileReport", "run_pipeline_dataset", "run_pipeline_file"]
+
+
+@dataclass
+class FileReport:
+    """
+    The outcome of running a pipeline on a single file.
+
+    Attributes:
+        input_path (str): The path of the input file.
+        output_path (str): The path of the output file.
+        rows_in (int): The number of rows read.
+        rows_out (int): The number of rows written.
+        seconds (float): The wall time spent reading, transforming and writing.
+    """
+
+    input_path: str
+    output_path: str
+    rows_in: int
+    rows_out: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of input rows processed per second."""
+        return self.rows_in / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+def run_pipeline_dataset(
+    source: str,
+    output_dir: str,
+    config: dict | Pipeline,
+    backend: str = "pandas",
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+    pushdown: bool = False,
+) -> list[FileReport]:
+    """
+    Runs the pipeline on every Parquet, CSV or Arrow IPC file of a dataset,
+    writing one output file per input file.
+
+    The configuration is compiled once and shared by all the files. Output
+    files keep the partition layout of the inputs: each file is written to
+    `output_dir`, at the same path relative to the source directory, and in
+    the same format.
+
+    Args:
+        source (str): A directory, scanned recursively, or a glob pattern.
+        output_dir (str): The directory where the output files are written.
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        backend (str, default "pandas"): The backend used to transform each
+            file, e.g. "pandas", "polars" or "pyarrow".
+        workers (int, optional): The number of worker processes. Defaults to
+            the number of CPUs. With a single worker, files are processed in
+            the current process.
+        max_in_flight (int, optional): The maximum number of files being
+            processed at the same time. Defaults to twice the number of workers.
+        pushdown (bool, default False): Whether to only read the source
+            columns needed by the pipeline, and to skip the rows discarded by
+            its leading FilterRows steps while reading. See
+            `datamorphers.pushdown.required_columns` and
+            `datamorphers.pushdown.filter_expression`.
+
+    Returns:
+        list[FileReport]: The report of each file, in input order.
+
+    Example Usage:
+        >>> config = get_pipeline_config("config.yaml", "pipeline_food")
+        >>> reports = run_pipeline_dataset("data/", "out/", config, workers=8)
+        >>> sum(r.rows_out for r in reports)
+    """
+    if isinstance(config, Pipeline):
+        pipeline = config
+    else:
+        log_pipeline_config(config)
+        pipeline = compile_pipeline(config)
+
+    columns = required_columns(pipeline) if pushdown else None
+    if columns is not None:
+        logger.info(f"Reading only the required columns: {columns}")
+
+    base_dir, input_paths = _list_files(source)
+    tasks = [
+        (
+            path,
+            os.path.join(output_dir, os.path.relpath(path, base_dir)),
+            columns,
+            pushdown,
+        )
+        for path in input_paths
+    ]
+    logger.info(f"Running pipeline '{pipeline.name}' on {len(tasks)} files.")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        reports = [_run_file(pipeline, *task, backend) for task in tasks]
+    else:
+        reports = _run_files_parallel(
+            pipeline, tasks, backend, workers, max_in_flight or 2 * workers
+        )
+
+    for report in reports:
+        logger.info(
+            f"{report.input_path}: {report.rows_in} rows in, "
+            f"{report.rows_out} rows out, {report.seconds:.3f}s "
+            f"({report.rows_per_second:,.0f} rows/s)."
+        )
+    return reports
+
+
+def run_pipeline_file(
+    input_path: str,
+    output_path: str,
+    config: dict | Pipeline,
+    backend: str = "pandas",
+    workers: int | None = None,
+    pushdown: bool = False,
+) -> FileReport:
+    """
+    Runs the pipeline on a single Parquet, CSV or Arrow IPC file.
+
+    Args:
+        input_path (str): The path of the input file.
+        output_path (str): The path of the output file. Its extension sets
+            the format.
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        backend (str, default "pandas"): The backend used to transform the
+            file, e.g. "pandas", "polars" or "pyarrow".
+        workers (int, optional): If given, the file is split into row
+            partitions, transformed by this many worker processes. Only
+            pipelines made of row-local DataMorphers can be run this way.
+        pushdown (bool, default False): Whether to only read the columns
+            needed by the pipeline, and to skip the rows discarded by its
+            leading FilterRows steps while reading.
+
+    Returns:
+        FileReport: The report of the file.
+
+    Example Usage:
+        >>> report = run_pipeline_file("in.parquet", "out.parquet", config)
+    """
+    if isinstance(config, Pipeline):
+        pipeline = config
+    else:
+        log_pipeline_config(config)
+        pipeline = compile_pipeline(config)
+
+    columns = required_columns(pipeline) if pushdown else None
+    return _run_file(
+        pipeline,
+        input_path,
+        output_path,
+        columns,
+        pushdown=pushdown,
+        backend=backend,
+        workers=workers,
+    )
+
+
+def _list_files(source: str) -> tuple[str, list[str]]:
+    """
+    Returns the base directory of the dataset and its supported files, sorted.
+    """
+    if os.path.isdir(source):
+        base_dir = source
+        paths = glob.glob(os.path.join(source, "**", "*"), recursive=True)
+    else:
+        base_dir = _glob_base_dir(source)
+        paths = glob.glob(source, recursive=True)
+
+    paths = sorted(
+        p
+        for p in paths
+        if os.path.isfile(p) and os.path.splitext(p)[1].lower() in SUPPORTED_FORMATS
+    )
+    return base_dir, paths
+
+
+def _glob_base_dir(pattern: str) -> str:
+    """Returns the longest directory of a glob pattern without wildcards."""
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def _run_files_parallel(
+    pipeline: Pipeline,
+    tasks: list[tuple[str, str, list[str] | None, bool]],
+    backend: str,
+    workers: int,
+    max_in_flight: int,
+) -> list[FileReport]:
+    """Runs the files on a process pool, with at most `max_in_flight` pending."""
+    reports: dict[int, FileReport] = {}
+    pending: dict[Future, int] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=parallel._init_worker, initargs=(pipeline,)
+    ) as executor:
+        for i, task in enumerate(tasks):
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    reports[pending.pop(future)] = future.result()
+            future = executor.submit(_run_worker_file, *task, backend)
+            pending[future] = i
+
+        for future in wait(pending).done:
+            reports[pending.pop(future)] = future.result()
+
+    return [reports[i] for i in range(len(tasks))]
+
+
+def _run_file(
+    pipeline: Pipeline,
+    input_path: str,
+    output_path: str,
+    columns: list[str] | None,
+    pushdown: bool,
+    backend: str,
+    workers: int | None = None,
+) -> FileReport:
+    """
+    Reads, transforms and writes a single file. If `workers` is given, the
+    file is transformed by that many worker processes.
+    """
+    start = time.perf_counter()
+    filters = filter_expression(pipeline, read_schema(input_path)) if pushdown else None
+    df = read_frame(input_path, backend=backend, columns=columns, filters=filters)
+    rows_in = len(nw.from_native(df, eager_only=True))
+    if workers is None:
+        df = pipeline(df)
+    else:
+        df = run_pipeline_parallel(df, pipeline, workers=workers)
+    rows_out = len(nw.from_native(df, eager_only=True))
+    write_frame(df, output_path)
+    return FileReport(
+        input_path=input_path,
+        output_path=output_path,
+        rows_in=rows_in,
+        rows_out=rows_out,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _run_worker_file(
+    input_path: str,
+    output_path: str,
+    columns: list[str] | None,
+    pushdown: bool,
+    backend: str,
+) -> FileReport:
+    """Runs the worker pipeline on a single file."""
+    return _run_file(
+        parallel._worker_pipeline, input_path, output_path, columns, pushdown, backend
+    )
@@ -0,0 +1,267 @@
+import os
+from typing import Iterator
+
+import narwhals as nw
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from narwhals.dependencies import is_pandas_dataframe
+from narwhals.typing import IntoFrame
+
+__all__ = [
+    "SUPPORTED_FORMATS",
+    "FrameWriter",
+    "infer_format",
+    "iter_frames",
+    "read_frame",
+    "read_schema",
+    "write_frame",
+]
+
+# File extensions and their format
+SUPPORTED_FORMATS = {
+    ".arrow": "ipc",
+    ".csv": "csv",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def infer_format(path: str) -> str:
+    """
+    Infers the file format from the extension of the path.
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported file extension '{extension}' for '{path}'. "
+            f"Supported extensions are: {list(SUPPORTED_FORMATS)}"
+        )
+    return SUPPORTED_FORMATS[extension]
+
+
+def read_frame(
+    path: str,
+    backend: str = "pandas",
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> IntoFrame:
+    """
+    Reads a Parquet, CSV or Arrow IPC file with PyArrow.
+
+    Args:
+        path (str): The path of the file.
+        backend (str, default "pandas"): The backend of the returned DataFrame,
+            e.g. "pandas", "polars" or "pyarrow".
+        columns (list[str], optional): The columns to read. Columns missing
+            from the file are ignored, and the file column order is kept.
+            Defaults to all the columns.
+        filters (pc.Expression, optional): A PyArrow filter expression. With
+            Parquet, row groups whose statistics do not match it are skipped
+            without being decoded. With other formats, rows are filtered
+            before being converted to the backend.
+
+    Returns:
+        nw.IntoFrame: The DataFrame.
+    """
+    file_format = infer_format(path)
+    if columns is not None:
+        columns = [col for col in read_schema(path).names if col in set(columns)]
+
+    if file_format == "parquet":
+        table = pq.read_table(path, columns=columns, filters=filters, partitioning=None)
+    else:
+        if file_format == "csv":
+            convert_options = pacsv.ConvertOptions(include_columns=columns)
+            table = pacsv.read_csv(path, convert_options=convert_options)
+        else:
+            table = feather.read_table(path, columns=columns, memory_map=True)
+        if filters is not None:
+            table = table.filter(filters)
+    return _from_arrow(table, backend)
+
+
+def iter_frames(
+    path: str,
+    chunk_size: int,
+    backend: str = "pandas",
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> Iterator[IntoFrame]:
+    """
+    Reads a Parquet, CSV or Arrow IPC file in chunks, so that only one chunk
+    is held in memory at a time.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The maximum number of rows of each chunk.
+        backend (str, default "pandas"): The backend of the returned DataFrames,
+            e.g. "pandas", "polars" or "pyarrow".
+        columns (list[str], optional): The columns to read, as in `read_frame`.
+        filters (pc.Expression, optional): A PyArrow filter expression, as in
+            `read_frame`.
+
+    Returns:
+        Iterator[nw.IntoFrame]: The chunks, in file order. A file without any
+            matching row yields a single empty chunk.
+    """
+    dataset = ds.dataset(path, format=infer_format(path))
+    if columns is not None:
+        columns = [col for col in dataset.schema.names if col in set(columns)]
+    return _scan(dataset, chunk_size, backend, columns, filters)
+
+
+def _scan(
+    dataset: ds.Dataset,
+    chunk_size: int | None,
+    backend: str,
+    columns: list[str] | None,
+    filters: pc.Expression | None,
+) -> Iterator[IntoFrame]:
+    """Reads the dataset in chunks. See `iter_frames`."""
+    options = {} if chunk_size is None else {"batch_size": chunk_size}
+    scanner = dataset.scanner(columns=columns, filter=filters, **options)
+
+    empty = True
+    for batch in scanner.to_batches():
+        # Batches of row groups discarded by the filters are empty
+        if batch.num_rows > 0:
+            empty = False
+            yield _from_arrow(pa.Table.from_batches([batch]), backend)
+    if empty:
+        yield _from_arrow(scanner.projected_schema.empty_table(), backend)
+
+
+def read_schema(path: str) -> pa.Schema:
+    """Reads the schema of a Parquet, CSV or Arrow IPC file, without its data."""
+    file_format = infer_format(path)
+    if file_format == "parquet":
+        return pq.read_schema(path)
+    elif file_format == "csv":
+        # Only the first block of the file is read to infer the schema
+        with pacsv.open_csv(path) as reader:
+            return reader.schema
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def write_frame(df: IntoFrame, path: str) -> None:
+    """
+    Writes a DataFrame to a Parquet, CSV or Arrow IPC file, creating the
+    parent directories if needed.
+
+    Args:
+        df (nw.IntoFrame): The DataFrame to write.
+        path (str): The path of the file. Its extension sets the format.
+    """
+    file_format = infer_format(path)
+    table = _to_arrow(df)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if file_format == "parquet":
+        pq.write_table(table, path)
+    elif file_format == "csv":
+        pacsv.write_csv(table, path)
+    else:
+        feather.write_feather(table, path)
+
+
+class FrameWriter:
+    """
+    Writes DataFrames one after the other to a single Parquet, CSV or Arrow
+    IPC file, without holding them in memory.
+
+    The schema of the file is the one of the first DataFrame: the following
+    ones are cast to it. The file is written under a temporary name and
+    moved to its path when the writer is closed, so that readers never see a
+    partially written file, and the file is not created if writing fails.
+
+    Attributes:
+        path (str): The path of the file.
+        format (str): The format of the file, "parquet", "csv" or "ipc".
+            Defaults to the format of the extension of the path.
+        options (dict): Keyword arguments of the PyArrow writer of the
+            format, e.g. `compression` for Parquet.
+        rows (int): The number of rows written so far.
+
+    Example Usage:
+        >>> with FrameWriter("out.parquet") as writer:
+        ...     for df in run_pipeline_stream(chunks, config):
+        ...         writer.write(df)
+    """
+
+    def __init__(self, path: str, file_format: str | None = None, **options):
+        self.path = path
+        self.format = file_format or infer_format(path)
+        self.options = options
+        self.rows = 0
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._schema = None
+        self._writer = None
+
+    def write(self, df: IntoFrame) -> None:
+        """Appends the DataFrame to the file."""
+        table = _to_arrow(df)
+        if self._writer is None:
+            self._open(table.schema)
+        elif table.schema != self._schema:
+            # e.g. pandas infers the type of each chunk from its values
+            table = table.cast(self._schema)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self) -> None:
+        """Finishes writing the file, and moves it to its path."""
+        if self._writer is None:
+            raise ValueError(f"No DataFrame was written to '{self.path}'.")
+        self._writer.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discards the partially written file."""
+        if self._writer is not None:
+            self._writer.close()
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open(self, schema: pa.Schema) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if self.format == "parquet":
+            self._writer = pq.ParquetWriter(self._tmp_path, schema, **self.options)
+        elif self.format == "csv":
+            self._writer = pacsv.CSVWriter(self._tmp_path, schema, **self.options)
+        else:
+            self._writer = pa.ipc.new_file(self._tmp_path, schema, **self.options)
+        self._schema = schema
+
+
+def _from_arrow(table: pa.Table, backend: str) -> IntoFrame:
+    """Converts a PyArrow Table to a native DataFrame of the given backend."""
+    if backend == "pyarrow":
+        return table
+    return nw.from_arrow(table, backend=backend).to_native()
+
+
+def _to_arrow(df: IntoFrame) -> pa.Table:
+    """Converts a native DataFrame to a PyArrow Table."""
+    if isinstance(df, pa.Table):
+        return df
+    if is_pandas_dataframe(df):
+        # The index is not part of the data written to files
+        return pa.Table.from_pandas(df, preserve_index=False)
+    return nw.from_native(df, eager_only=True).to_arrow()
@@ -0,0 +1,82 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import narwhals as nw
+from narwhals.typing import IntoFrame
+
+from datamorphers import logger
+from datamorphers.pipeline import Pipeline
+
+__all__ = ["run_pipeline_parallel"]
+
+# The pipeline run by the current worker process, set by `_init_worker`
+_worker_pipeline: Pipeline | None = None
+
+
+def run_pipeline_parallel(
+    df: IntoFrame, pipeline: Pipeline, workers: int, lazy: bool = False
+) -> IntoFrame:
+    """
+    Splits the DataFrame into contiguous row partitions, runs the pipeline on
+    each partition in a pool of worker processes, and concatenates the
+    results in the original order.
+
+    The pipeline is sent once to each worker, rather than once per partition.
+    Only pipelines made of row-local DataMorphers can be run this way, as
+    every partition is transformed independently.
+
+    Args:
+        df (nw.IntoFrame): The input DataFrame to be transformed.
+        pipeline (Pipeline): The compiled pipeline.
+        workers (int): The number of worker processes.
+        lazy (bool, default False): Whether each worker runs the pipeline lazily.
+
+    Returns:
+        nw.IntoFrame: The transformed DataFrame.
+
+    Raises:
+        ValueError: If the pipeline contains steps that are not row-local.
+    """
+    global_steps = [cls for cls, dm in pipeline.steps if not dm.row_local]
+    if global_steps:
+        raise ValueError(
+            f"Pipeline '{pipeline.name}' cannot be run in parallel, as the "
+            f"following steps need the whole dataset: {global_steps}"
+        )
+
+    frame = nw.from_native(df, eager_only=True)
+    n_rows = len(frame)
+    if workers <= 1 or n_rows <= 1:
+        return pipeline(df, lazy=lazy)
+
+    partition_size = math.ceil(n_rows / workers)
+    partitions = [
+        nw.to_native(frame[start : start + partition_size])
+        for start in range(0, n_rows, partition_size)
+    ]
+    logger.debug(
+        f"Running pipeline '{pipeline.name}' on {len(partitions)} partitions "
+        f"of {partition_size} rows."
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=len(partitions),
+        initializer=_init_worker,
+        initargs=(pipeline,),
+    ) as executor:
+        results = list(
+            executor.map(_run_partition, partitions, [lazy] * len(partitions))
+        )
+
+    return nw.to_native(nw.concat([nw.from_native(r) for r in results]))
+
+
+def _init_worker(pipeline: Pipeline):
+    """Stores the pipeline in the worker process."""
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _run_partition(df: IntoFrame, lazy: bool) -> IntoFrame:
+    """Runs the worker pipeline on a partition."""
+    return _worker_pipeline(df, lazy=lazy)
@@ -0,0 +1,256 @@
+import logging
+
+import narwhals as nw
+from narwhals.typing import IntoFrame
+
+from datamorphers.base import DataMorpher
+from datamorphers.cache import (
+    StepCache,
+    _chain_key,
+    _from_table,
+    _native_namespace,
+    _to_table,
+    fingerprint,
+)
+
+__all__ = ["Pipeline"]
+
+
+class Pipeline:
+    """
+    A compiled, reusable pipeline.
+
+    Each DataMorpher is resolved, validated and instantiated once when the
+    pipeline is compiled, so calling the pipeline only applies the
+    transformations. Use `datamorphers.pipeline_loader.compile_pipeline`
+    to build a Pipeline from a configuration.
+
+    Adjacent steps that only add or replace columns (e.g. CreateColumn,
+    ColumnsOperator, FillNA, ToUpper) are fused into a single `with_columns`
+    call, as long as no step reads a column written by a previous step of
+    the same group. On pandas, this avoids copying the frame at every step.
+
+    Attributes:
+        name (str): The name of the pipeline.
+        steps (list[tuple[str, DataMorpher]]): The DataMorpher names and
+            their instances, in execution order.
+        stages (list[tuple[str, DataMorpher]]): The steps actually executed,
+            after fusion.
+
+    Example Usage:
+        >>> pipeline = compile_pipeline(config)
+        >>> for df in frames:
+        ...     df_transformed = pipeline(df)
+    """
+
+    def __init__(
+        self, name: str, steps: list[tuple[str, DataMorpher]], fuse: bool = True
+    ):
+        self.name = name
+        self.steps = steps
+        self.fuse = fuse
+        self.stages = _push_into_reader(
+            _fuse_steps(steps) if fuse else list(steps), steps
+        )
+
+    def __call__(
+        self, df: IntoFrame, lazy: bool = False, cache: StepCache | None = None
+    ) -> IntoFrame:
+        """
+        Runs the compiled pipeline on the DataFrame.
+
+        Args:
+            df (nw.IntoFrame): The input DataFrame to be transformed. May be
+                None if the pipeline starts by reading a file.
+            lazy (bool, default False): Whether to convert the input to a
+                LazyFrame once, chain every step lazily and collect only at
+                the end. Steps that are not `lazy_compatible` collect the
+                frame before being applied.
+            cache (StepCache, optional): If given, the output of every step
+                is stored in the cache, and the longest prefix of steps whose
+                output is already cached is skipped.
+
+        Returns:
+            nw.IntoFrame: The transformed DataFrame.
+        """
+        if cache is not None:
+            if lazy:
+                raise ValueError("The step cache is not supported in lazy mode.")
+            return self._run_cached(df, cache)
+
+        logger = logging.getLogger("datamorphers")
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        if lazy:
+            df = _to_lazy(df)
+
+        for cls, datamorpher in self.stages:
+            # Transform the DataFrame
+            df = _apply_stage(cls, datamorpher, df, lazy=lazy)
+
+            # Log the shape of the DataFrame after each transformation
+            if debug and not lazy:
+                logger.debug(f"DataFrame shape after {cls}: {df.shape}")
+
+        if lazy:
+            df = _collect(df)
+
+        return df
+
+    def _run_cached(self, df: IntoFrame, cache: StepCache) -> IntoFrame:
+        """Runs the pipeline, reusing the cached outputs of its first stages."""
+        logger = logging.getLogger("datamorphers")
+
+        # The key of each stage output chains the keys of the previous ones,
+        # until a stage that cannot be cached.
+        keys: list[str | None] = []
+        key = None if df is None else fingerprint(df)
+        for _, datamorpher in self.stages:
+            tokens = [dm._cache_token() for dm in _stage_datamorphers(datamorpher)]
+            key = None if key is None or None in tokens else _chain_key(key, tokens)
+            keys.append(key)
+
+        start = 0
+        for i in reversed(range(len(keys))):
+            table = None if keys[i] is None else cache.get(keys[i])
+            if table is not None:
+                logger.info(
+                    f"Reusing the cached output of {i + 1} of {len(self.stages)} steps."
+                )
+                df, start = _from_table(table, _native_namespace(df)), i + 1
+                break
+
+        for (cls, datamorpher), key in zip(self.stages[start:], keys[start:]):
+            df = _apply_stage(cls, datamorpher, df, lazy=False)
+            if key is not None:
+                cache.put(key, _to_table(df))
+
+        return df
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getstate__(self) -> dict:
+        # Fused stages hold narwhals expressions, which cannot be pickled:
+        # they are rebuilt from the steps when unpickling.
+        return {"name": self.name, "steps": self.steps, "fuse": self.fuse}
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)
+
+    def __repr__(self) -> str:
+        steps = ", ".join(cls for cls, _ in self.steps)
+        return f"Pipeline(name={self.name!r}, steps=[{steps}])"
+
+
+def _apply_stage(
+    cls: str, datamorpher: DataMorpher, df: IntoFrame, lazy: bool
+) -> IntoFrame:
+    """Applies a stage of the pipeline to the DataFrame."""
+    if lazy and not datamorpher.lazy_compatible:
+        # Materialize only for the steps that need an eager DataFrame
+        logging.getLogger("datamorphers").debug(
+            f"Collecting the LazyFrame before {cls}."
+        )
+        return _to_lazy(datamorpher._datamorph(_collect(df)))
+    return datamorpher._datamorph(df)
+
+
+def _stage_datamorphers(datamorpher: DataMorpher) -> list[DataMorpher]:
+    """Returns the DataMorphers applied by a stage, which may be fused."""
+    if isinstance(datamorpher, _FusedColumns):
+        return datamorpher.datamorphers
+    return [datamorpher]
+
+
+def _to_lazy(df: IntoFrame) -> IntoFrame:
+    """Converts a native DataFrame to its native lazy counterpart."""
+    if df is None:
+        # The pipeline starts by reading a file
+        return df
+    frame = nw.from_native(df)
+    if isinstance(frame, nw.DataFrame):
+        frame = frame.lazy()
+    return nw.to_native(frame)
+
+
+def _collect(df: IntoFrame) -> IntoFrame:
+    """Collects a native LazyFrame into its native eager counterpart."""
+    if df is None:
+        return df
+    frame = nw.from_native(df)
+    if isinstance(frame, nw.LazyFrame):
+        frame = frame.collect()
+    return nw.to_native(frame)
+
+
+class _FusedColumns:
+    """Applies the column expressions of several DataMorphers at once."""
+
+    def __init__(self, datamorphers: list[DataMorpher]):
+        self.datamorphers = datamorphers
+        self.exprs = [
+            expr for dm in datamorphers for expr in dm._column_exprs().values()
+        ]
+        self.lazy_compatible = all(dm.lazy_compatible for dm in datamorphers)
+        self.row_local = all(dm.row_local for dm in datamorphers)
+
+    @nw.narwhalify
+    def _datamorph(self, df: IntoFrame) -> IntoFrame:
+        return df.with_columns(self.exprs)
+
+
+def _push_into_reader(
+    stages: list[tuple[str, DataMorpher | _FusedColumns]],
+    steps: list[tuple[str, DataMorpher]],
+) -> list[tuple[str, DataMorpher | _FusedColumns]]:
+    """
+    Lets a step reading a file at the start of the pipeline skip the columns
+    and rows that the next steps do not need.
+    """
+    if not stages or not callable(getattr(stages[0][1], "_pushdown", None)):
+        return stages
+    # Readers are never fused, so that the first stage is the first step
+    cls, reader = stages[0]
+    return [(cls, reader._pushdown(steps[1:])), *stages[1:]]
+
+
+def _fuse_steps(
+    steps: list[tuple[str, DataMorpher]],
+) -> list[tuple[str, DataMorpher | _FusedColumns]]:
+    """
+    Groups adjacent column-producing steps, so that each group is applied
+    with a single `with_columns` call.
+
+    A step starts a new group if it reads or writes a column that is written
+    by a previous step of the current group.
+    """
+    stages = []
+    group: list[tuple[str, DataMorpher]] = []
+    written: set[str] = set()
+
+    def _flush():
+        if len(group) == 1:
+            stages.append(group[0])
+        elif group:
+            name = "+".join(cls for cls, _ in group)
+            stages.append((name, _FusedColumns([dm for _, dm in group])))
+        group.clear()
+        written.clear()
+
+    for cls, datamorpher in steps:
+        exprs = datamorpher._column_exprs()
+        read = datamorpher._columns_read()
+        if exprs is None or read is None:
+            _flush()
+            stages.append((cls, datamorpher))
+            continue
+
+        if written & (read | exprs.keys()):
+            _flush()
+
+        group.append((cls, datamorpher))
+        written.update(exprs)
+
+    _flush()
+    return stages
@@ -1,14 +1,25 @@
-import inspect
+import hashlib
+import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-import pandas as pd
 import yaml
-from narwhals.typing import IntoFrame
 
-import datamorphers.datamorphers as datamorphers
-from datamorphers import custom_datamorphers, logger
-from datamorphers.base import DataMorpher
+from datamorphers import logger
+from datamorphers.registry import parameter_spec, resolve
+
+# The key of a frozen configuration holding the digest of its steps
+DIGEST_KEY = "digest"
+
+# The DataMorphers and the execution modules import narwhals, pydantic,
+# pandas and pyarrow: they are imported when first needed, so that importing
+# this module stays fast.
+if TYPE_CHECKING:
+    from narwhals.typing import IntoFrame
+
+    from datamorphers.cache import StepCache
+    from datamorphers.pipeline import Pipeline
+    from datamorphers.profiling import PipelineReport
 
 
 def get_pipeline_config(yaml_path: str, pipeline_name: str, **kwargs: dict) -> dict:
@@ -66,36 +77,20 @@ def validate_pipeline_config(config: dict):
             raise ValueError(f"Invalid pipeline step format: {step}")
 
         # Check if the DataMorpher class exists
-        module = (
-            custom_datamorphers
-            if hasattr(custom_datamorphers, cls)
-            else datamorphers
-            if hasattr(datamorphers, cls)
-            else None
-        )
-        if not module:
+        datamorpher_cls = resolve(cls)
+        if datamorpher_cls is None:
             raise ValueError(f"Unknown DataMorpher: {cls}")
 
-        datamorpher_cls = getattr(module, cls)
-
-        # Get all parameters from the __init__ method
-        signature = inspect.signature(datamorpher_cls.__init__)
-        defined_args = [param for param in signature.parameters if param != "self"]
-
-        # Required arguments (without default values)
-        required_args = [
-            param
-            for param, details in signature.parameters.items()
-            if details.default == inspect.Parameter.empty and param != "self"
-        ]
+        # Get the parameters of the __init__ method, computed once per class
+        spec = parameter_spec(datamorpher_cls)
 
         # Check for missing arguments
-        missing_args = [arg for arg in required_args if arg not in args]
+        missing_args = [arg for arg in spec.required if arg not in args]
         if missing_args:
             raise ValueError(f"Missing required arguments for {cls}: {missing_args}")
 
         # Check for unexpected (extra) arguments
-        extra_args = [arg for arg in args if arg not in defined_args]
+        extra_args = [arg for arg in args if arg not in spec.parameters]
         if extra_args:
             raise ValueError(f"Unexpected arguments for {cls}: {extra_args}")
 
@@ -124,18 +119,140 @@ def log_pipeline_config(config: dict):
             logger.info(f"{4 * ' '}{arg}: {value}")
 
 
-def run_pipeline(df: IntoFrame, config: Any, debug: bool = False) -> IntoFrame:
+def freeze_pipeline_config(config: dict) -> dict:
+    """
+    Validates the pipeline configuration once, and returns its validated form.
+
+    Every DataMorpher is built and validated, and its arguments are replaced
+    by its validated configuration, including default values. A digest of
+    the steps is added, so that the frozen configuration can later be built
+    with `trusted=True`, skipping validation (e.g. validate at deploy time,
+    and build in the serving path).
+
+    Args:
+        config (dict): The pipeline configuration dictionary.
+
+    Returns:
+        dict: The frozen configuration, which can be serialized along with
+            the values of the configuration (e.g. as JSON or YAML).
+
+    Raises:
+        ValueError: If the configuration is invalid.
+        DataMorpherError: If the configuration of a DataMorpher is invalid.
+
+    Example Usage:
+        >>> frozen = freeze_pipeline_config(config)
+        >>> pipeline = compile_pipeline(frozen, trusted=True)
+    """
+    pipeline = compile_pipeline(config, fuse=False)
+
+    steps = []
+    for cls, datamorpher in pipeline.steps:
+        args = datamorpher.config.model_dump()
+        # Keep the original arguments of DataMorphers whose configuration
+        # fields are not their arguments
+        if not args.keys() <= parameter_spec(type(datamorpher)).parameters:
+            step = config[config["pipeline_name"]][len(steps)]
+            args = step[cls] if isinstance(step, dict) else {}
+        steps.append({cls: args})
+
+    frozen = {"pipeline_name": pipeline.name, pipeline.name: steps}
+    frozen[DIGEST_KEY] = _config_digest(frozen)
+    return frozen
+
+
+def compile_pipeline(
+    config: dict, fuse: bool = True, trusted: bool = False
+) -> "Pipeline":
+    """
+    Compiles the pipeline configuration into a reusable Pipeline.
+
+    The configuration is validated, and every DataMorpher is resolved and
+    instantiated only once. The returned Pipeline can then be called on
+    any number of DataFrames without paying this overhead again.
+
+    Args:
+        config (dict): The pipeline configuration dictionary.
+        fuse (bool, default True): Whether to fuse adjacent column-producing
+            steps into a single `with_columns` call.
+        trusted (bool, default False): Whether the configuration was frozen by
+            `freeze_pipeline_config`. If True, the DataMorphers are built
+            without validating their configuration again.
+
+    Returns:
+        Pipeline: The compiled pipeline.
+
+    Raises:
+        ValueError: If `trusted` is True and the configuration was not frozen,
+            or was modified since.
+
+    Example Usage:
+        >>> pipeline = compile_pipeline(config)
+        >>> df_transformed = pipeline(df)
+    """
+    if trusted:
+        return _build_trusted_pipeline(config, fuse=fuse)
+    validate_pipeline_config(config)
+    return _build_pipeline(config, fuse=fuse)
+
+
+def run_pipeline(
+    df: "IntoFrame",
+    config: Any,
+    debug: bool = False,
+    lazy: bool = False,
+    workers: int | None = None,
+    profile: bool = False,
+    cache: "StepCache | None" = None,
+    storage: dict[str, Any] | None = None,
+    trusted: bool = False,
+) -> "IntoFrame | tuple[IntoFrame, PipelineReport]":
     """
     Runs the pipeline on the DataFrame.
 
     Args:
-        df (nw.IntoFrame): The input DataFrame to be transformed.
+        df (nw.IntoFrame): The input DataFrame to be transformed. May be None
+            if the pipeline starts by reading a file, e.g. with ReadParquet.
         config (Any): The pipeline configuration.
         debug (bool, default False): Whether to log additional debugging messages.
+        lazy (bool, default False): Whether to convert the input to a LazyFrame
+            once, chain every step lazily and collect only at the end. Steps that
+            are not `lazy_compatible` collect the frame before being applied.
+        workers (int, optional): If given, the DataFrame is split into row
+            partitions, transformed by this many worker processes. Only
+            pipelines made of row-local DataMorphers can be run this way.
+        profile (bool, default False): Whether to measure the wall time, CPU
+            time, rows, columns and memory of every step. If True, a
+            PipelineReport is returned along with the transformed DataFrame.
+        cache (StepCache, optional): If given, the output of every step is
+            cached on disk, and a later run sharing the same input and first
+            steps reuses their output instead of recomputing it.
+        storage (dict, optional): Objects available to the DataMorphers of
+            this run only, e.g. the DataFrames joined by MergeDataFrames. They
+            are set in a `dms.scope`, on top of the global storage.
+        trusted (bool, default False): Whether the configuration was frozen by
+            `freeze_pipeline_config`, so that the DataMorphers are built
+            without validating their configuration again.
 
     Returns:
-        nw.IntoFrame: The transformed DataFrame.
+        nw.IntoFrame | tuple[nw.IntoFrame, PipelineReport]: The transformed
+            DataFrame, and the report if `profile` is True.
     """
+    if storage is not None:
+        from datamorphers.storage import dms
+
+        with dms.scope(storage):
+            return run_pipeline(
+                df,
+                config,
+                debug=debug,
+                lazy=lazy,
+                workers=workers,
+                profile=profile,
+                cache=cache,
+                trusted=trusted,
+            )
+
     # Get the custom logger
     logger = logging.getLogger("datamorphers")
 
@@ -145,21 +262,107 @@ def run_pipeline(df: IntoFrame, config: Any, debug: bool = False) -> IntoFrame:
     # Display pipeline configuration
     log_pipeline_config(config)
 
-    # Process each step in the pipeline
+    if trusted:
+        pipeline = _build_trusted_pipeline(config)
+    else:
+        pipeline = _build_pipeline(config)
+
+    if profile:
+        if workers is not None:
+            raise ValueError("Profiling is not supported with multiple workers.")
+        if cache is not None:
+            raise ValueError("Profiling is not supported with the step cache.")
+        from datamorphers.profiling import profile_pipeline
+
+        return profile_pipeline(pipeline, df, lazy=lazy)
+
+    if workers is not None:
+        if cache is not None:
+            raise ValueError("The step cache is not supported with multiple workers.")
+        from datamorphers.parallel import run_pipeline_parallel
+
+        return run_pipeline_parallel(df, pipeline, workers=workers, lazy=lazy)
+
+    return pipeline(df, lazy=lazy, cache=cache)
+
+
+def run_pipeline_many(
+    frames: "Iterable[IntoFrame]", config: Any, debug: bool = False
+) -> "list[IntoFrame]":
+    """
+    Runs the pipeline on many DataFrames, e.g. thousands of small ones.
+
+    The configuration is logged and the pipeline is built only once. The
+    DataFrames are then concatenated and transformed at once, as if the
+    pipeline was run on each of them: steps that need the whole dataset
+    (e.g. NormalizeColumn, Rolling, DropDuplicates) are applied to the rows
+    of each DataFrame separately. If a step cannot be applied this way, or
+    if the DataFrames do not share the same schema, they are transformed one
+    by one.
+
+    Args:
+        frames (Iterable[nw.IntoFrame]): The input DataFrames.
+        config (Any): The pipeline configuration.
+        debug (bool, default False): Whether to log additional debugging messages.
+
+    Returns:
+        list[nw.IntoFrame]: The transformed DataFrames, in the input order.
+
+    Example Usage:
+        >>> results = run_pipeline_many(frames, config)
+    """
+    logger = logging.getLogger("datamorphers")
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    log_pipeline_config(config)
+
+    from datamorphers.batching import run_pipeline_batched
+
+    return run_pipeline_batched(frames, _build_pipeline(config))
+
+
+def _build_pipeline(config: dict, fuse: bool = True) -> "Pipeline":
+    """Resolves and instantiates every DataMorpher of the pipeline."""
+    from datamorphers.pipeline import Pipeline
+
+    steps = []
     for step in config[config["pipeline_name"]]:
         cls, args = list(step.items())[0] if isinstance(step, dict) else (step, {})
 
         # Get the DataMorpher class
-        module = getattr(custom_datamorphers, cls, None) or getattr(datamorphers, cls)
-        datamorpher_cls: DataMorpher = module
+        datamorpher_cls = resolve(cls)
+        if datamorpher_cls is None:
+            raise ValueError(f"Unknown DataMorpher: {cls}")
 
         # Instantiate the DataMorpher object
-        datamorpher: DataMorpher = datamorpher_cls(**args)
+        steps.append((cls, datamorpher_cls(**args)))
 
-        # Transform the DataFrame
-        df = datamorpher._datamorph(df)
+    return Pipeline(name=config["pipeline_name"], steps=steps, fuse=fuse)
 
-        # Log the shape of the DataFrame after each transformation
-        logger.debug(f"DataFrame shape after {cls}: {df.shape}")
 
-    return df
+def _build_trusted_pipeline(config: dict, fuse: bool = True) -> "Pipeline":
+    """
+    Builds a pipeline from a frozen configuration, without validating the
+    configuration of its DataMorphers.
+    """
+    from datamorphers.base import _trusted_construction
+
+    if config.get(DIGEST_KEY) != _config_digest(config):
+        raise ValueError(
+            f"Pipeline '{config['pipeline_name']}' cannot be built as trusted: "
+            "its configuration was not frozen by `freeze_pipeline_config`, "
+            "or was modified since."
+        )
+    with _trusted_construction():
+        return _build_pipeline(config, fuse=fuse)
+
+
+def _config_digest(config: dict) -> str:
+    """Returns a hash of the name and steps of the pipeline configuration."""
+    name = config["pipeline_name"]
+    content = json.dumps(
+        {"pipeline_name": name, name: config.get(name, [])},
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
@@ -0,0 +1,166 @@
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+
+import narwhals as nw
+from narwhals.typing import IntoFrame
+
+from datamorphers.pipeline import Pipeline, _apply_stage, _collect, _to_lazy
+
+__all__ = ["PipelineReport", "StepProfile", "profile_pipeline"]
+
+
+@dataclass
+class StepProfile:
+    """
+    The resources used by a single step of a pipeline.
+
+    Fused steps are profiled together, and their names are joined by "+".
+    Row counts and memory estimates are None when the step produced a
+    LazyFrame, which has no data until it is collected.
+
+    Attributes:
+        name (str): The name of the DataMorpher(s).
+        wall_time (float): The elapsed time, in seconds.
+        cpu_time (float): The CPU time of the current process, in seconds.
+        rows_in (int | None): The number of input rows.
+        rows_out (int | None): The number of output rows.
+        columns_out (int): The number of output columns.
+        estimated_bytes (int | None): The estimated size of the output frame.
+        peak_allocated_bytes (int): The peak memory allocated by Python and
+            NumPy during the step, as traced by `tracemalloc`.
+    """
+
+    name: str
+    wall_time: float
+    cpu_time: float
+    rows_in: int | None
+    rows_out: int | None
+    columns_out: int
+    estimated_bytes: int | None
+    peak_allocated_bytes: int
+
+
+@dataclass
+class PipelineReport:
+    """
+    The resources used by each step of a pipeline run, with totals.
+
+    Example Usage:
+        >>> df, report = run_pipeline(df, config, profile=True)
+        >>> max(report.steps, key=lambda step: step.wall_time).name
+        >>> report.to_json("report.json")
+    """
+
+    pipeline_name: str
+    steps: list[StepProfile] = field(default_factory=list)
+
+    @property
+    def total_wall_time(self) -> float:
+        return sum(step.wall_time for step in self.steps)
+
+    @property
+    def total_cpu_time(self) -> float:
+        return sum(step.cpu_time for step in self.steps)
+
+    @property
+    def peak_allocated_bytes(self) -> int:
+        return max((step.peak_allocated_bytes for step in self.steps), default=0)
+
+    def to_dict(self) -> dict:
+        return {
+            "pipeline_name": self.pipeline_name,
+            "steps": [asdict(step) for step in self.steps],
+            "total_wall_time": self.total_wall_time,
+            "total_cpu_time": self.total_cpu_time,
+            "peak_allocated_bytes": self.peak_allocated_bytes,
+        }
+
+    def to_json(self, path: str | None = None) -> str:
+        """Serializes the report to JSON, writing it to `path` if given."""
+        content = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(content)
+        return content
+
+
+def profile_pipeline(
+    pipeline: Pipeline, df: IntoFrame, lazy: bool = False
+) -> tuple[IntoFrame, PipelineReport]:
+    """
+    Runs the compiled pipeline on the DataFrame, measuring every step.
+
+    Args:
+        pipeline (Pipeline): The compiled pipeline.
+        df (nw.IntoFrame): The input DataFrame to be transformed.
+        lazy (bool, default False): Whether to run the pipeline lazily. In this
+            case, the final collection is reported as a separate step.
+
+    Returns:
+        tuple[nw.IntoFrame, PipelineReport]: The transformed DataFrame and
+            the report.
+    """
+    report = PipelineReport(pipeline_name=pipeline.name)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    try:
+        if lazy:
+            df = _to_lazy(df)
+
+        for cls, datamorpher in pipeline.stages:
+            df, step = _profile_step(
+                cls, lambda df: _apply_stage(cls, datamorpher, df, lazy=lazy), df
+            )
+            report.steps.append(step)
+
+        if lazy:
+            df, step = _profile_step("collect", _collect, df)
+            report.steps.append(step)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    return df, report
+
+
+def _profile_step(name: str, func, df: IntoFrame) -> tuple[IntoFrame, StepProfile]:
+    """Applies `func` to the DataFrame, measuring its resource usage."""
+    rows_in, _, _ = _measure(df)
+
+    tracemalloc.reset_peak()
+    allocated_before, _ = tracemalloc.get_traced_memory()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    df = func(df)
+
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+
+    rows_out, columns_out, estimated_bytes = _measure(df)
+    return df, StepProfile(
+        name=name,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        rows_in=rows_in,
+        rows_out=rows_out,
+        columns_out=columns_out,
+        estimated_bytes=estimated_bytes,
+        peak_allocated_bytes=max(peak - allocated_before, 0),
+    )
+
+
+def _measure(df: IntoFrame) -> tuple[int | None, int, int | None]:
+    """Returns the number of rows and columns, and the estimated size in bytes."""
+    if df is None:
+        # The pipeline starts by reading a file
+        return None, 0, None
+    frame = nw.from_native(df)
+    if isinstance(frame, nw.LazyFrame):
+        return None, len(frame.collect_schema()), None
+    return len(frame), len(frame.columns), int(frame.estimated_size(unit="b"))
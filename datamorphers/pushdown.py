@@ -0,0 +1,130 @@
+import operator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from datamorphers.base import DataMorpher
+from datamorphers.datamorphers import FilterRows
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import compile_pipeline
+
+__all__ = ["filter_expression", "required_columns"]
+
+
+def required_columns(
+    config: dict | Pipeline, final_columns: list[str] | None = None
+) -> list[str] | None:
+    """
+    Computes the minimal set of source columns needed to run the pipeline.
+
+    The steps are walked backwards, starting from the columns needed in the
+    output: each DataMorpher tells which columns it needs, given the ones
+    needed after it (e.g. SelectColumns only needs the selected columns,
+    ColumnsOperator needs its two input columns but not its output column).
+    Columns that do not exist in the source can be safely ignored by readers:
+    e.g. the string literals compared by FilterRows are reported as possible
+    columns.
+
+    Args:
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        final_columns (list[str], optional): The columns needed in the output
+            of the pipeline. Defaults to all of them.
+
+    Returns:
+        list[str] | None: The sorted names of the required source columns,
+            or None if all the source columns may be needed (e.g. if the
+            pipeline keeps every column, or contains custom DataMorphers).
+
+    Example Usage:
+        >>> # pipeline_food keeps all the source columns
+        >>> required_columns(config) is None
+        True
+        >>> required_columns(config, final_columns=["item", "discounted_price"])
+        ['discount_pct', 'food', 'item', 'item_type', 'price']
+    """
+    pipeline = config if isinstance(config, Pipeline) else compile_pipeline(config)
+    return _required_columns(pipeline.steps, final_columns)
+
+
+def filter_expression(
+    config: dict | Pipeline, schema: pa.Schema
+) -> pc.Expression | None:
+    """
+    Translates the FilterRows steps at the start of the pipeline into a
+    PyArrow filter expression, to be applied while reading a file.
+
+    Only comparisons between a column and a literal value of a compatible
+    type are translated. The FilterRows steps are kept in the pipeline, so
+    filtering rows while reading only saves work and never changes results.
+
+    Args:
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        schema (pa.Schema): The schema of the file to read, used to tell
+            column names from literal values.
+
+    Returns:
+        pc.Expression | None: The conjunction of the translated filters, or
+            None if no filter can be translated.
+
+    Example Usage:
+        >>> expression = filter_expression(config, pq.read_schema(path))
+        >>> table = pq.read_table(path, filters=expression)
+    """
+    pipeline = config if isinstance(config, Pipeline) else compile_pipeline(config)
+    return _filter_expression(pipeline.steps, schema)
+
+
+def _required_columns(
+    steps: list[tuple[str, DataMorpher]], final_columns: list[str] | None = None
+) -> list[str] | None:
+    """Computes the source columns needed by the steps. See `required_columns`."""
+    needed = None if final_columns is None else set(final_columns)
+    for _, datamorpher in reversed(steps):
+        needed = datamorpher._required_columns(needed)
+
+    return None if needed is None else sorted(needed)
+
+
+def _filter_expression(
+    steps: list[tuple[str, DataMorpher]], schema: pa.Schema
+) -> pc.Expression | None:
+    """Translates the leading FilterRows steps. See `filter_expression`."""
+    expression = None
+    for _, datamorpher in steps:
+        if not isinstance(datamorpher, FilterRows):
+            break
+
+        field = _field(schema, datamorpher.first_column)
+        value = datamorpher.second_column
+        if (
+            field is None
+            or _field(schema, value) is not None
+            or not _is_comparable(field.type, value)
+        ):
+            continue
+
+        operation = getattr(operator, datamorpher.logic)
+        condition = operation(pc.field(field.name), pc.scalar(value))
+        expression = condition if expression is None else expression & condition
+
+    return expression
+
+
+def _field(schema: pa.Schema, name) -> pa.Field | None:
+    """Returns the field named `name`, or None if there is none."""
+    if not isinstance(name, str) or schema.get_field_index(name) == -1:
+        return None
+    return schema.field(name)
+
+
+def _is_comparable(arrow_type: pa.DataType, value) -> bool:
+    """Whether PyArrow can compare values of this type with the literal."""
+    if isinstance(value, bool):
+        return pa.types.is_boolean(arrow_type)
+    if isinstance(value, (int, float)):
+        return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+    if isinstance(value, str):
+        return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+    return False
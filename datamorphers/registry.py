@@ -0,0 +1,151 @@
+import functools
+import importlib
+import inspect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+import datamorphers
+from datamorphers import logger
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from datamorphers.base import DataMorpher
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "ParameterSpec",
+    "parameter_spec",
+    "register",
+    "resolve",
+]
+
+# The entry point group under which packages expose their DataMorphers
+ENTRY_POINT_GROUP = "datamorphers"
+
+# The DataMorphers registered with the `register` decorator, by name
+_registry: dict[str, type["DataMorpher"]] = {}
+
+# The entry points of the installed packages, by name, read on first lookup
+_entry_points: dict[str, "EntryPoint"] | None = None
+
+
+@dataclass(frozen=True)
+class ParameterSpec:
+    """
+    The arguments accepted by a DataMorpher.
+
+    Attributes:
+        parameters (frozenset[str]): The names of all the arguments.
+        required (tuple[str, ...]): The arguments without default values,
+            in declaration order.
+    """
+
+    parameters: frozenset[str]
+    required: tuple[str, ...]
+
+
+def register(
+    cls: type["DataMorpher"] | None = None, *, name: str | None = None
+) -> type["DataMorpher"] | Callable[[type["DataMorpher"]], type["DataMorpher"]]:
+    """
+    Registers a DataMorpher, so that pipelines can use it by name.
+
+    Args:
+        cls (type[DataMorpher]): The DataMorpher class.
+        name (str, optional): The name used in the pipeline configurations.
+            Defaults to the name of the class.
+
+    Returns:
+        type[DataMorpher]: The class, unchanged.
+
+    Raises:
+        TypeError: If the class is not a DataMorpher.
+        ValueError: If another class is already registered under this name.
+
+    Example Usage:
+        >>> @register
+        ... class Clip(DataMorpher):
+        ...     ...
+        >>> @register(name="clip_outliers")
+        ... class ClipOutliers(DataMorpher):
+        ...     ...
+    """
+    if cls is None:
+        return functools.partial(register, name=name)
+
+    from datamorphers.base import DataMorpher
+
+    if not (isinstance(cls, type) and issubclass(cls, DataMorpher)):
+        raise TypeError(f"{cls!r} is not a DataMorpher.")
+
+    name = name or cls.__name__
+    if _registry.get(name, cls) is not cls:
+        raise ValueError(
+            f"DataMorpher '{name}' is already registered as {_registry[name]!r}."
+        )
+    _registry[name] = cls
+    return cls
+
+
+def resolve(name: str) -> type["DataMorpher"] | None:
+    """
+    Returns the DataMorpher named `name`, or None if there is none.
+
+    The DataMorpher is looked up in the `custom_datamorphers` module first,
+    then among the registered DataMorphers, then among the entry points of
+    the installed packages, and finally among the built-in DataMorphers.
+    Private names, starting with an underscore, are never looked up in the
+    modules, as they are helpers and base classes rather than steps.
+    """
+    if name.startswith("_"):
+        return _registry.get(name)
+
+    cls = getattr(datamorphers.custom_datamorphers, name, None) or _registry.get(name)
+    if cls is not None:
+        return cls
+
+    entry_point = _get_entry_points().get(name)
+    if entry_point is not None:
+        return register(entry_point.load(), name=name)
+
+    # Looked up on the module every time, so that it can be patched
+    builtins = importlib.import_module("datamorphers.datamorphers")
+    return getattr(builtins, name, None)
+
+
+@functools.lru_cache(maxsize=None)
+def parameter_spec(cls: type["DataMorpher"]) -> ParameterSpec:
+    """Returns the arguments accepted by a DataMorpher, computed once per class."""
+    signature = inspect.signature(cls.__init__)
+    parameters = [
+        (param, details)
+        for param, details in signature.parameters.items()
+        if param != "self"
+    ]
+    return ParameterSpec(
+        parameters=frozenset(param for param, _ in parameters),
+        required=tuple(
+            param
+            for param, details in parameters
+            if details.default == inspect.Parameter.empty
+        ),
+    )
+
+
+def _get_entry_points() -> dict[str, "EntryPoint"]:
+    """Reads the entry points of the installed packages, once."""
+    global _entry_points
+    if _entry_points is None:
+        from importlib.metadata import entry_points
+
+        _entry_points = {}
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name in _entry_points:
+                logger.warning(
+                    f"DataMorpher '{entry_point.name}' is defined by several "
+                    f"packages. Ignoring {entry_point.value}."
+                )
+                continue
+            _entry_points[entry_point.name] = entry_point
+    return _entry_points
@@ -0,0 +1,63 @@
+from typing import Mapping
+
+import narwhals as nw
+
+from datamorphers import logger
+from datamorphers.base import DataMorpherError
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import compile_pipeline
+
+__all__ = ["dry_run"]
+
+
+def dry_run(
+    config: dict | Pipeline, schema: Mapping[str, nw.dtypes.DType]
+) -> nw.Schema | None:
+    """
+    Propagates a schema through every step of the pipeline, without any data.
+
+    Each DataMorpher checks that the columns it reads exist and have a
+    suitable type (e.g. ToLower needs a string column, CastColumnTypes refuses
+    to cast between numeric and temporal types), and returns the schema of
+    its output. Configuration errors are thus found before loading any data.
+
+    Args:
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+        schema (Mapping[str, nw.dtypes.DType]): The input column names and
+            their Narwhals types, e.g. `nw.from_native(df).collect_schema()`.
+
+    Returns:
+        nw.Schema | None: The schema of the output of the pipeline, or None if
+            a step cannot tell its output schema (e.g. custom DataMorphers not
+            implementing `_transform_schema`). Steps after it are not checked.
+
+    Raises:
+        DataMorpherError: If a step cannot be applied to its input schema.
+
+    Example Usage:
+        >>> schema = {"item": nw.String(), "price": nw.Float64()}
+        >>> dry_run(config, schema)
+        Schema([('item', String), ('price', Float64), ...])
+    """
+    pipeline = config if isinstance(config, Pipeline) else compile_pipeline(config)
+
+    schema = nw.Schema(schema)
+    for i, (cls, datamorpher) in enumerate(pipeline.steps, start=1):
+        try:
+            output_schema = datamorpher._transform_schema(schema)
+        except DataMorpherError as e:
+            raise DataMorpherError(
+                f"Dry run of pipeline '{pipeline.name}' failed at step {i} "
+                f"({cls}): {e.message}"
+            ) from e
+
+        if output_schema is None:
+            logger.warning(
+                f"The output schema of step {i} ({cls}) is unknown. "
+                "The following steps were not checked."
+            )
+            return None
+        schema = output_schema
+
+    return schema
@@ -0,0 +1,74 @@
+import math
+
+import narwhals as nw
+from narwhals.typing import IntoSeries
+
+__all__ = ["RunningMoments"]
+
+
+class RunningMoments:
+    """
+    Mergeable count, mean and sum of squared deviations (M2) of a column.
+
+    The moments of separate chunks (or of separate workers) can be combined
+    with `merge`, giving the same mean and variance as a single pass over
+    the whole column (Chan et al. parallel variant of Welford's algorithm).
+    Null values are ignored.
+
+    Attributes:
+        count (int): The number of non-null values.
+        mean (float): The mean of the values.
+        m2 (float): The sum of squared deviations from the mean.
+
+    Example Usage:
+        >>> moments = RunningMoments()
+        >>> for df in chunks:
+        ...     moments.update(df["A"])
+        >>> moments.mean, moments.std()
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_series(cls, series: IntoSeries) -> "RunningMoments":
+        """Computes the moments of a single Series."""
+        s = nw.from_native(series, series_only=True).drop_nulls()
+        count = len(s)
+        if count == 0:
+            return cls()
+        mean = s.mean()
+        m2 = ((s - mean) ** 2).sum()
+        return cls(count=count, mean=float(mean), m2=float(m2))
+
+    def update(self, series: IntoSeries) -> "RunningMoments":
+        """Adds the values of a Series to the moments, in place."""
+        other = self.from_series(series)
+        merged = self.merge(other)
+        self.count, self.mean, self.m2 = merged.count, merged.mean, merged.m2
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """Returns the moments of the union of both sets of values."""
+        count = self.count + other.count
+        if count == 0:
+            return RunningMoments()
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        return RunningMoments(count=count, mean=mean, m2=m2)
+
+    def var(self, ddof: int = 1) -> float:
+        """Returns the variance, or NaN if there are not enough values."""
+        if self.count - ddof <= 0:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Returns the standard deviation, or NaN if there are not enough values."""
+        return math.sqrt(self.var(ddof=ddof))
+
+    def __repr__(self) -> str:
+        return f"RunningMoments(count={self.count}, mean={self.mean}, m2={self.m2})"
@@ -1,8 +1,64 @@
-from typing import Any
+import atexit
+import importlib
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Iterator
+from urllib.parse import quote, unquote
+
+import narwhals as nw
 
 from datamorphers import logger
+from datamorphers.cache import (
+    _from_table,
+    _native_namespace,
+    _read_ipc,
+    _to_table,
+    _write_ipc,
+)
+
+__all__ = ["SHARED_DIR_ENV", "dms"]
+
+# The environment variable holding the directory of the shared DataFrames,
+# inherited by child processes.
+SHARED_DIR_ENV = "DATAMORPHERS_SHARED_DIR"
+
+# The schema metadata holding the backend of a shared DataFrame
+_BACKEND_METADATA = b"datamorphers.backend"
+
+# The layers of the storage scopes opened in the current context, innermost last
+_scopes: ContextVar[tuple[dict[str, Any], ...]] = ContextVar(
+    "datamorphers_storage_scopes", default=()
+)
+
+
+@dataclass
+class _SpilledFrame:
+    """Placeholder of a DataFrame spilled to an Arrow IPC file."""
+
+    path: str
+    backend: ModuleType
+
+
+@dataclass
+class _SharedFrame:
+    """
+    Placeholder of a DataFrame shared between processes through a memory-mapped
+    Arrow IPC file. `owner` is the id of the process that wrote the file, or
+    None if it was written by another process. Forked processes inherit the
+    placeholder, but only the owner deletes the file.
+    """
 
-__all__ = ["dms"]
+    path: str
+    owner: int | None
+    value: Any = None
 
 
 class DataMorphersStorage:
@@ -14,9 +70,29 @@ class DataMorphersStorage:
     It ensures that only a single instance of `DataMorphersStorage`
     exists throughout the application.
 
+    By default, the storage is unbounded. With a memory budget, the
+    estimated size of the stored DataFrames is accounted, and the least
+    recently used ones are spilled to Arrow IPC files when the budget is
+    exceeded. Spilled DataFrames are reloaded transparently by `get`.
+    Other objects are always kept in memory.
+
+    DataFrames stored with `shared=True` are written once to an Arrow IPC
+    file, in the directory set by the DATAMORPHERS_SHARED_DIR environment
+    variable. Every process inheriting it, such as the workers of a process
+    pool, can then `get` a memory-mapped view of the DataFrame: the data is
+    shared through the page cache instead of being copied in each process.
+
+    The storage is thread-safe. Concurrent pipeline runs can each open a
+    `scope`, so that the keys they set do not clobber each other, while
+    still reading the global keys.
+
     Attributes:
         logger_msg (str): A prefix message used in log outputs.
-        cache (dict): A dictionary that stores key-value pairs.
+        cache (OrderedDict): A dictionary that stores key-value pairs, from
+            the least to the most recently used.
+        memory_budget (int | None): The maximum estimated size, in bytes, of
+            the DataFrames kept in memory. None means unbounded.
+        spill_dir (str | None): The directory of the spilled DataFrames.
 
     Methods:
         clear() -> None:
@@ -32,9 +108,22 @@ class DataMorphersStorage:
         list_keys() -> list:
             Returns a list of all keys currently stored in the cache.
 
-        set(key: str, value: Any) -> None:
+        memory_usage() -> int:
+            Returns the estimated size of the DataFrames kept in memory.
+
+        scope(values: dict | None) -> ContextManager:
+            Opens a storage layer local to the current thread or asyncio task.
+
+        set(key: str, value: Any, shared: bool = False) -> None:
             Stores a value in the cache under the specified key. If the key already
-            exists, it overwrites the value and logs a warning.
+            exists, it overwrites the value and logs a warning. If `shared` is
+            True, the DataFrame is made available to other processes.
+
+        set_shared_dir(shared_dir: str) -> None:
+            Sets the directory of the DataFrames shared between processes.
+
+        set_memory_budget(memory_budget: int | None, spill_dir: str | None) -> None:
+            Bounds the memory used by the stored DataFrames.
 
     Example Usage:
         >>> from datamorphers.storage import dms
@@ -48,6 +137,8 @@ class DataMorphersStorage:
         >>> dms.clear()
         >>> dms.list_keys()
         []
+        >>> dms.set_memory_budget(2 * 2**30)
+        >>> dms.set("lookup", df_lookup, shared=True)
     """
 
     _instance = None
@@ -60,39 +151,279 @@ class DataMorphersStorage:
     def __init__(self):
         if not hasattr(self, "cache"):
             self.logger_msg = "DataMorphers Storage -"
-            self.cache = {}
+            self.cache = OrderedDict()
+            self.memory_budget = None
+            self.spill_dir = None
+            # Estimated sizes of the DataFrames kept in memory
+            self._sizes: dict[str, int] = {}
+            # Guards the global storage against concurrent threads
+            self._lock = threading.RLock()
 
     def clear(self) -> None:
-        self.cache.clear()
+        scopes = _scopes.get()
+        if scopes:
+            # Layers are never mutated, as contexts copied from this one (e.g.
+            # asyncio tasks) share them
+            _scopes.set(scopes[:-1] + ({},))
+            logger.info(f"{self.logger_msg} Scope cleared.")
+            return
+        with self._lock:
+            for key in list(self.cache):
+                self._discard(key)
         logger.info(f"{self.logger_msg} Storage cleared.")
 
     def get(self, key: str) -> Any:
-        if key not in self.cache:
-            available_keys = self.list_keys()
-            raise KeyError(
-                f"{self.logger_msg} Key '{key}' not found in DataMorphersStorage. "
-                f"Available keys are: {available_keys}"
-            )
-        return self.cache[key]
+        for layer in reversed(_scopes.get()):
+            if key in layer:
+                return layer[key]
+
+        with self._lock:
+            if key not in self.cache and self._shared_path(key) is not None:
+                # Shared by another process
+                self.cache[key] = _SharedFrame(self._shared_path(key), owner=None)
+            if key not in self.cache:
+                available_keys = self.list_keys()
+                raise KeyError(
+                    f"{self.logger_msg} Key '{key}' not found in DataMorphersStorage. "
+                    f"Available keys are: {available_keys}"
+                )
+            value = self.cache[key]
+            if isinstance(value, _SpilledFrame):
+                logger.info(f"{self.logger_msg} Reloading key '{key}' from disk.")
+                table = _read_ipc(value.path)
+                os.remove(value.path)
+                value = _from_table(table, value.backend)
+                self.cache[key] = value
+                self._sizes[key] = _estimated_size(value)
+            elif isinstance(value, _SharedFrame):
+                if value.value is None:
+                    value.value = _read_shared(value.path)
+                value = value.value
+            self.cache.move_to_end(key)
+            # Spilling the DataFrame just reloaded would write it at every get
+            self._spill(keep=key)
+            return value
 
     def isin(self, key: str) -> bool:
-        return key in self.cache
+        if any(key in layer for layer in _scopes.get()):
+            return True
+        with self._lock:
+            return key in self.cache or self._shared_path(key) is not None
+
+    def is_shared(self, key: str) -> bool:
+        if any(key in layer for layer in _scopes.get()):
+            return False
+        with self._lock:
+            return isinstance(self.cache.get(key), _SharedFrame) or (
+                key not in self.cache and self._shared_path(key) is not None
+            )
 
     def list_keys(self) -> list[str]:
-        return [key for key in self.cache]
+        with self._lock:
+            keys = [key for key in self.cache]
+        shared_dir = os.environ.get(SHARED_DIR_ENV)
+        if shared_dir and os.path.isdir(shared_dir):
+            for name in sorted(os.listdir(shared_dir)):
+                key = unquote(name.removesuffix(".arrow"))
+                if name.endswith(".arrow") and key not in keys:
+                    keys.append(key)
+        for layer in _scopes.get():
+            keys.extend(key for key in layer if key not in keys)
+        return keys
 
-    def set(self, key: str, value: Any) -> None:
+    def memory_usage(self) -> int:
+        with self._lock:
+            return sum(self._sizes.values())
+
+    @contextmanager
+    def scope(
+        self, values: dict[str, Any] | None = None
+    ) -> Iterator["DataMorphersStorage"]:
+        """
+        Opens a storage scope, local to the current thread or asyncio task.
+
+        Inside the scope, `set` and `clear` only affect a new layer, which is
+        discarded when the scope is closed. `get` looks up this layer first,
+        then the enclosing scopes, and finally the global storage, without
+        copying it. Concurrent pipeline runs, each in their own scope, can
+        thus use the same keys without clobbering each other.
+        Asyncio tasks started inside the scope see its content, but their
+        writes stay local to each task.
+
+        Args:
+            values (dict, optional): The initial content of the scope.
+
+        Example Usage:
+            >>> with dms.scope({"df_to_join": df_lookup}):
+            ...     df = run_pipeline(df, config)
+        """
+        token = _scopes.set(_scopes.get() + (dict(values or {}),))
+        try:
+            yield self
+        finally:
+            _scopes.reset(token)
+
+    def set(self, key: str, value: Any, shared: bool = False) -> None:
         if type(key) is not str:
             raise TypeError(
                 f"{self.logger_msg} Expected a string, but got {type(key)} instead."
             )
-        if key in self.cache:
-            logger.warning(
-                f"{self.logger_msg} Attention! Key '{key}' is already present "
-                "in DataMorphersStorage. The item will be overwritten."
+        scopes = _scopes.get()
+        if scopes:
+            if shared:
+                raise ValueError(
+                    f"{self.logger_msg} Shared DataFrames cannot be set in a scope."
+                )
+            if key in scopes[-1]:
+                logger.warning(
+                    f"{self.logger_msg} Attention! Key '{key}' is already present "
+                    "in the current scope. The item will be overwritten."
+                )
+            logger.info(f"{self.logger_msg} Setting an object with key: {key}.")
+            _scopes.set(scopes[:-1] + ({**scopes[-1], key: value},))
+            return
+
+        with self._lock:
+            if key in self.cache:
+                logger.warning(
+                    f"{self.logger_msg} Attention! Key '{key}' is already present "
+                    "in DataMorphersStorage. The item will be overwritten."
+                )
+                self._discard(key)
+            logger.info(f"{self.logger_msg} Setting an object with key: {key}.")
+            if shared:
+                self.cache[key] = self._share(key, value)
+                return
+            self.cache[key] = value
+            size = _estimated_size(value)
+            if size is not None:
+                self._sizes[key] = size
+            self._spill()
+
+    def set_memory_budget(
+        self, memory_budget: int | None, spill_dir: str | None = None
+    ) -> None:
+        """
+        Bounds the estimated size of the DataFrames kept in memory.
+
+        Args:
+            memory_budget (int | None): The budget, in bytes. None removes it.
+            spill_dir (str, optional): The directory where DataFrames are
+                spilled. Defaults to a new temporary directory.
+        """
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+        with self._lock:
+            self.memory_budget = memory_budget
+            self.spill_dir = spill_dir
+            self._spill()
+
+    def set_shared_dir(self, shared_dir: str) -> None:
+        """
+        Sets the directory of the DataFrames shared between processes, through
+        the DATAMORPHERS_SHARED_DIR environment variable. Only the processes
+        started afterwards inherit it.
+        """
+        os.makedirs(shared_dir, exist_ok=True)
+        os.environ[SHARED_DIR_ENV] = shared_dir
+
+    def _share(self, key: str, value: Any) -> _SharedFrame:
+        """Writes a DataFrame to the shared directory."""
+        if _estimated_size(value) is None:
+            raise TypeError(
+                f"{self.logger_msg} Only DataFrames can be shared, "
+                f"but got {type(value)} instead."
             )
-        logger.info(f"{self.logger_msg} Setting an object with key: {key}.")
-        self.cache[key] = value
+        if not os.environ.get(SHARED_DIR_ENV):
+            shared_dir = tempfile.mkdtemp(prefix="datamorphers_shared_")
+            self.set_shared_dir(shared_dir)
+            # The temporary directory is removed when this process exits
+            atexit.register(_remove_shared_dir, shared_dir, os.getpid())
+
+        table = _to_table(value)
+        backend = _native_namespace(value).__name__
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), _BACKEND_METADATA: backend.encode()}
+        )
+        path = os.path.join(os.environ[SHARED_DIR_ENV], f"{quote(key, safe='')}.arrow")
+        _write_ipc(table, path)
+        return _SharedFrame(path, owner=os.getpid())
+
+    def _shared_path(self, key: str) -> str | None:
+        """Returns the path of a DataFrame shared under `key`, if it exists."""
+        shared_dir = os.environ.get(SHARED_DIR_ENV)
+        if not shared_dir:
+            return None
+        path = os.path.join(shared_dir, f"{quote(key, safe='')}.arrow")
+        return path if os.path.exists(path) else None
+
+    def _spill(self, keep: str | None = None) -> None:
+        """
+        Spills the least recently used DataFrames until the budget is met,
+        except the one stored under `keep`.
+        """
+        if self.memory_budget is None:
+            return
+        import pyarrow as pa
+
+        usage = self.memory_usage()
+        for key in [key for key in self.cache if key in self._sizes and key != keep]:
+            if usage <= self.memory_budget:
+                break
+            value = self.cache[key]
+            if self.spill_dir is None:
+                self.spill_dir = tempfile.mkdtemp(prefix="datamorphers_")
+            path = os.path.join(self.spill_dir, f"{uuid.uuid4().hex}.arrow")
+            try:
+                _write_ipc(_to_table(value), path)
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.warning(
+                    f"{self.logger_msg} Key '{key}' cannot be spilled to disk "
+                    f"and is kept in memory: {e}"
+                )
+                continue
+            usage -= self._sizes.pop(key)
+            self.cache[key] = _SpilledFrame(path, _native_namespace(value))
+            logger.info(f"{self.logger_msg} Spilled key '{key}' to {path}.")
+
+    def _discard(self, key: str) -> None:
+        """Removes a key, and its spill file if any."""
+        value = self.cache.pop(key)
+        self._sizes.pop(key, None)
+        if isinstance(value, _SpilledFrame) or (
+            isinstance(value, _SharedFrame) and value.owner == os.getpid()
+        ):
+            os.remove(value.path)
+
+
+def _estimated_size(value: Any) -> int | None:
+    """Returns the estimated size of a DataFrame, or None for other objects."""
+    try:
+        frame = nw.from_native(value, eager_only=True)
+    except TypeError:
+        return None
+    return int(frame.estimated_size(unit="b"))
+
+
+def _read_shared(path: str) -> Any:
+    """Reads a shared DataFrame, as a view of the memory-mapped file if possible."""
+    table = _read_ipc(path)
+    metadata = dict(table.schema.metadata or {})
+    if _BACKEND_METADATA not in metadata:
+        raise ValueError(
+            f"'{path}' was not written by DataMorphersStorage and cannot be read "
+            "as a shared DataFrame."
+        )
+    backend = importlib.import_module(metadata.pop(_BACKEND_METADATA).decode())
+    return _from_table(table.replace_schema_metadata(metadata), backend, zero_copy=True)
+
+
+def _remove_shared_dir(shared_dir: str, owner: int) -> None:
+    """Removes a temporary shared directory, in the process that created it."""
+    if os.getpid() == owner:
+        shutil.rmtree(shared_dir, ignore_errors=True)
+        if os.environ.get(SHARED_DIR_ENV) == shared_dir:
+            del os.environ[SHARED_DIR_ENV]
 
 
 dms = DataMorphersStorage()
@@ -0,0 +1,205 @@
+from typing import Callable, Iterable, Iterator
+
+from narwhals.dependencies import get_pyarrow
+from narwhals.typing import IntoFrame
+
+from datamorphers import logger
+from datamorphers.base import DataMorpher
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import compile_pipeline, log_pipeline_config
+from datamorphers.stats import RunningMoments
+
+__all__ = ["global_steps", "run_pipeline_stream"]
+
+Chunks = Iterable[IntoFrame] | Callable[[], Iterable[IntoFrame]]
+
+
+def run_pipeline_stream(
+    chunks: Chunks | None, config: dict | Pipeline
+) -> Iterator[IntoFrame]:
+    """
+    Runs the pipeline on an iterable of DataFrame chunks, yielding each
+    transformed chunk as soon as it is ready.
+
+    Only one chunk is held in memory at a time, so that files larger than
+    memory can be processed, e.g. with `pd.read_csv(..., chunksize=...)` or
+    `pyarrow.parquet.ParquetFile.iter_batches()`. PyArrow RecordBatches are
+    converted to Tables before being transformed.
+
+    Steps that need statistics of the whole dataset (NormalizeColumn) are run
+    in two passes: the statistics are first accumulated over all chunks, then
+    applied to each chunk. This requires `chunks` to be iterable more than
+    once, e.g. a list or a function returning a fresh iterator, and happens
+    before this function returns.
+
+    Steps whose output depends on the previous rows (Rolling) carry their
+    state from one chunk to the next, so that the chunks must be given in
+    order. Other steps that need the whole dataset (e.g. DropDuplicates)
+    would silently produce per-chunk results, so pipelines containing them
+    are refused.
+
+    A pipeline starting with a step reading a file (e.g. ReadParquet) can be
+    run without chunks: the file is then read in chunks of `batch_size` rows,
+    with the columns and filters pushed down. A pipeline ending with a step
+    writing a file (e.g. WriteParquet) appends each chunk to the file as soon
+    as it is transformed. The file is complete once the iterator is exhausted.
+
+    Args:
+        chunks (Iterable[nw.IntoFrame] | Callable[[], Iterable[nw.IntoFrame]]):
+            The input DataFrame chunks, or a function returning them. None if
+            the pipeline starts by reading a file.
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+
+    Returns:
+        Iterator[nw.IntoFrame]: The transformed chunks, in input order.
+
+    Raises:
+        ValueError: If the pipeline contains steps that cannot be run chunk by
+            chunk, or if two passes are needed over a single-use iterator.
+
+    Example Usage:
+        >>> chunks = lambda: pd.read_csv("data.csv", chunksize=1_000_000)
+        >>> for df in run_pipeline_stream(chunks, config):
+        ...     df.to_csv("out.csv", mode="a", header=False)
+    """
+    if isinstance(config, Pipeline):
+        pipeline = config
+    else:
+        log_pipeline_config(config)
+        pipeline = compile_pipeline(config)
+
+    if chunks is None:
+        if not pipeline.stages or not _is_reader(pipeline.stages[0][1]):
+            raise ValueError(
+                f"Pipeline '{pipeline.name}' does not start by reading a file. "
+                "Pass the chunks to transform."
+            )
+        # The first stage is the reader, with the columns and filters of the
+        # next steps pushed down
+        chunks = pipeline.stages[0][1]._iter_frames
+        pipeline = Pipeline(pipeline.name, pipeline.steps[1:], fuse=pipeline.fuse)
+
+    writer = None
+    if pipeline.steps and _is_writer(pipeline.steps[-1][1]):
+        writer = pipeline.steps[-1][1]
+        pipeline = Pipeline(pipeline.name, pipeline.steps[:-1], fuse=pipeline.fuse)
+
+    steps = _global_steps(pipeline)
+    if steps:
+        raise ValueError(
+            f"Pipeline '{pipeline.name}' cannot be run chunk by chunk, as the "
+            f"following steps need the whole dataset: {steps}"
+        )
+
+    if any(_is_two_pass(dm) and not dm.row_local for _, dm in pipeline.steps):
+        if not callable(chunks) and iter(chunks) is chunks:
+            raise ValueError(
+                f"Pipeline '{pipeline.name}' needs two passes over the chunks. "
+                "Pass a list of chunks or a function returning a fresh iterator."
+            )
+        pipeline = _fit(chunks, pipeline)
+
+    stream = _stream(_iter_chunks(chunks), pipeline)
+    return stream if writer is None else writer._write_stream(stream)
+
+
+def global_steps(config: dict | Pipeline) -> list[str]:
+    """
+    Returns the steps that prevent the pipeline from being run chunk by
+    chunk, as they need the whole dataset. A step reading a file at the
+    start of the pipeline and a step writing a file at its end are allowed.
+
+    Args:
+        config (dict | Pipeline): The pipeline configuration, or an already
+            compiled Pipeline.
+
+    Returns:
+        list[str]: The names of the steps, empty if the pipeline can be run
+            with `run_pipeline_stream`.
+    """
+    pipeline = config if isinstance(config, Pipeline) else compile_pipeline(config)
+    steps = pipeline.steps
+    if steps and _is_reader(steps[0][1]):
+        steps = steps[1:]
+    if steps and _is_writer(steps[-1][1]):
+        steps = steps[:-1]
+    return _global_steps(Pipeline(pipeline.name, steps, fuse=False))
+
+
+def _global_steps(pipeline: Pipeline) -> list[str]:
+    """Returns the steps of the pipeline that need the whole dataset."""
+    return [
+        cls
+        for cls, dm in pipeline.steps
+        if not (dm.row_local or _is_two_pass(dm) or _is_stateful(dm))
+    ]
+
+
+def _is_reader(datamorpher: DataMorpher) -> bool:
+    """Whether the DataMorpher reads a file in chunks."""
+    return callable(getattr(datamorpher, "_iter_frames", None))
+
+
+def _is_writer(datamorpher: DataMorpher) -> bool:
+    """Whether the DataMorpher appends chunks to a file."""
+    return callable(getattr(datamorpher, "_write_stream", None))
+
+
+def _is_two_pass(datamorpher: DataMorpher) -> bool:
+    """Whether the statistics of the DataMorpher can be accumulated over chunks."""
+    return callable(getattr(datamorpher, "_partial_fit", None))
+
+
+def _is_stateful(datamorpher: DataMorpher) -> bool:
+    """Whether the DataMorpher can carry its state from one chunk to the next."""
+    return callable(getattr(datamorpher, "_stateful", None))
+
+
+def _with_fresh_state(pipeline: Pipeline, stop: int | None = None) -> Pipeline:
+    """
+    Returns a pipeline with the steps up to `stop`, where the stateful
+    DataMorphers are replaced by copies with an empty state.
+    """
+    steps = [
+        (cls, dm._stateful() if _is_stateful(dm) else dm)
+        for cls, dm in pipeline.steps[:stop]
+    ]
+    return Pipeline(pipeline.name, steps, fuse=pipeline.fuse)
+
+
+def _iter_chunks(chunks: Chunks) -> Iterator[IntoFrame]:
+    """Iterates over the chunks, converting PyArrow RecordBatches to Tables."""
+    for chunk in chunks() if callable(chunks) else chunks:
+        pa = get_pyarrow()
+        if pa is not None and isinstance(chunk, pa.RecordBatch):
+            chunk = pa.Table.from_batches([chunk])
+        yield chunk
+
+
+def _fit(chunks: Chunks, pipeline: Pipeline) -> Pipeline:
+    """
+    Accumulates the statistics of every two-pass step, one pass over the
+    chunks per step, and returns a pipeline where these steps are row-local.
+    """
+    steps = list(pipeline.steps)
+    for i, (cls, datamorpher) in enumerate(steps):
+        if datamorpher.row_local or not _is_two_pass(datamorpher):
+            continue
+
+        logger.debug(f"Computing the statistics of {cls} over all the chunks.")
+        prefix = _with_fresh_state(Pipeline(pipeline.name, steps), stop=i)
+        moments = RunningMoments()
+        for chunk in _iter_chunks(chunks):
+            datamorpher._partial_fit(prefix(chunk), moments)
+        steps[i] = (cls, datamorpher._fitted(moments))
+
+    return Pipeline(pipeline.name, steps, fuse=pipeline.fuse)
+
+
+def _stream(chunks: Iterator[IntoFrame], pipeline: Pipeline) -> Iterator[IntoFrame]:
+    """Applies the pipeline to each chunk."""
+    pipeline = _with_fresh_state(pipeline)
+    for i, chunk in enumerate(chunks):
+        logger.debug(f"Processing chunk {i} of pipeline '{pipeline.name}'.")
+        yield pipeline(chunk)
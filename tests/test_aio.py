@@ -0,0 +1,119 @@
+# pytest -s -v --disable-pytest-warnings
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from narwhals.exceptions import ColumnNotFoundError
+from pydantic import BaseModel
+
+from datamorphers.aio import arun_pipeline, arun_pipelines
+from datamorphers.base import DataMorpher
+from datamorphers.pipeline import Pipeline
+from datamorphers.pipeline_loader import (
+    compile_pipeline,
+    get_pipeline_config,
+    run_pipeline,
+)
+from datamorphers.storage import dms
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+
+class _CountInFlight(DataMorpher):
+    """Records the maximum number of concurrent runs."""
+
+    class PyDanticValidator(BaseModel):
+        pass
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def _datamorph(self, df):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.in_flight -= 1
+        return df
+
+
+def test_arun_pipeline():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df = asyncio.run(arun_pipeline(generate_mock_df(), config))
+
+    assert df.equals(run_pipeline(generate_mock_df(), config))
+
+
+def test_arun_pipeline_scope():
+    config = {
+        "pipeline_name": "pipeline_join",
+        "pipeline_join": [
+            {
+                "MergeDataFrames": {
+                    "df_to_join": "scoped_lookup",
+                    "join_cols": ["item"],
+                    "how": "inner",
+                    "suffixes": ["", "_r"],
+                }
+            }
+        ],
+    }
+    lookup = generate_mock_df()[["item"]].iloc[:2]
+
+    async def run():
+        # The scope of the task is visible to the thread running the pipeline
+        with dms.scope({"scoped_lookup": lookup}):
+            return await arun_pipeline(generate_mock_df(), config)
+
+    assert asyncio.run(run())["item"].tolist() == ["apple", "TV"]
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_arun_pipelines(executor_cls):
+    pipeline = compile_pipeline(
+        get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    )
+    frames = [generate_mock_df().iloc[i:] for i in range(5)]
+
+    with executor_cls(max_workers=2) as executor:
+        results = asyncio.run(
+            arun_pipelines(((df, pipeline) for df in frames), executor=executor)
+        )
+
+    assert len(results) == len(frames)
+    for df, result in zip(frames, results):
+        assert result.equals(pipeline(df))
+
+
+def test_arun_pipelines_backpressure():
+    pipeline = Pipeline("pipeline_count", [("_CountInFlight", _CountInFlight())])
+    pulled = []
+
+    async def receive_frames():
+        for i in range(12):
+            pulled.append(i)
+            yield generate_mock_df(), pipeline
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = asyncio.run(
+            arun_pipelines(receive_frames(), executor=executor, max_concurrency=3)
+        )
+
+    assert len(results) == len(pulled) == 12
+    assert _CountInFlight.max_in_flight <= 3
+
+
+def test_arun_pipelines_error():
+    pipeline = compile_pipeline(
+        get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    )
+    jobs = [(generate_mock_df(), pipeline), (generate_mock_df()[["item"]], pipeline)]
+
+    with pytest.raises(ColumnNotFoundError):
+        asyncio.run(arun_pipelines(jobs))
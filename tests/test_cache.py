@@ -0,0 +1,86 @@
+# pytest -s -v --disable-pytest-warnings
+
+import copy
+
+import pytest
+
+from datamorphers.cache import StepCache, fingerprint
+from datamorphers.datamorphers import MergeDataFrames
+from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from datamorphers.storage import dms
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+
+def test_step_cache(tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    cache = StepCache(str(tmp_path))
+
+    expected = run_pipeline(generate_mock_df(), config)
+    df = run_pipeline(generate_mock_df(), config, cache=cache)
+    assert df.equals(expected)
+    assert cache.hits == 0
+
+    # The output of the last step is reused
+    df = run_pipeline(generate_mock_df(), config, cache=cache)
+    assert df.equals(expected)
+    assert cache.hits == 1
+    assert cache.misses == len(config["pipeline_food"])
+
+
+def test_step_cache_edited_tail(tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    cache = StepCache(str(tmp_path))
+    run_pipeline(generate_mock_df(), config, cache=cache)
+
+    edited_config = copy.deepcopy(config)
+    edited_config["pipeline_food"][-1] = {
+        "RemoveColumns": {"columns_name": ["discount_pct"]}
+    }
+    df = run_pipeline(generate_mock_df(), edited_config, cache=cache)
+
+    assert df.equals(run_pipeline(generate_mock_df(), edited_config))
+    assert cache.hits == 1
+    assert len(cache) == len(config["pipeline_food"]) + 1
+
+    # A different input does not reuse any step
+    run_pipeline(generate_mock_df().iloc[1:], edited_config, cache=cache)
+    assert cache.hits == 1
+
+
+def test_step_cache_eviction(tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    cache = StepCache(str(tmp_path), max_bytes=0)
+
+    run_pipeline(generate_mock_df(), config, cache=cache)
+
+    assert len(cache) == 0
+
+
+def test_step_cache_merge_fingerprint():
+    dms.set("df_to_join", generate_mock_df())
+    merge = MergeDataFrames(
+        df_to_join="df_to_join", join_cols=["item"], how="left", suffixes=("_1", "_2")
+    )
+    token = merge._cache_token()
+
+    dms.set("df_to_join", generate_mock_df().iloc[1:])
+    other_merge = MergeDataFrames(
+        df_to_join="df_to_join", join_cols=["item"], how="left", suffixes=("_1", "_2")
+    )
+
+    assert fingerprint(merge.df_to_join) in token
+    assert other_merge._cache_token() != token
+
+
+def test_step_cache_polars(tmp_path):
+    pl = pytest.importorskip("polars")
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    cache = StepCache(str(tmp_path))
+
+    df = pl.from_pandas(generate_mock_df())
+    expected = run_pipeline(df, config, cache=cache)
+    result = run_pipeline(df, config, cache=cache)
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.equals(expected)
+    assert cache.hits == 1
@@ -0,0 +1,118 @@
+# pytest -s -v --disable-pytest-warnings
+
+import pandas as pd
+import pytest
+
+from datamorphers.cli import main
+from datamorphers.io import read_frame, write_frame
+from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "input.parquet"
+    write_frame(generate_mock_df(), str(path))
+    return path
+
+
+def expected_output(pipeline_name: str) -> pd.DataFrame:
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name=pipeline_name)
+    return run_pipeline(generate_mock_df(), config).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("extra_args", [[], ["--chunk-size", "2"], ["--workers", "2"]])
+def test_run(input_path, tmp_path, capsys, extra_args: list[str]):
+    output_path = tmp_path / "output" / "output.arrow"
+
+    status = main(
+        ["run", YAML_PATH, "--pipeline", "pipeline_food"]
+        + ["--input", str(input_path), "--output", str(output_path)]
+        + extra_args
+    )
+
+    assert status == 0
+    assert read_frame(str(output_path)).equals(expected_output("pipeline_food"))
+    out = capsys.readouterr().out
+    # Rows discarded by the leading FilterRows step are not read
+    assert "4 rows in, 4 rows out" in out
+    assert out.splitlines()[-1].startswith("Total: 1 file(s)")
+
+
+def test_run_chunk_size_ignores_workers(input_path, tmp_path, caplog):
+    output_path = tmp_path / "output.parquet"
+
+    status = main(
+        ["run", YAML_PATH, "--pipeline", "pipeline_food"]
+        + ["--input", str(input_path), "--output", str(output_path)]
+        + ["--chunk-size", "2", "--workers", "2"]
+    )
+
+    assert status == 0
+    assert "--workers is ignored when streaming a file." in caplog.text
+    assert read_frame(str(output_path)).equals(expected_output("pipeline_food"))
+
+
+def test_run_chunk_size_global_steps(input_path, tmp_path):
+    output_path = tmp_path / "output.parquet"
+
+    status = main(
+        ["run", YAML_PATH, "--pipeline", "pipeline_batched"]
+        + ["--input", str(input_path), "--output", str(output_path)]
+        + ["--chunk-size", "2"]
+    )
+
+    # The whole file is read, as DropDuplicates cannot be run chunk by chunk
+    assert status == 0
+    assert read_frame(str(output_path)).equals(expected_output("pipeline_batched"))
+
+
+def test_run_dataset(input_path, tmp_path, capsys):
+    write_frame(generate_mock_df(), str(tmp_path / "input.csv"))
+    output_dir = tmp_path / "output"
+
+    status = main(
+        ["run", YAML_PATH, "--pipeline", "pipeline_food"]
+        + ["--input", str(tmp_path / "input.*"), "--output", str(output_dir)]
+    )
+
+    assert status == 0
+    expected = expected_output("pipeline_food")
+    for name in ["input.csv", "input.parquet"]:
+        assert read_frame(str(output_dir / name)).equals(expected)
+    assert "Total: 2 file(s), 8 rows in, 8 rows out" in capsys.readouterr().out
+
+
+def test_run_with_params(tmp_path):
+    yaml_path = tmp_path / "config.yaml"
+    yaml_path.write_text(
+        "pipeline_params:\n"
+        "  - CreateColumn:\n"
+        "      column_name: ${column_name}\n"
+        "      value: ${value}\n"
+    )
+    input_path = tmp_path / "input.csv"
+    write_frame(pd.DataFrame({"A": [1, 2]}), str(input_path))
+    output_path = tmp_path / "output.csv"
+
+    status = main(
+        ["run", str(yaml_path), "--pipeline", "pipeline_params"]
+        + ["--input", str(input_path), "--output", str(output_path)]
+        + ["--param", "column_name=B", "--param", "value=x"]
+    )
+
+    assert status == 0
+    assert read_frame(str(output_path))["B"].tolist() == ["x", "x"]
+
+
+@pytest.mark.parametrize("pipeline_name", ["pipeline_missing", "pipeline_food"])
+def test_run_errors(tmp_path, capsys, pipeline_name: str):
+    status = main(
+        ["run", YAML_PATH, "--pipeline", pipeline_name]
+        + ["--input", str(tmp_path / "missing.parquet")]
+        + ["--output", str(tmp_path / "output.parquet")]
+    )
+
+    assert status == 1
+    assert capsys.readouterr().err.startswith("datamorphers: error:")
+    assert not (tmp_path / "output.parquet").exists()
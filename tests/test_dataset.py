@@ -0,0 +1,62 @@
+# pytest -s -v --disable-pytest-warnings
+
+import os
+
+import pandas as pd
+import pytest
+
+from datamorphers.dataset import run_pipeline_dataset
+from datamorphers.io import read_frame, write_frame
+from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+FILES = [
+    os.path.join("year=2024", "part-0.parquet"),
+    os.path.join("year=2024", "part-1.csv"),
+    os.path.join("year=2025", "part-0.arrow"),
+]
+
+
+@pytest.fixture
+def dataset_dir(tmp_path):
+    source = tmp_path / "source"
+    for path in FILES:
+        write_frame(generate_mock_df(), str(source / path))
+    # Files with unsupported extensions are ignored
+    (source / "README.txt").write_text("Not a DataFrame.")
+    return source
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_pipeline_dataset(dataset_dir, tmp_path, workers: int):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    output_dir = tmp_path / "output"
+
+    reports = run_pipeline_dataset(
+        str(dataset_dir), str(output_dir), config, workers=workers, max_in_flight=1
+    )
+
+    expected = run_pipeline(generate_mock_df(), config).reset_index(drop=True)
+    assert [r.input_path for r in reports] == [str(dataset_dir / p) for p in FILES]
+    for report, path in zip(reports, FILES):
+        assert report.output_path == str(output_dir / path)
+        assert (report.rows_in, report.rows_out) == (5, 4)
+        assert report.to_dict()["rows_per_second"] > 0
+        assert read_frame(report.output_path).equals(expected)
+
+
+def test_run_pipeline_dataset_glob(dataset_dir, tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    output_dir = tmp_path / "output"
+
+    reports = run_pipeline_dataset(
+        str(dataset_dir / "year=*" / "*.parquet"),
+        str(output_dir),
+        config,
+        backend="polars",
+        workers=1,
+    )
+
+    assert len(reports) == 1
+    assert os.path.isfile(output_dir / "year=2024" / "part-0.parquet")
+    assert isinstance(read_frame(reports[0].output_path), pd.DataFrame)
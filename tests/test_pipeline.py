@@ -1,9 +1,19 @@
 # pytest -s -v --disable-pytest-warnings
 
+import json
+
 import numpy as np
 import pandas as pd
+import pytest
 
-from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from datamorphers.base import DataMorpherError
+from datamorphers.pipeline_loader import (
+    compile_pipeline,
+    freeze_pipeline_config,
+    get_pipeline_config,
+    run_pipeline,
+    run_pipeline_many,
+)
 
 YAML_PATH = "tests/pipelines/test_pipeline.yaml"
 
@@ -63,3 +73,218 @@ def test_pipeline():
     )
 
     assert df.equals(res_df)
+
+
+def test_pipeline_lazy():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df_eager = run_pipeline(generate_mock_df(), config=config)
+    df_lazy = run_pipeline(generate_mock_df(), config=config, lazy=True)
+
+    assert df_lazy.equals(df_eager)
+
+
+def test_pipeline_lazy_polars():
+    pl = pytest.importorskip("polars")
+
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df_eager = run_pipeline(pl.from_pandas(generate_mock_df()), config=config)
+    df_lazy = run_pipeline(pl.from_pandas(generate_mock_df()), config=config, lazy=True)
+
+    assert isinstance(df_lazy, pl.DataFrame)
+    assert df_lazy.equals(df_eager)
+
+
+def test_compile_pipeline():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    pipeline = compile_pipeline(config)
+
+    assert len(pipeline) == 5
+
+    df_expected = run_pipeline(generate_mock_df(), config=config)
+    for _ in range(3):
+        assert pipeline(generate_mock_df()).equals(df_expected)
+
+
+def test_compile_pipeline_validates_config():
+    config = {
+        "pipeline_name": "test_pipeline",
+        "test_pipeline": [{"FillNA": {"column_name": "A"}}],
+    }
+
+    with pytest.raises(ValueError, match="Missing required arguments for FillNA"):
+        compile_pipeline(config)
+
+
+def test_compile_pipeline_trusted():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_projection"
+    )
+    # The frozen configuration survives serialization
+    frozen = json.loads(json.dumps(freeze_pipeline_config(config)))
+
+    assert frozen["pipeline_projection"][-1] == {
+        "SelectColumns": {"columns_name": ["item", "discount_amount"]}
+    }
+
+    pipeline = compile_pipeline(frozen, trusted=True)
+    df_expected = run_pipeline(generate_mock_df(), config=config)
+    assert pipeline(generate_mock_df()).equals(df_expected)
+    assert run_pipeline(generate_mock_df(), config=frozen, trusted=True).equals(
+        df_expected
+    )
+
+
+def test_compile_pipeline_trusted_refuses_unfrozen_config():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_projection"
+    )
+    frozen = freeze_pipeline_config(config)
+    frozen["pipeline_projection"][1]["FillNA"]["value"] = 1
+
+    for unfrozen in (config, frozen):
+        with pytest.raises(ValueError, match="cannot be built as trusted"):
+            compile_pipeline(unfrozen, trusted=True)
+
+
+def test_freeze_pipeline_config_validates_config():
+    config = {
+        "pipeline_name": "test_pipeline",
+        "test_pipeline": [
+            {
+                "Rolling": {
+                    "column_name": "A",
+                    "how": "median",
+                    "window_size": 2,
+                    "output_column": "B",
+                }
+            }
+        ],
+    }
+
+    with pytest.raises(DataMorpherError, match="Invalid config"):
+        freeze_pipeline_config(config)
+
+
+def test_compile_pipeline_fuses_column_steps():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+
+    pipeline = compile_pipeline(config)
+    unfused_pipeline = compile_pipeline(config, fuse=False)
+
+    assert [cls for cls, _ in pipeline.stages] == [
+        "CreateColumn+FillNA+ToUpper",
+        "ColumnsOperator+NormalizeColumn",
+        "RemoveColumns",
+        "ToLower",
+    ]
+    assert len(unfused_pipeline.stages) == 7
+
+    df = pipeline(generate_mock_df())
+    assert df.equals(unfused_pipeline(generate_mock_df()))
+    assert df["item"].tolist() == ["apple", "tv", "banana", "pasta", "cake"]
+    assert df["currency"].unique().tolist() == ["eur"]
+
+
+def test_pipeline_workers():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df = pd.concat([generate_mock_df()] * 10, ignore_index=True)
+    df_parallel = run_pipeline(df.copy(), config=config, workers=3)
+
+    assert df_parallel.equals(run_pipeline(df.copy(), config=config))
+
+
+def test_pipeline_workers_refuses_global_steps():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+
+    with pytest.raises(ValueError, match="cannot be run in parallel"):
+        run_pipeline(generate_mock_df(), config=config, workers=2)
+
+
+def generate_mock_frames(n_frames: int) -> list[pd.DataFrame]:
+    frames = []
+    for i in range(n_frames):
+        df = generate_mock_df()
+        df["price"] = df["price"] * (i + 1)
+        frames.append(pd.concat([df, df.head(2)]))
+    return frames
+
+
+def test_run_pipeline_many():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_batched")
+    frames = generate_mock_frames(4)
+
+    results = run_pipeline_many([df.copy() for df in frames], config=config)
+
+    assert len(results) == 4
+    for df, result in zip(frames, results):
+        pd.testing.assert_frame_equal(result, run_pipeline(df.copy(), config=config))
+
+
+def test_run_pipeline_many_polars():
+    pl = pytest.importorskip("polars")
+    pl_testing = pytest.importorskip("polars.testing")
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+    frames = [pl.from_pandas(df) for df in generate_mock_frames(3)]
+
+    results = run_pipeline_many(frames, config=config)
+
+    for df, result in zip(frames, results):
+        pl_testing.assert_frame_equal(result, run_pipeline(df, config=config))
+
+
+def test_run_pipeline_many_falls_back_to_each_frame():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+    # The columns are not in the same order, so the DataFrames are not concatenated
+    frames = [generate_mock_df(), generate_mock_df().iloc[:, ::-1]]
+
+    results = run_pipeline_many([df.copy() for df in frames], config=config)
+
+    for df, result in zip(frames, results):
+        pd.testing.assert_frame_equal(result, run_pipeline(df.copy(), config=config))
+
+
+def test_pipeline_profile():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df, report = run_pipeline(generate_mock_df(), config=config, profile=True)
+
+    assert df.equals(run_pipeline(generate_mock_df(), config=config))
+    assert [step.name for step in report.steps] == [
+        "FilterRows",
+        "FillNA",
+        "ColumnsOperator",
+        "ColumnsOperator",
+        "RemoveColumns",
+    ]
+    assert (report.steps[0].rows_in, report.steps[0].rows_out) == (5, 4)
+    assert report.steps[-1].columns_out == 5
+    assert all(step.estimated_bytes > 0 for step in report.steps)
+    assert report.total_wall_time == pytest.approx(
+        sum(step.wall_time for step in report.steps)
+    )
+
+    report_dict = json.loads(report.to_json())
+    assert report_dict["pipeline_name"] == "pipeline_food"
+    assert len(report_dict["steps"]) == 5
+
+
+def test_pipeline_profile_lazy():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df, report = run_pipeline(
+        generate_mock_df(), config=config, lazy=True, profile=True
+    )
+
+    assert report.steps[-1].name == "collect"
+    assert report.steps[-1].rows_out == 4
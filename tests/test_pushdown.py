@@ -0,0 +1,113 @@
+# pytest -s -v --disable-pytest-warnings
+
+import pandas as pd
+
+from datamorphers.dataset import run_pipeline_dataset
+from datamorphers.io import read_frame, read_schema, write_frame
+from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from datamorphers.pushdown import filter_expression, required_columns
+from datamorphers.storage import dms
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+
+def test_required_columns():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_projection"
+    )
+
+    assert required_columns(config) == ["discount_pct", "item", "price"]
+    assert required_columns(config, final_columns=["item"]) == [
+        "discount_pct",
+        "item",
+        "price",
+    ]
+
+
+def test_required_columns_final_columns():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    # The pipeline keeps all the source columns
+    assert required_columns(config) is None
+
+    # FilterRows compares "item_type" with "food", which may be a column name
+    assert required_columns(config, final_columns=["item", "discounted_price"]) == [
+        "discount_pct",
+        "food",
+        "item",
+        "item_type",
+        "price",
+    ]
+
+
+def test_required_columns_merge_without_left_suffix():
+    dms.set("df_to_join", pd.DataFrame({"k": [1], "v": [2]}))
+    config = {
+        "pipeline_name": "pipeline_join",
+        "pipeline_join": [
+            {
+                "MergeDataFrames": {
+                    "df_to_join": "df_to_join",
+                    "join_cols": ["k"],
+                    "how": "left",
+                    "suffixes": ["", "_r"],
+                }
+            }
+        ],
+    }
+
+    assert required_columns(config, final_columns=["x", "v"]) == ["k", "v", "x"]
+
+
+def test_run_pipeline_dataset_pushdown(tmp_path):
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_projection"
+    )
+    df = generate_mock_df()
+    df["unused"] = range(len(df))
+    write_frame(df, str(tmp_path / "source" / "part-0.parquet"))
+
+    (report,) = run_pipeline_dataset(
+        str(tmp_path / "source"),
+        str(tmp_path / "output"),
+        config,
+        workers=1,
+        pushdown=True,
+    )
+
+    assert read_frame(report.output_path).equals(run_pipeline(df, config))
+
+
+def test_filter_expression(tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    path = str(tmp_path / "part-0.parquet")
+    write_frame(generate_mock_df(), path)
+
+    expression = filter_expression(config, read_schema(path))
+    assert str(expression) == '(item_type == "food")'
+
+    # "food" is a column of the file, so the comparison is not pushed down
+    df = generate_mock_df()
+    df["food"] = df["item_type"]
+    write_frame(df, path)
+    assert filter_expression(config, read_schema(path)) is None
+
+
+def test_run_pipeline_dataset_filter_pushdown(tmp_path):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    df = generate_mock_df()
+    write_frame(df.iloc[:2], str(tmp_path / "source" / "part-0.parquet"))
+    write_frame(df.iloc[2:], str(tmp_path / "source" / "part-1.csv"))
+
+    reports = run_pipeline_dataset(
+        str(tmp_path / "source"),
+        str(tmp_path / "output"),
+        config,
+        workers=1,
+        pushdown=True,
+    )
+
+    expected = run_pipeline(df, config).reset_index(drop=True)
+    # Rows that are not "food" are discarded while reading
+    assert sum(r.rows_in for r in reports) == len(expected)
+    output = pd.concat([read_frame(r.output_path) for r in reports])
+    assert output.reset_index(drop=True).equals(expected)
@@ -0,0 +1,87 @@
+from importlib.metadata import EntryPoint
+
+import narwhals as nw
+import pandas as pd
+import pytest
+from narwhals.typing import IntoFrame
+from pydantic import BaseModel
+
+import datamorphers.registry as registry
+from datamorphers import datamorphers
+from datamorphers.base import DataMorpher
+from datamorphers.pipeline_loader import run_pipeline, validate_pipeline_config
+
+
+class Clip(DataMorpher):
+    class PyDanticValidator(BaseModel):
+        column_name: str
+        upper: float
+
+    def __init__(self, *, column_name: str, upper: float = 1.0):
+        super().__init__()
+        self.config = self.PyDanticValidator(column_name=column_name, upper=upper)
+
+    @nw.narwhalify
+    def _datamorph(self, df: IntoFrame) -> IntoFrame:
+        column = nw.col(self.config.column_name)
+        return df.with_columns(column.clip(upper_bound=self.config.upper))
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    """Isolates the registry and the entry points of each test."""
+    monkeypatch.setattr(registry, "_registry", {})
+    monkeypatch.setattr(registry, "_entry_points", None)
+
+
+def test_register():
+    registry.register(Clip)
+    registry.register(name="clip_values")(Clip)
+
+    assert registry.resolve("Clip") is Clip
+    assert registry.resolve("clip_values") is Clip
+
+    config = {
+        "pipeline_name": "test_pipeline",
+        "test_pipeline": [{"clip_values": {"column_name": "A", "upper": 2}}],
+    }
+    validate_pipeline_config(config)
+    df = run_pipeline(pd.DataFrame({"A": [1, 2, 3]}), config=config)
+    assert df["A"].tolist() == [1, 2, 2]
+
+
+def test_register_refuses_conflicts():
+    registry.register(Clip)
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(name="Clip")(datamorphers.ToLower)
+    with pytest.raises(TypeError, match="is not a DataMorpher"):
+        registry.register(dict)
+
+
+def test_entry_points(monkeypatch):
+    entry_points = [
+        EntryPoint(
+            name="Lowercase",
+            value="datamorphers.datamorphers:ToLower",
+            group=registry.ENTRY_POINT_GROUP,
+        )
+    ]
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group: entry_points)
+
+    assert registry.resolve("Lowercase") is datamorphers.ToLower
+    assert registry.resolve("Unknown") is None
+
+
+def test_resolve_ignores_private_names():
+    assert registry.resolve("_FileReader") is None
+    assert registry.resolve("_FileWriter") is None
+
+
+def test_parameter_spec():
+    spec = registry.parameter_spec(Clip)
+
+    assert spec.parameters == {"column_name", "upper"}
+    assert spec.required == ("column_name",)
+    # Computed once per class
+    assert registry.parameter_spec(Clip) is spec
@@ -0,0 +1,66 @@
+# pytest -s -v --disable-pytest-warnings
+
+import narwhals as nw
+import pytest
+
+from datamorphers.base import DataMorpherError
+from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+from datamorphers.schema import dry_run
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+
+
+def _schema(df) -> nw.Schema:
+    return nw.from_native(df).collect_schema()
+
+
+@pytest.mark.parametrize(
+    "pipeline_name", ["pipeline_food", "pipeline_enrichment", "pipeline_projection"]
+)
+def test_dry_run(pipeline_name):
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name=pipeline_name)
+    df = generate_mock_df()
+
+    assert dry_run(config, _schema(df)) == _schema(run_pipeline(df, config))
+
+
+def test_dry_run_missing_column():
+    config = {
+        "pipeline_name": "pipeline_typo",
+        "pipeline_typo": [
+            {"FillNA": {"column_name": "discount_pct", "value": 0}},
+            {
+                "ColumnsOperator": {
+                    "first_column": "price",
+                    "second_column": "discount_pc",
+                    "logic": "mul",
+                    "output_column": "discount_amount",
+                }
+            },
+        ],
+    }
+
+    with pytest.raises(
+        DataMorpherError, match=r"step 2 \(ColumnsOperator\).*'discount_pc'"
+    ):
+        dry_run(config, _schema(generate_mock_df()))
+
+
+def test_dry_run_string_operation_on_numeric_column():
+    config = {
+        "pipeline_name": "pipeline_upper",
+        "pipeline_upper": [{"ToUpper": {"columns_name": "price"}}],
+    }
+
+    with pytest.raises(DataMorpherError, match="expected a string type"):
+        dry_run(config, _schema(generate_mock_df()))
+
+
+def test_dry_run_bad_cast():
+    config = {
+        "pipeline_name": "pipeline_cast",
+        "pipeline_cast": [{"CastColumnTypes": {"cast_dict": {"sold_at": "int32"}}}],
+    }
+    schema = {"item": nw.String(), "sold_at": nw.Datetime()}
+
+    with pytest.raises(DataMorpherError, match="Cannot cast column 'sold_at'"):
+        dry_run(config, schema)
@@ -5,8 +5,19 @@ import logging
 import narwhals as nw
 import numpy as np
 import pandas as pd
-
-from datamorphers.pipeline_loader import get_pipeline_config, run_pipeline
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from datamorphers.base import DataMorpherError
+from datamorphers.datamorphers import MergeDataFrames
+from datamorphers.io import read_frame, write_frame
+from datamorphers.pipeline_loader import (
+    compile_pipeline,
+    get_pipeline_config,
+    run_pipeline,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -350,6 +361,77 @@ def test_merge_dataframes():
     assert "C_2" in df.columns
 
 
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+def test_merge_dataframes_matches_pandas(how):
+    from datamorphers.storage import dms
+
+    df = generate_mock_df()
+    df_to_join = pd.DataFrame({"A": [1, 2, 4], "C": [0.1, 0.2, 0.4]})
+    dms.set("df_to_join", df_to_join)
+    morpher = MergeDataFrames(
+        df_to_join="df_to_join", join_cols=["A"], how=how, suffixes=("_1", "_2")
+    )
+
+    expected = pd.merge(df, df_to_join, on=["A"], how=how, suffixes=("_1", "_2"))
+    assert morpher._datamorph(df).equals(expected)
+
+
+def test_merge_dataframes_polars():
+    pl = pytest.importorskip("polars")
+    from datamorphers.storage import dms
+
+    dms.set("df_to_join", pl.DataFrame({"A": [1, 2], "F": ["x", "y"]}))
+    morpher = MergeDataFrames(
+        df_to_join="df_to_join", join_cols=["A"], how="left", suffixes=("_1", "_2")
+    )
+
+    df = morpher._datamorph(pl.from_pandas(generate_mock_df()))
+
+    assert isinstance(df, pl.DataFrame)
+    assert df["F"].to_list() == ["x", "y", "y", "y", None]
+
+
+def test_merge_dataframes_mixed_backends():
+    pl = pytest.importorskip("polars")
+    from datamorphers.storage import dms
+
+    # The pandas DataFrame to join has unique keys, indexed for lookups
+    dms.set("df_to_join", pd.DataFrame({"A": [1, 2, 3], "F": ["x", "y", "z"]}))
+    morpher = MergeDataFrames(
+        df_to_join="df_to_join", join_cols=["A"], how="left", suffixes=("_1", "_2")
+    )
+
+    with pytest.raises(DataMorpherError, match="Cannot join a polars DataFrame"):
+        morpher._datamorph(pl.from_pandas(generate_mock_df()))
+
+
+def test_merge_dataframes_cache_build_side():
+    from datamorphers.storage import dms
+
+    dms.set("df_to_join", pd.DataFrame({"A": [1, 2], "F": ["x", "y"]}))
+    kwargs = dict(
+        df_to_join="df_to_join",
+        join_cols=["A"],
+        how="left",
+        suffixes=("_1", "_2"),
+        cache_build_side=True,
+    )
+
+    df = MergeDataFrames(**kwargs)._datamorph(generate_mock_df())
+    build_side = dms.get("df_to_join.build_side[A]")
+
+    # A later run reuses the hash index of the keys
+    other = MergeDataFrames(**kwargs)
+    assert other._datamorph(generate_mock_df()).equals(df)
+    assert other._build_side is build_side
+
+    # It is prepared again if the DataFrame to join changes
+    dms.set("df_to_join", pd.DataFrame({"A": [1, 2], "F": ["z", "y"]}))
+    other = MergeDataFrames(**kwargs)
+    assert other._datamorph(generate_mock_df())["F"].iloc[0] == "z"
+    assert other._build_side is not build_side
+
+
 def test_normalize_column():
     """
     - NormalizeColumn:
@@ -367,6 +449,98 @@ def test_normalize_column():
     assert ((df["A"] - df["A"].mean()) / df["A"].std()).equals(df["A_norm"])
 
 
+def test_read_csv(tmp_path):
+    """
+    - ReadCSV:
+        path: ${path}
+        delimiter: ";"
+        filters: [[C, ">", 7]]
+    """
+    path = tmp_path / "df.csv"
+    generate_mock_df().to_csv(path, sep=";", index=False)
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_ReadCSV", path=path
+    )
+
+    df: pd.DataFrame = run_pipeline(None, config=config)
+
+    expected = generate_mock_df().query("C > 7").reset_index(drop=True)
+    assert df.equals(expected)
+
+
+def test_read_csv_filter_on_unread_column(tmp_path):
+    """
+    - ReadCSV:
+        path: ${path}
+        delimiter: ";"
+        columns: [A]
+        filters: [[C, ">", 7]]
+    """
+    path = tmp_path / "df.csv"
+    generate_mock_df().to_csv(path, sep=";", index=False)
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_ReadCSV_columns", path=path
+    )
+
+    df: pd.DataFrame = run_pipeline(None, config=config)
+
+    expected = generate_mock_df().query("C > 7")[["A"]].reset_index(drop=True)
+    assert df.equals(expected)
+
+
+def test_read_ipc(tmp_path):
+    """
+    - ReadIPC:
+        path: ${path}
+        columns: [D, A]
+        backend: polars
+    """
+    pl = pytest.importorskip("polars")
+    path = tmp_path / "df.arrow"
+    write_frame(generate_mock_df(), str(path))
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_ReadIPC", path=path
+    )
+
+    # The input DataFrame is replaced by the file
+    df = run_pipeline(generate_mock_df().iloc[:1], config=config)
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns == ["D", "A"]
+    assert df["A"].to_list() == [1, 2, 2, 2, 3]
+
+
+def test_read_parquet(tmp_path):
+    """
+    - ReadParquet:
+        path: ${path}
+        filters: [[[A, "==", 1]], [[A, "==", 3]]]
+    - FilterRows:
+        first_column: A
+        second_column: 2
+        logic: ge
+    - SelectColumns:
+        columns_name: [A, C]
+    """
+    path = tmp_path / "df.parquet"
+    write_frame(generate_mock_df(), str(path))
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_ReadParquet", path=path
+    )
+
+    # The columns and filters of the next steps are pushed into the reader
+    reader = compile_pipeline(config).stages[0][1]
+    columns, filters = reader._scan_options(pq.read_schema(path))
+    assert columns == ["A", "C"]
+    assert filters.equals(
+        ((pc.field("A") == 1) | (pc.field("A") == 3)) & (pc.field("A") >= 2)
+    )
+
+    df: pd.DataFrame = run_pipeline(None, config=config)
+
+    assert df.to_dict("list") == {"A": [3], "C": [9.0]}
+
+
 def test_remove_columns():
     """
     - RemoveColumns:
@@ -493,3 +667,59 @@ def test_to_upper():
 
     assert df["D"].equals(df["D"].str.upper())
     assert df["E"].equals(df["E"].str.upper())
+
+
+def _is_ipc_compressed(path, compression: str) -> bool:
+    """
+    Whether the record batches of an Arrow IPC file are compressed with the
+    codec, as PyArrow does not expose it: the body of each batch holds one
+    frame per buffer, starting with the magic number of the codec.
+    """
+    magic = {"ZSTD": b"\x28\xb5\x2f\xfd", "LZ4": b"\x04\x22\x4d\x18"}[compression]
+    with pa.memory_map(str(path)) as source:
+        # The file format is the stream format after the leading magic string
+        source.seek(8)
+        batches = [
+            message
+            for message in pa.ipc.MessageReader.open_stream(source)
+            if message.type == "record batch"
+        ]
+    return bool(batches) and all(
+        magic in message.body.to_pybytes() for message in batches
+    )
+
+
+@pytest.mark.parametrize(
+    "pipeline_name, file_name, compression",
+    [
+        ("pipeline_WriteIPC", "df.arrow", "ZSTD"),
+        ("pipeline_WriteParquet", "df.parquet", "ZSTD"),
+    ],
+)
+def test_write_file(tmp_path, pipeline_name: str, file_name: str, compression: str):
+    """
+    - WriteIPC:
+        path: ${path}
+        compression: zstd
+
+    - WriteParquet:
+        path: ${path}
+        compression: zstd
+        compression_level: 5
+    """
+    path = tmp_path / "output" / file_name
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name=pipeline_name, path=path
+    )
+
+    df = generate_mock_df()
+    # The DataFrame is returned unchanged
+    assert run_pipeline(df, config=config) is df
+
+    assert read_frame(str(path)).equals(generate_mock_df())
+    if file_name.endswith(".parquet"):
+        metadata = pq.read_metadata(path)
+        assert metadata.row_group(0).column(0).compression == compression
+    else:
+        assert _is_ipc_compressed(path, compression)
+    assert list(tmp_path.joinpath("output").iterdir()) == [path]
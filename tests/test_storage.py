@@ -1,9 +1,23 @@
+import asyncio
 import importlib
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather
 import pytest
 
 import datamorphers
+import datamorphers.cache
 import datamorphers.storage
+from datamorphers.datamorphers import MergeDataFrames
+from datamorphers.pipeline_loader import run_pipeline
 from datamorphers.storage import dms
 
 
@@ -64,3 +78,261 @@ def test_dms_is_singleton():
 
     # Check that after reloading, the value is still present in dms
     assert "A" in dms.cache
+
+
+@pytest.fixture
+def memory_budget(tmp_path):
+    dms.clear()
+    yield tmp_path
+    dms.clear()
+    dms.set_memory_budget(None)
+
+
+def test_memory_budget_spill(memory_budget):
+    df = pd.DataFrame({"A": range(1000), "B": ["x"] * 1000}, index=range(5, 1005))
+    size = nw.from_native(df).estimated_size(unit="b")
+    dms.set_memory_budget(int(1.5 * size), spill_dir=str(memory_budget))
+
+    dms.set("lookup_1", df)
+    dms.set("lookup_2", df.copy())
+    dms.set("username", "Alice")
+
+    # The least recently used DataFrame is spilled to disk
+    assert dms.memory_usage() <= 1.5 * size
+    assert len(os.listdir(memory_budget)) == 1
+    assert dms.list_keys() == ["lookup_1", "lookup_2", "username"]
+
+    # It is reloaded transparently, and the other one is spilled in turn
+    pd.testing.assert_frame_equal(dms.get("lookup_1"), df)
+    assert len(os.listdir(memory_budget)) == 1
+    pd.testing.assert_frame_equal(dms.get("lookup_2"), df)
+    assert dms.get("username") == "Alice"
+
+
+def test_memory_budget_reload(memory_budget):
+    df = pd.DataFrame({"A": range(1000)})
+    dms.set_memory_budget(0, spill_dir=str(memory_budget))
+    dms.set("lookup", df)
+
+    # The DataFrame reloaded is kept in memory, even over the budget
+    for _ in range(2):
+        pd.testing.assert_frame_equal(dms.get("lookup"), df)
+        assert os.listdir(memory_budget) == []
+        assert dms.memory_usage() > 0
+
+    # A DataFrame that cannot be spilled is still accounted
+    dms.set("objects", pd.DataFrame({"A": [1, "x"]}))
+    assert "objects" in dms._sizes
+    assert len(os.listdir(memory_budget)) == 1
+
+
+def test_memory_budget_clear(memory_budget):
+    dms.set_memory_budget(0, spill_dir=str(memory_budget))
+    dms.set("lookup", pd.DataFrame({"A": [1, 2, 3]}))
+    assert len(os.listdir(memory_budget)) == 1
+
+    dms.clear()
+
+    assert os.listdir(memory_budget) == []
+    assert len(dms.cache) == 0
+
+
+def _get_shared(key: str) -> tuple[str, int]:
+    """Reads a shared DataFrame in a worker process."""
+    df = dms.get(key)
+    return type(df).__name__, int(df["A"].sum())
+
+
+def _clear_storage() -> None:
+    """Clears the storage inherited by a forked worker process."""
+    dms.clear()
+
+
+def _set_shared(key: str, value) -> None:
+    """Shares a DataFrame from a worker process."""
+    dms.set(key, value, shared=True)
+
+
+@pytest.fixture
+def shared_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(datamorphers.storage.SHARED_DIR_ENV, str(tmp_path))
+    yield tmp_path
+    dms.clear()
+
+
+def test_shared_frame(shared_dir):
+    df = pd.DataFrame({"A": range(1000), "B": ["x"] * 1000})
+    dms.set("shared_lookup", df, shared=True)
+
+    assert len(os.listdir(shared_dir)) == 1
+    assert dms.is_shared("shared_lookup")
+    pd.testing.assert_frame_equal(dms.get("shared_lookup"), df)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        result = executor.submit(_get_shared, "shared_lookup").result()
+    assert result == ("DataFrame", sum(range(1000)))
+
+    dms.clear()
+    assert os.listdir(shared_dir) == []
+
+
+def test_shared_frame_pandas_zero_copy(shared_dir, monkeypatch):
+    tables = []
+
+    def _read_ipc(path):
+        tables.append(datamorphers.cache._read_ipc(path))
+        return tables[-1]
+
+    monkeypatch.setattr(datamorphers.storage, "_read_ipc", _read_ipc)
+    dms.set(
+        "shared_lookup",
+        pd.DataFrame({"A": range(1000), "B": ["x"] * 1000}),
+        shared=True,
+    )
+
+    df = dms.get("shared_lookup")
+
+    # The numeric column is a view of the memory-mapped file
+    buffer = tables[-1].column("A").chunk(0).buffers()[1]
+    assert np.shares_memory(df["A"].to_numpy(), np.frombuffer(buffer, dtype="int64"))
+    assert not df["A"].to_numpy().flags.writeable
+
+
+def test_shared_frame_other_process(shared_dir):
+    table = pa.table({"A": [1, 2, 3]})
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(_set_shared, "lookup_from_worker", table).result()
+
+    # The DataFrame was written by another process
+    assert "lookup_from_worker" not in dms.cache
+    assert dms.isin("lookup_from_worker")
+    assert "lookup_from_worker" in dms.list_keys()
+    assert dms.get("lookup_from_worker").equals(table)
+
+    # Files written by other processes are not removed
+    dms.clear()
+    assert len(os.listdir(shared_dir)) == 1
+
+
+def test_shared_frame_cleared_by_forked_worker(shared_dir):
+    dms.set("shared_lookup", pd.DataFrame({"A": [1, 2, 3]}), shared=True)
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        executor.submit(_clear_storage).result()
+
+    # Only the process that wrote the file removes it
+    assert len(os.listdir(shared_dir)) == 1
+    assert dms.get("shared_lookup")["A"].sum() == 6
+
+
+def test_shared_frame_foreign_file(shared_dir):
+    pa.feather.write_feather(pa.table({"A": [1]}), str(shared_dir / "other.arrow"))
+
+    assert "other" in dms.list_keys()
+    with pytest.raises(ValueError, match="not written by DataMorphersStorage"):
+        dms.get("other")
+
+
+def test_shared_frame_pickled_by_key(shared_dir):
+    df = pd.DataFrame({"item": range(10_000), "vat": 0.22})
+    dms.set("vat_lookup", df, shared=True)
+    merge = MergeDataFrames(
+        df_to_join="vat_lookup", join_cols=["item"], how="left", suffixes=("", "_r")
+    )
+
+    data = pickle.dumps(merge)
+
+    assert len(data) < df.memory_usage().sum() / 10
+    pd.testing.assert_frame_equal(pickle.loads(data).df_to_join, df)
+
+
+def test_scope():
+    dms.set("global_key", "global_value")
+    dms.set("key", "global_value")
+
+    with dms.scope({"key": "scoped_value"}):
+        dms.set("scoped_key", 1)
+        assert dms.get("key") == "scoped_value"
+        assert dms.get("global_key") == "global_value"
+        assert dms.isin("scoped_key")
+        assert {"global_key", "key", "scoped_key"} <= set(dms.list_keys())
+
+        with dms.scope():
+            dms.set("scoped_key", 2)
+            assert dms.get("scoped_key") == 2
+        assert dms.get("scoped_key") == 1
+
+    assert dms.get("key") == "global_value"
+    assert not dms.isin("scoped_key")
+
+
+def test_scope_concurrent_runs():
+    def run(n: int) -> list[int]:
+        with dms.scope():
+            dms.set("df_to_join", pd.DataFrame({"item": [n], "n": [n]}))
+            # Let the other threads set the same key
+            time.sleep(0.01)
+            return run_pipeline(
+                pd.DataFrame({"item": [n]}),
+                {
+                    "pipeline_name": "pipeline_join",
+                    "pipeline_join": [
+                        {
+                            "MergeDataFrames": {
+                                "df_to_join": "df_to_join",
+                                "join_cols": ["item"],
+                                "how": "left",
+                                "suffixes": ["", "_r"],
+                            }
+                        }
+                    ],
+                },
+            )["n"].tolist()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, range(32)))
+
+    assert results == [[n] for n in range(32)]
+
+
+def test_scope_asyncio_tasks():
+    async def run(n: int) -> int:
+        dms.set("x", n)
+        # Let the other task set the same key
+        await asyncio.sleep(0.01)
+        return dms.get("x")
+
+    async def main() -> list[int]:
+        return await asyncio.gather(run(1), run(2))
+
+    with dms.scope({"x": 0}):
+        # Each task writes to its own copy of the scope
+        assert asyncio.run(main()) == [1, 2]
+        assert dms.get("x") == 0
+
+
+def test_run_pipeline_storage():
+    df_to_join = pd.DataFrame({"item": ["apple"], "vat": [0.04]})
+    config = {
+        "pipeline_name": "pipeline_join",
+        "pipeline_join": [
+            {
+                "MergeDataFrames": {
+                    "df_to_join": "run_lookup",
+                    "join_cols": ["item"],
+                    "how": "inner",
+                    "suffixes": ["", "_r"],
+                }
+            }
+        ],
+    }
+
+    df = run_pipeline(
+        pd.DataFrame({"item": ["apple", "TV"]}),
+        config,
+        storage={"run_lookup": df_to_join},
+    )
+
+    assert df.to_dict("list") == {"item": ["apple"], "vat": [0.04]}
+    assert not dms.isin("run_lookup")
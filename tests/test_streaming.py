@@ -0,0 +1,164 @@
+# pytest -s -v --disable-pytest-warnings
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from datamorphers.io import read_frame, write_frame
+from datamorphers.pipeline_loader import (
+    compile_pipeline,
+    get_pipeline_config,
+    run_pipeline,
+)
+from datamorphers.stats import RunningMoments
+from datamorphers.streaming import global_steps, run_pipeline_stream
+from tests.test_pipeline import YAML_PATH, generate_mock_df
+from tests.test_single_datamorphers import YAML_PATH as SINGLE_DATAMORPHERS_YAML_PATH
+from tests.test_single_datamorphers import generate_mock_df as generate_single_mock_df
+
+
+def _chunks(df: pd.DataFrame, chunk_size: int):
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def test_run_pipeline_stream():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    df = generate_mock_df()
+    chunks = list(run_pipeline_stream(_chunks(df, 2), config))
+
+    assert len(chunks) == 3
+    assert pd.concat(chunks).equals(run_pipeline(generate_mock_df(), config))
+
+
+def test_run_pipeline_stream_record_batches():
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+
+    table = pa.Table.from_pandas(generate_mock_df(), preserve_index=False)
+    chunks = list(run_pipeline_stream(table.to_batches(max_chunksize=2), config))
+
+    assert all(isinstance(chunk, pa.Table) for chunk in chunks)
+    assert pa.concat_tables(chunks).column("item").to_pylist() == [
+        "apple",
+        "banana",
+        "pasta",
+        "cake",
+    ]
+
+
+def test_run_pipeline_stream_refuses_global_steps():
+    config = get_pipeline_config(
+        yaml_path=SINGLE_DATAMORPHERS_YAML_PATH,
+        pipeline_name="pipeline_DropDuplicates_all",
+    )
+
+    with pytest.raises(
+        ValueError, match=r"need the whole dataset: \['DropDuplicates'\]"
+    ):
+        run_pipeline_stream(_chunks(generate_mock_df(), 2), config)
+
+
+@pytest.mark.parametrize(
+    "pipeline_name, expected",
+    [
+        ("pipeline_food", []),
+        ("pipeline_batched", ["DropDuplicates"]),
+        ("pipeline_files", []),
+    ],
+)
+def test_global_steps(pipeline_name: str, expected: list[str]):
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH,
+        pipeline_name=pipeline_name,
+        input_path="input.parquet",
+        output_path="output.parquet",
+    )
+
+    assert global_steps(config) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_run_pipeline_stream_rolling(chunk_size: int):
+    config = get_pipeline_config(
+        yaml_path=SINGLE_DATAMORPHERS_YAML_PATH, pipeline_name="pipeline_Rolling"
+    )
+    pipeline = compile_pipeline(config)
+
+    df = generate_single_mock_df()
+    for _ in range(2):
+        # The state must not leak from one stream to the next one
+        df_out = pd.concat(run_pipeline_stream(_chunks(df, chunk_size), pipeline))
+        assert df_out.equals(pipeline(generate_single_mock_df()))
+
+
+def test_run_pipeline_stream_two_pass():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+
+    df = generate_mock_df()
+    chunks = list(_chunks(df, 2))
+    df_out = pd.concat(run_pipeline_stream(chunks, config))
+
+    expected = run_pipeline(generate_mock_df(), config)
+    assert df_out.drop(columns="price_norm").equals(expected.drop(columns="price_norm"))
+    assert np.allclose(df_out["price_norm"], expected["price_norm"])
+
+
+def test_run_pipeline_stream_two_pass_needs_reiterable_chunks():
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH, pipeline_name="pipeline_enrichment"
+    )
+
+    with pytest.raises(ValueError, match="needs two passes over the chunks"):
+        run_pipeline_stream(_chunks(generate_mock_df(), 2), config)
+
+    df = generate_mock_df()
+    chunks = list(run_pipeline_stream(lambda: _chunks(df, 2), config))
+    assert len(chunks) == 3
+
+
+def test_run_pipeline_stream_files(tmp_path):
+    input_path, output_path = tmp_path / "input.parquet", tmp_path / "output.parquet"
+    write_frame(generate_mock_df(), str(input_path))
+    config = get_pipeline_config(
+        yaml_path=YAML_PATH,
+        pipeline_name="pipeline_files",
+        input_path=input_path,
+        output_path=output_path,
+    )
+
+    # The file is read two rows at a time, without the rows that are not
+    # food, and each chunk is written once transformed
+    chunks = run_pipeline_stream(None, config)
+    assert len(next(chunks)) == 1
+    assert not output_path.exists()
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    expected = run_pipeline(None, config)
+    df_out = read_frame(str(output_path))
+    assert df_out["item"].equals(expected["item"])
+    assert np.allclose(df_out["price_norm"], expected["price_norm"])
+
+    config = get_pipeline_config(yaml_path=YAML_PATH, pipeline_name="pipeline_food")
+    with pytest.raises(ValueError, match="does not start by reading a file"):
+        run_pipeline_stream(None, config)
+
+
+def test_running_moments_merge():
+    values = pd.Series([1.0, 2.5, np.nan, 4.0, 10.0, -3.0, 7.25])
+
+    moments = RunningMoments()
+    for start in range(0, len(values), 3):
+        moments.update(values.iloc[start : start + 3])
+
+    merged = RunningMoments.from_series(values.iloc[:4]).merge(
+        RunningMoments.from_series(values.iloc[4:])
+    )
+
+    for m in (moments, merged):
+        assert m.count == 6
+        assert m.mean == pytest.approx(values.mean())
+        assert m.std() == pytest.approx(values.std())